@@ -1,132 +1,247 @@
 
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_file, send_from_directory, Response
 import os
 import threading
-import pandas as pd
-from scraper import run_scraper
+from run_journal import find_resumable_run, load_journal
+from progress_events import ProgressBroadcaster
+from results_catalog import get_catalog
+from job_manager import JobManager, new_progress, TERMINAL_STATUSES
+from work_queue import WorkQueue, QUEUE_PATH
+import metrics as run_metrics
+from scraper_logging import setup_logging
 
 app = Flask(__name__)
 
 
-# Global variable to store the latest generated file and progress
-LATEST_FILE = None
-IS_SCRAPING = False
-SCRAPING_LOCK = threading.Lock()
-SCRAPER_PROGRESS = {
-    "total": 0,
-    "processed": 0,
-    "current_area": "",
-    "log": [],
-    "status": "Idle"
-}
+# Dashboard events for every job; the job manager is created on first use
+PROGRESS_EVENTS = ProgressBroadcaster()
+_JOBS = None
+_JOBS_LOCK = threading.Lock()
+
+def run_job(job, progress_callback, cancel_token):
+    # selenium & co. load with the first job, not with the app (see benchmark/startup_benchmark.py)
+    from scraper import run_scraper
+    params = job["params"]
+    resume_run_id = params.get("resume_run_id")
+    # A job interrupted by a restart continues from its own journal
+    if job["resume"] and load_journal(job["id"]):
+        resume_run_id = job["id"]
+    return run_scraper(
+        areas=params["areas"],
+        city=params["city"],
+        category=params["category"],
+        custom_query=params["custom_query"],
+        progress_callback=progress_callback,
+        resume_run_id=resume_run_id,
+        incremental=params.get("incremental", False),
+        run_id=job["id"],
+        cancel_token=cancel_token,
+        time_budget=params.get("time_budget"),
+        area_time_budget=params.get("area_time_budget"),
+        worker_processes=params.get("worker_processes"),
+        tiled=params.get("tiled")
+    )
+
+def publish_job_event(job_id, event, data):
+    if event == "snapshot":
+        data = job_status(get_jobs().get(job_id))
+    PROGRESS_EVENTS.publish(event, {**data, "job_id": job_id})
+
+def get_jobs():
+    global _JOBS
+    with _JOBS_LOCK:
+        if _JOBS is None:
+            _JOBS = JobManager(run_job, on_event=publish_job_event)
+        return _JOBS
+
+def job_status(job):
+    """Dashboard view of one job, in the shape /api/status always had."""
+    if job is None:
+        latest = get_catalog().latest()
+        return {
+            "job_id": None,
+            "is_scraping": False,
+            "latest_file": latest["path"] if latest else None,
+            "progress": new_progress("Idle")
+        }
+
+    latest_file = job["result_file"]
+    if not latest_file and job["status"] in TERMINAL_STATUSES and job["status"] != "completed":
+        # Failed/cancelled job: keep offering the last good file (served from the results catalog, no directory scan)
+        latest = get_catalog().latest()
+        latest_file = latest["path"] if latest else None
+    return {
+        "job_id": job["id"],
+        "is_scraping": job["status"] not in TERMINAL_STATUSES,
+        "latest_file": latest_file,
+        "progress": job["progress"]
+    }
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+def parse_scrape_request(data):
+    params = {
+        "areas": data.get('areas', []),
+        "city": data.get('city', 'Surat'),
+        "category": data.get('category', 'it'),
+        "custom_query": data.get('custom_query', ''),
+        "incremental": bool(data.get('incremental', False)),
+        "time_budget": data.get('time_budget'),
+        "area_time_budget": data.get('area_time_budget'),
+        "worker_processes": data.get('worker_processes'),
+        "tiled": data.get('tiled'),
+        "resume_run_id": None
+    }
+
+    # Resume the last interrupted run from its journal
+    if data.get('resume'):
+        resume_run_id = find_resumable_run(exclude=get_jobs().active_run_ids())
+        if not resume_run_id:
+            return None, ("No interrupted run to resume", 404)
+        meta = load_journal(resume_run_id)["meta"]
+        params.update({
+            "areas": meta.get('areas') or [],
+            "city": meta.get('city') or params["city"],
+            "category": meta.get('category') or params["category"],
+            "custom_query": meta.get('custom_query') or '',
+            "tiled": meta.get('tiled') if meta.get('tiled') is not None else params["tiled"],
+            "resume_run_id": resume_run_id
+        })
+
+    if not params["areas"]:
+        return None, ("No areas provided", 400)
+    workers = params["worker_processes"]
+    if workers is not None:
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            return None, ("worker_processes must be a positive integer", 400)
+        # Each worker drives its own Chrome; more than one per core only thrashes
+        params["worker_processes"] = min(workers, os.cpu_count() or 1)
+    return params, None
+
 @app.route('/api/scrape', methods=['POST'])
 def scrape():
-    global LATEST_FILE, IS_SCRAPING, SCRAPER_PROGRESS
-    
-    if IS_SCRAPING:
-        return jsonify({"status": "error", "message": "Scraper is already running"}), 409
-
-    data = request.json
-    areas = data.get('areas', [])
-    city = data.get('city', 'Surat')
-    category = data.get('category', 'it')
-    custom_query = data.get('custom_query', '')
-    
-    if not areas:
-        return jsonify({"status": "error", "message": "No areas provided"}), 400
-        
-    def run_task():
-        global LATEST_FILE, IS_SCRAPING, SCRAPER_PROGRESS
-        with SCRAPING_LOCK:
-            IS_SCRAPING = True
-            LATEST_FILE = None # Reset previous file
-            # Reset progress
-            SCRAPER_PROGRESS = {
-                "total": 0,
-                "processed": 0,
-                "current_area": "Initializing...",
-                "log": ["Starting scraper..."],
-                "status": "Running"
-            }
-            
-            def progress_callback(update_data):
-                """Callback to update progress from scraper"""
-                global SCRAPER_PROGRESS
-                # Update fields if provided
-                if "total" in update_data: SCRAPER_PROGRESS["total"] = update_data["total"]
-                if "processed" in update_data: SCRAPER_PROGRESS["processed"] = update_data["processed"]
-                if "current_area" in update_data: SCRAPER_PROGRESS["current_area"] = update_data["current_area"]
-                if "log" in update_data: 
-                    SCRAPER_PROGRESS["log"].append(update_data["log"])
-                    # Keep log size manageable
-                    if len(SCRAPER_PROGRESS["log"]) > 50:
-                        SCRAPER_PROGRESS["log"].pop(0)
-
-            try:
-                # Call the scraper with callback
-                filename = run_scraper(
-                    areas=areas,
-                    city=city,
-                    category=category,
-                    custom_query=custom_query,
-                    progress_callback=progress_callback
-                )
-                print(f"DEBUG: Scraper returned filename: {filename}")
-                LATEST_FILE = filename
-                SCRAPER_PROGRESS["status"] = "Completed"
-                SCRAPER_PROGRESS["log"].append("Scraping completed successfully!")
-            except Exception as e:
-                SCRAPER_PROGRESS["status"] = "Failed"
-                SCRAPER_PROGRESS["log"].append(f"Error: {str(e)}")
-            finally:
-                IS_SCRAPING = False
-                
-    # Run in background thread
-    thread = threading.Thread(target=run_task)
-    thread.start()
-    
-    return jsonify({"status": "success", "message": "Scraping started"})
+    params, error = parse_scrape_request(request.json or {})
+    if error:
+        return jsonify({"status": "error", "message": error[0]}), error[1]
+
+    # Queued behind any running jobs instead of being refused with 409
+    busy = get_jobs().has_active_jobs()
+    job = get_jobs().submit(params)
+    message = "Scraping resumed" if params["resume_run_id"] else "Scraping started"
+    if busy:
+        message = "Scraping queued"
+    return jsonify({"status": "success", "message": message, "job_id": job["id"]})
+
+@app.route('/api/jobs', methods=['GET', 'POST'])
+def jobs():
+    if request.method == 'POST':
+        params, error = parse_scrape_request(request.json or {})
+        if error:
+            return jsonify({"status": "error", "message": error[0]}), error[1]
+        return jsonify({"status": "success", "job": get_jobs().submit(params)}), 202
+
+    limit = min(max(1, request.args.get('limit', 50, type=int)), 500)
+    return jsonify({"status": "success", "jobs": get_jobs().list(limit=limit)})
+
+@app.route('/api/jobs/<job_id>')
+def job_detail(job_id):
+    job = get_jobs().get(job_id)
+    if not job:
+        return jsonify({"status": "error", "message": "Job not found"}), 404
+    return jsonify({"status": "success", "job": job})
+
+@app.route('/api/jobs/<job_id>/result')
+def job_result(job_id):
+    job = get_jobs().get(job_id)
+    if not job:
+        return jsonify({"status": "error", "message": "Job not found"}), 404
+    if not job["result_file"] or not os.path.exists(job["result_file"]):
+        return jsonify({"status": "error", "message": f"No result file (job is {job['status']})"}), 404
+    return send_file(job["result_file"], as_attachment=True)
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    ok, message = get_jobs().cancel(job_id)
+    if not ok:
+        return jsonify({"status": "error", "message": message}), 404 if message == "Job not found" else 409
+    return jsonify({"status": "success", "message": "Job cancelled" if message == "cancelled" else "Job is stopping; partial results will be saved"})
+
+@app.route('/api/runs/resumable')
+def resumable_run():
+    run_id = find_resumable_run(exclude=get_jobs().active_run_ids())
+    if not run_id:
+        return jsonify({"status": "success", "run": None})
+    state = load_journal(run_id)
+    return jsonify({
+        "status": "success",
+        "run": {
+            "run_id": run_id,
+            **state["meta"],
+            "done_areas": sorted(state["done_areas"]),
+            "companies": sum(len(c) for c in state["companies"].values())
+        }
+    })
+
+def current_status(job_id=None):
+    jobs = get_jobs()
+    return job_status(jobs.get(job_id) if job_id else jobs.latest())
 
 @app.route('/api/status')
 def status():
-    global IS_SCRAPING, LATEST_FILE, SCRAPER_PROGRESS
-    
-    # Logic to persist latest file across restarts
-    if LATEST_FILE is None and not IS_SCRAPING:
-        try:
-            # Find the most recent Excel file in the current directory (matches any city)
-            files = [f for f in os.listdir('.') if f.endswith('.xlsx') and '_data_' in f]
-            if files:
-                # Sort by modification time (newest first)
-                latest = max(files, key=os.path.getmtime)
-                LATEST_FILE = latest
-                print(f"DEBUG: Found existing file: {LATEST_FILE}")
-            else:
-                print("DEBUG: No existing files found.")
-        except Exception as e:
-            print(f"Error finding latest file: {e}")
-
-    # FORCE CHECK: If status says Completed but LATEST_FILE is None, try finding it again
-    if SCRAPER_PROGRESS["status"] == "Completed" and LATEST_FILE is None:
-         print("DEBUG: Status is Completed but LATEST_FILE is None. Retrying file search...")
-         try:
-            files = [f for f in os.listdir('.') if f.endswith('.xlsx') and '_data_' in f]
-            if files:
-                latest = max(files, key=os.path.getmtime)
-                LATEST_FILE = latest
-                print(f"DEBUG: Recovered file: {LATEST_FILE}")
-         except Exception as e:
-            print(f"Error recovering file: {e}")
+    return jsonify(current_status(request.args.get('job_id')))
+
+@app.route('/api/events')
+def events():
+    # Push channel: one snapshot on connect, then only incremental events
+    return Response(
+        PROGRESS_EVENTS.stream("snapshot", current_status(request.args.get('job_id'))),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
+@app.route('/api/units')
+def units():
+    # Distributed runs: per-area unit state in the work queue and the workers heard from recently
+    run_id = request.args.get('job_id')
+    if not run_id:
+        latest = get_jobs().latest()
+        run_id = latest["id"] if latest else None
+    if not run_id or not os.path.exists(QUEUE_PATH):
+        return jsonify({"status": "success", "run_id": run_id, "units": [], "workers": []})
+    queue = WorkQueue(QUEUE_PATH)
+    try:
+        unit_list = queue.units(run_id)
+        workers = queue.workers(run_id)
+    finally:
+        queue.close()
     return jsonify({
-        "is_scraping": IS_SCRAPING,
-        "latest_file": LATEST_FILE,
-        "progress": SCRAPER_PROGRESS
+        "status": "success",
+        "run_id": run_id,
+        "units": unit_list,
+        "workers": workers,
+        "processed": sum(u["processed"] for u in unit_list),
+        "done": sum(1 for u in unit_list if u["status"] == "done")
+    })
+
+@app.route('/api/metrics')
+def metrics():
+    # Prometheus text by default; ?format=json for the per-run summaries
+    if request.args.get('format') == 'json':
+        run_id = request.args.get('run_id')
+        runs = [run_metrics.get_run(run_id)] if run_id else run_metrics.all_runs()
+        return jsonify({"status": "success", "runs": [m.summary() for m in runs if m]})
+    return Response(run_metrics.prometheus_text(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/results')
+def results():
+    limit = min(max(1, request.args.get('limit', 50, type=int)), 500)
+    offset = max(0, request.args.get('offset', 0, type=int))
+    return jsonify({
+        "status": "success",
+        "latest": get_catalog().latest(),
+        "results": get_catalog().list(limit=limit, offset=offset)
     })
 
 @app.route('/api/download/<filename>')
@@ -135,17 +250,53 @@ def download(filename):
         return send_file(filename, as_attachment=True)
     return jsonify({"status": "error", "message": "File not found"}), 404
 
+def _bool_arg(name):
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
+    return value.lower() in ('1', 'true', 'yes')
+
 @app.route('/api/view/<filename>')
 def view_data(filename):
     if os.path.exists(filename):
         try:
-            df = pd.read_excel(filename)
-            # Replace NaN with empty string for JSON serialization
-            df = df.fillna("")
+            from result_reader import get_dataset, query_results  # pandas loads on the first view
+            columns = [c for c in request.args.get('columns', '').split(',') if c]
+            sort = request.args.get('sort')
+            needed = None
+            if columns:
+                # Read only what is shown plus what the filters, sort and area list touch
+                needed = columns + ["Area"]
+                if _bool_arg('has_email') is not None:
+                    needed.append("Email (Website)")
+                if _bool_arg('has_website') is not None:
+                    needed.append("Website")
+                if sort:
+                    needed.append(sort)
+            # Parsed once per (filename, mtime, columns); page flips only slice the cached frame
+            df = get_dataset(filename, needed)
+            offset = max(0, request.args.get('offset', 0, type=int))
+            limit = min(max(1, request.args.get('limit', 50, type=int)), 500)
+            page, total = query_results(
+                df,
+                area=request.args.get('area'),
+                has_email=_bool_arg('has_email'),
+                has_website=_bool_arg('has_website'),
+                sort=sort,
+                descending=request.args.get('order', 'asc').lower() == 'desc',
+                offset=offset,
+                limit=limit
+            )
+            if columns:
+                page = page[[c for c in columns if c in page.columns]]
             return jsonify({
                 "status": "success",
-                "data": df.to_dict(orient='records'),
-                "columns": df.columns.tolist()
+                "data": page.to_dict(orient='records'),
+                "columns": page.columns.tolist(),
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "areas": sorted(a for a in df["Area"].unique() if a) if "Area" in df else []
             })
         except Exception as e:
             return jsonify({"status": "error", "message": str(e)}), 500
@@ -158,7 +309,12 @@ if __name__ == '__main__':
     
     # Only print banner in the reloader process (child) to avoid duplicates
     if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # Logging is configured here, not on import, so only the serving process owns scraper.log
+        setup_logging()
         print("\n" + "="*50)
         print("🚀  SURAT DATA EXTRACTOR - READY")
         print("="*50 + "\n")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+        # Pick up jobs queued before a restart without waiting for the first request
+        get_jobs()
+    # threaded: each /api/events stream holds a worker for the life of the connection
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
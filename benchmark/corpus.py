@@ -0,0 +1,107 @@
+import random
+import hashlib
+import scraper
+
+PREFIXES = [
+    "Akshar", "Shreeji", "Nirmal", "Tapi", "Surya", "Krish", "Vraj", "Om", "Dhruv", "Rudra",
+    "Pixel", "Cloud", "Bright", "Nova", "Zenith", "Apex", "Vertex", "Quantum", "Orbit", "Cyber",
+]
+CORES = ["Soft", "Infotech", "Web", "Digital", "Code", "Logic", "Byte", "Net", "Data", "Apps"]
+SUFFIXES = ["Technologies", "Solutions", "Infosys", "Software", "Systems", "Labs", "Studio", ""]
+ROADS = ["Ring Road", "LP Savani Road", "Ghod Dod Road", "VIP Road", "Station Road", "Athwa Lines"]
+
+
+def _place_id(name, area):
+    digest = hashlib.sha1(f"{area}|{name}".encode()).hexdigest()
+    return "ChIJ" + digest[:23]
+
+
+def _cloudflare_encode(email, key=0x5a):
+    return f"{key:02x}" + "".join(f"{ord(c) ^ key:02x}" for c in email)
+
+
+def build_corpus(areas, per_area=40, seed=7):
+    """Deterministic fake businesses for each area plus the websites they own.
+
+    About half of the businesses list a website on Maps; of the rest, half own a
+    site that only the backup domain search can find, the others have none.
+    """
+    rng = random.Random(seed)
+    companies = []
+    sites = {}
+    used = set()
+
+    for area in areas:
+        for n in range(per_area):
+            while True:
+                name = " ".join(p for p in (rng.choice(PREFIXES), rng.choice(CORES), rng.choice(SUFFIXES)) if p)
+                if name not in used:
+                    used.add(name)
+                    break
+
+            phone = f"{rng.choice('6789')}{rng.randint(1000, 9999)} {rng.randint(10000, 99999)}"
+            company = {
+                "name": name,
+                "area": area,
+                "place_id": _place_id(name, area),
+                "phone": phone,
+                "address": f"{rng.randint(1, 400)}, {rng.choice(ROADS)}, {area}, Surat, Gujarat 3950{rng.randint(0, 9):02d}",
+                "website": None,
+                "site_host": None,
+            }
+
+            kind = rng.random()
+            if kind < 0.5:
+                host = f"www.{name.lower().replace(' ', '')}.com"
+                company["website"] = f"http://{host}/"
+            elif kind < 0.75:
+                # Only reachable through generate_candidate_domains, like real Maps gaps
+                candidates = [d for d in scraper.generate_candidate_domains(name, area) if not d.startswith("www.")]
+                host = rng.choice(candidates[:len(scraper.CANDIDATE_TLDS)])
+            else:
+                host = None
+
+            if host:
+                company["site_host"] = host
+                slug = host.replace("www.", "").split(".")[0]
+                emails = [f"info@{slug}.com", f"hr@{slug}.com"][:rng.randint(0, 2)]
+                sites[host] = {
+                    "name": name,
+                    "home_emails": emails[:1],
+                    "contact_emails": emails[1:] or ([f"contact@{slug}.com"] if rng.random() < 0.5 else []),
+                    "cloudflare": rng.random() < 0.2,
+                    "head_unsupported": rng.random() < 0.15,
+                }
+            companies.append(company)
+
+    return {"companies": companies, "sites": sites}
+
+
+def companies_for_query(corpus, query):
+    query = query.lower()
+    return [c for c in corpus["companies"] if c["area"].lower() in query]
+
+
+def render_site_page(site, path):
+    if path in ("", "/"):
+        emails = site["home_emails"]
+        links = '<a href="/services">Services</a> <a href="/contact">Contact Us</a>'
+    elif path.rstrip("/") == "/contact":
+        emails = site["contact_emails"]
+        links = '<a href="/">Home</a>'
+    else:
+        return None
+
+    if site["cloudflare"]:
+        body = "".join(
+            f'<a href="/cdn-cgi/l/email-protection#{_cloudflare_encode(e)}">[email protected]</a>' for e in emails
+        )
+    else:
+        body = "".join(f'<p>Write to us: <a href="mailto:{e}">{e}</a></p>' for e in emails)
+
+    filler = "<p>" + " ".join(["We build software for businesses in Surat."] * 30) + "</p>"
+    return (
+        f"<html><head><title>{site['name']}</title>"
+        f'<script src="/static/jquery-3.6.0.min.js"></script></head>'
+        f"<body><nav>{links}</nav><h1>{site['name']}</h1>{filler}{body}</body></html>"
+    )
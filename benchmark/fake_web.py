@@ -0,0 +1,273 @@
+import json
+import time
+import random
+import threading
+from collections import Counter, defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, unquote
+from corpus import companies_for_query, render_site_page
+
+MAPS_HOST = "maps.bench"
+MAPS_BASE_URL = f"http://{MAPS_HOST}/maps"
+
+# Mirrors the Maps DOM the scraper reads: feed of Nv2PK cards, a role=main details pane
+# with h1.DUwDvf, address/phone buttons and the authority (website) link, and a Back button.
+MAPS_PAGE = """<!DOCTYPE html>
+<html><head><title>%(query)s - Google Maps</title>
+<style>
+  body { margin: 0; display: flex; font-family: sans-serif; }
+  .m6QErb { width: 45%%; height: 560px; overflow-y: auto; }
+  .Nv2PK { position: relative; height: 96px; border-bottom: 1px solid #ddd; padding: 6px; }
+  .hfpxzc { position: absolute; inset: 0; }
+  #pane { width: 55%%; padding: 12px; }
+</style></head>
+<body>
+<div class="m6QErb" role="feed" tabindex="0" id="feed"></div>
+<div role="main" class="bJzME" id="pane"></div>
+<script>
+const PLACES = %(places)s;
+const MAPS_BASE = %(maps_base)s;
+const PAGE = %(page_size)d, LOAD_MS = %(load_ms)d, PANE_MS = %(pane_ms)d;
+const feed = document.getElementById('feed'), pane = document.getElementById('pane');
+let shown = 0, loading = false;
+
+function esc(s) { return s.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/"/g, '&quot;'); }
+
+function renderMore() {
+  const end = Math.min(PLACES.length, shown + PAGE);
+  for (; shown < end; shown++) {
+    const p = PLACES[shown];
+    const card = document.createElement('div');
+    card.className = 'Nv2PK';
+    card.setAttribute('aria-label', p.name);
+    card.dataset.i = shown;
+    card.innerHTML =
+      '<a class="hfpxzc" aria-label="' + esc(p.name) + '" href="' + MAPS_BASE + '/place/' +
+        encodeURIComponent(p.name) + '/data=!4m7!3m6!1s0x0:0x0!8m2!3d21.17!4d72.83!16s!19s' + p.place_id + '"></a>' +
+      '<div class="fontHeadlineSmall">' + esc(p.name) + '</div>' +
+      '<div>Software company · ' + esc(p.short_address) + '</div>' +
+      '<div>Open 24 hours · ' + p.phone + '</div>' +
+      (p.website ? '<a data-value="Website" href="' + p.website + '">Website</a>' : '');
+    feed.appendChild(card);
+  }
+  if (shown >= PLACES.length) {
+    const endNote = document.createElement('div');
+    endNote.textContent = "You've reached the end of the list.";
+    feed.appendChild(endNote);
+  }
+}
+
+feed.addEventListener('scroll', () => {
+  if (loading || shown >= PLACES.length) return;
+  if (feed.scrollTop + feed.clientHeight < feed.scrollHeight - 200) return;
+  loading = true;
+  setTimeout(() => { renderMore(); loading = false; }, LOAD_MS);
+});
+
+feed.addEventListener('click', (e) => {
+  const card = e.target.closest('.Nv2PK');
+  if (!card) return;
+  e.preventDefault();
+  const p = PLACES[+card.dataset.i];
+  pane.innerHTML = '';
+  setTimeout(() => {
+    pane.innerHTML =
+      '<button aria-label="Back">Back</button>' +
+      '<h1 class="DUwDvf fontHeadlineLarge">' + esc(p.name) + '</h1>' +
+      '<button data-item-id="address"><div>' + esc(p.address) + '</div></button>' +
+      '<button data-item-id="phone:tel:+91' + p.phone.replace(/ /g, '') + '" aria-label="Phone: ' + p.phone + '"><div>' + p.phone + '</div></button>' +
+      (p.website ? '<a data-item-id="authority" href="' + p.website + '">' + esc(p.website) + '</a>' : '');
+    pane.querySelector('button[aria-label="Back"]').addEventListener('click', () => { pane.innerHTML = ''; });
+  }, PANE_MS);
+});
+
+renderMore();
+</script>
+</body></html>
+"""
+
+# What Maps serves automated traffic it has flagged (the /sorry/ interstitial)
+SORRY_PAGE = """<!DOCTYPE html>
+<html><head><title>Sorry...</title></head><body>
+<div>Our systems have detected unusual traffic from your computer network.</div>
+<form id="captcha-form" action="/sorry/index" method="post"></form>
+</body></html>
+"""
+
+
+class FakeWeb:
+    """Local stand-in for Google Maps and company websites, reached as an HTTP proxy.
+
+    Point the scraper at it with scraper.set_proxy(fake.proxy_url) and
+    CONFIG["MAPS_BASE_URL"] = MAPS_BASE_URL. Hosts that are not in the corpus
+    answer 502 like a dead domain; HTTPS (CONNECT) is refused. With host_limit,
+    a site answers 429 to requests beyond that many per second, like a
+    rate-limited shared host. The first maps_blocks Maps searches get the
+    "unusual traffic" interstitial instead of results.
+    """
+
+    def __init__(self, corpus, latency=0.0, jitter=0.0, failure_rate=0.0, page_size=20,
+                 load_ms=400, pane_ms=300, seed=0, host_limit=None, maps_blocks=0):
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.page_size = page_size
+        self.load_ms = load_ms
+        self.pane_ms = pane_ms
+        self.host_limit = host_limit
+        self.maps_blocks = maps_blocks
+        self._recent = defaultdict(deque)
+        self.rng = random.Random(seed)
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def proxy_url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_CONNECT(self):
+                fake._count("https", "CONNECT")
+                self.send_error(405, "HTTPS not available in the benchmark")
+
+            def do_HEAD(self):
+                fake._handle(self, head=True)
+
+            def do_GET(self):
+                fake._handle(self, head=False)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="fake-web", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self.requests)
+        return {
+            "maps": sum(v for k, v in counts.items() if k[0] == "maps"),
+            "web": sum(v for k, v in counts.items() if k[0] in ("web", "dead", "https")),
+            "dead": sum(v for k, v in counts.items() if k[0] == "dead"),
+            "head": sum(v for k, v in counts.items() if k[1] == "HEAD"),
+            "throttled": sum(v for k, v in counts.items() if k[0] == "throttled"),
+            "maps_blocked": sum(v for k, v in counts.items() if k[0] == "maps_blocked"),
+        }
+
+    # --- internals ---
+
+    def _count(self, kind, method):
+        with self._lock:
+            self.requests[(kind, method)] += 1
+
+    def _site(self, host):
+        sites = self.corpus["sites"]
+        bare = host[4:] if host.startswith("www.") else host
+        return sites.get(host) or sites.get(bare) or sites.get("www." + bare)
+
+    def _delay(self):
+        if self.latency or self.jitter:
+            with self._lock:
+                extra = self.rng.uniform(0, self.jitter)
+            time.sleep(self.latency + extra)
+
+    def _handle(self, handler, head):
+        # As a proxy the request line carries the absolute URL; fall back to the Host header
+        url = urlparse(handler.path)
+        host = (url.hostname or handler.headers.get("Host", "")).split(":")[0].lower()
+        path = url.path if url.hostname else handler.path.split("?")[0]
+        method = "HEAD" if head else "GET"
+
+        if host == MAPS_HOST:
+            self._count("maps", method)
+            if path.startswith("/maps/search/"):
+                with self._lock:
+                    blocked = self.maps_blocks > 0
+                    self.maps_blocks -= blocked
+                if blocked:
+                    self._count("maps_blocked", method)
+                    return self._send(handler, 200, SORRY_PAGE, head)
+                query = unquote(path[len("/maps/search/"):])
+                return self._send(handler, 200, self._maps_page(query), head)
+            return self._send(handler, 404, "<html><body>Not found</body></html>", head)
+
+        site = self._site(host)
+        self._count("web" if site else "dead", method)
+        self._delay()
+        if not site:
+            return self._send(handler, 502, "Bad gateway: unknown host", head)
+        if self._over_limit(site["name"]):
+            self._count("throttled", method)
+            return self._send(handler, 429, "Too many requests", head, headers={"Retry-After": "1"})
+
+        with self._lock:
+            roll = self.rng.random()
+        if roll < self.failure_rate:
+            if roll < self.failure_rate / 2:
+                return self._send(handler, 503, "Service unavailable", head)
+            handler.close_connection = True
+            return  # drop the connection without a response
+        if head and site["head_unsupported"]:
+            return self._send(handler, 405, "", head)
+
+        page = render_site_page(site, path)
+        if page is None:
+            return self._send(handler, 404, "<html><body>Not found</body></html>", head)
+        return self._send(handler, 200, page, head)
+
+    def _over_limit(self, site_key):
+        if not self.host_limit:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent[site_key]
+            while recent and now - recent[0] > 1.0:
+                recent.popleft()
+            if len(recent) >= self.host_limit:
+                return True
+            recent.append(now)
+        return False
+
+    def _maps_page(self, query):
+        places = [
+            {
+                "name": c["name"],
+                "place_id": c["place_id"],
+                "phone": c["phone"],
+                "address": c["address"],
+                "short_address": c["address"].split(",")[1].strip(),
+                "website": c["website"],
+            }
+            for c in companies_for_query(self.corpus, query)
+        ]
+        return MAPS_PAGE % {
+            "query": query.replace("<", ""),
+            "places": json.dumps(places),
+            "page_size": self.page_size,
+            "load_ms": self.load_ms,
+            "pane_ms": self.pane_ms,
+            "maps_base": json.dumps(MAPS_BASE_URL),
+        }
+
+    def _send(self, handler, status, body, head, headers=None):
+        data = body.encode("utf-8")
+        handler.send_response(status)
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        if not head:
+            handler.wfile.write(data)
@@ -0,0 +1,147 @@
+"""Micro-benchmarks for the text helpers: the matchers-based versions against the
+previous per-call regex / any() implementations, over corpus names, addresses and URLs.
+
+    python benchmark/matchers_benchmark.py
+
+Also checks that both versions return the same result for every input.
+"""
+import os
+import re
+import sys
+import random
+import timeit
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scraper  # noqa: E402
+import matchers  # noqa: E402
+from corpus import build_corpus  # noqa: E402
+
+
+# --- previous implementations, kept here as the baseline ---
+
+def legacy_clean_text(text):
+    if not text:
+        return ""
+    text = re.sub(r'[^\x00-\x7F\u0900-\u097F]+', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    text = re.sub(r'[^\w\s.,#\-()&/\'"]', '', text)
+    return text
+
+
+def legacy_clean_address(address):
+    if not address or address == "Not Found":
+        return "Not Found"
+    address = re.sub(r'[^\w\s,.\-/()&\'\"]', '', address, flags=re.UNICODE)
+    address = re.sub(r'\b[A-Z0-9]{4,}\+[A-Z0-9]{2,}\b', '', address)
+    address = re.sub(r'[•|📍]', '', address)
+    address = re.sub(r'\s+', ' ', address).strip()
+    address = re.sub(r'^,\s*', '', address)
+    return address
+
+
+def legacy_should_skip_company(company_name):
+    if not company_name or company_name == "Not Found":
+        return True
+    name_lower = company_name.lower()
+    obvious_non_business = [
+        'talab', 'stp', 'sewage', 'treatment plant',
+        'community hall', 'fire station', 'police station',
+        'bus stop', 'gate no', 'unnamed road',
+        'digital seva csc', 'government service',
+        'housing society', 'apartment', 'complex',
+        'chhath talav', 'krishna park', 'millenium park',
+        'shopping center', 'market', 'mall', 'park', 'garden',
+        'playground', 'swimming pool', 'sports complex'
+    ]
+    for keyword in obvious_non_business:
+        if keyword in name_lower:
+            return True
+    if len(name_lower) < 4:
+        return True
+    if re.search(r'^\d+\s+[a-z]+\s+(road|street|society|nagar)$', name_lower):
+        return True
+    return False
+
+
+def legacy_is_social_or_google(url):
+    if not url:
+        return True
+    bad = [
+        "facebook.com", "instagram.com", "linkedin.com",
+        "youtube.com", "google.com", "maps.google",
+        "g.page", "justdial.com", "indiamart.com", "sulekha.com"
+    ]
+    return any(b in url.lower() for b in bad)
+
+
+def legacy_is_generic_website(url):
+    generic_patterns = [
+        'indiamart.com', 'justdial.com', 'tradeindia.com',
+        'sulekha.com', 'quikr.com', 'olx.in', 'yellowpages.in',
+        'g.page', 'maps.google.com', 'facebook.com', 'instagram.com',
+        'linkedin.com', 'youtube.com', 'twitter.com'
+    ]
+    url_lower = url.lower()
+    return any(p in url_lower for p in generic_patterns)
+
+
+def legacy_is_junk_email(email):
+    junk_keywords = [
+        'bootstrap', 'sentry', 'example', 'domain', 'react', 'jquery',
+        'node_modules', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp',
+        'wix', 'shopify', 'godaddy', 'namecheap'
+    ]
+    return any(junk in email.lower() for junk in junk_keywords)
+
+
+# --- corpus ---
+
+def text_inputs(companies, seed=7):
+    rng = random.Random(seed)
+    names = [c["name"] for c in companies]
+    names += ["Adajan Swimming Pool", "12 Ring road", "Shree Ganesh Apartment", "Tapi Riverfront Park",
+              "🌟 Pixel Soft – Web Design", "सूरत Infotech Pvt. Ltd."]
+    addresses = [c["address"] + rng.choice(["", " • 📍 7VWJ+2X Surat", " | Near Bus Stop"]) for c in companies]
+    urls = [c["website"] or "https://www.facebook.com/pages/x" for c in companies]
+    urls += ["https://g.page/r/abc", "https://www.justdial.com/Surat/x", "http://acme.co.in/"]
+    emails = [f"info@{n.split()[0].lower()}.com" for n in names] + ["logo@2x.png", "user@example.com", "x@sentry.io"]
+    return names, addresses, urls, emails
+
+
+def bench(label, legacy, new, inputs, number):
+    mismatches = [x for x in inputs if legacy(x) != new(x)]
+    old_t = timeit.timeit(lambda: [legacy(x) for x in inputs], number=number)
+    new_t = timeit.timeit(lambda: [new(x) for x in inputs], number=number)
+    calls = len(inputs) * number
+    print(f"{label:<22}{old_t / calls * 1e6:>12.2f}{new_t / calls * 1e6:>12.2f}{old_t / new_t:>9.1f}x"
+          f"{'  OK' if not mismatches else f'  {len(mismatches)} MISMATCHES'}")
+    return not mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--companies", type=int, default=150, help="Corpus businesses to generate")
+    parser.add_argument("--number", type=int, default=20, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    companies = build_corpus(["Adajan", "Vesu", "Athwa"], per_area=args.companies // 3 + 1)["companies"][:args.companies]
+    names, addresses, urls, emails = text_inputs(companies)
+    print(f"Corpus: {len(names)} names, {len(addresses)} addresses, {len(urls)} urls, {len(emails)} emails\n")
+
+    print(f"{'helper':<22}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+    ok = all([
+        bench("clean_text", legacy_clean_text, scraper.clean_text, names, args.number * 10),
+        bench("clean_address", legacy_clean_address, scraper.clean_address, addresses, args.number * 10),
+        bench("should_skip_company", legacy_should_skip_company, scraper.should_skip_company, names, args.number * 10),
+        bench("is_social_or_google", legacy_is_social_or_google, scraper.is_social_or_google, urls, args.number * 10),
+        bench("is_generic_website", legacy_is_generic_website, scraper.is_generic_website, urls, args.number * 10),
+        bench("email junk filter", legacy_is_junk_email, lambda e: bool(matchers.EMAIL_JUNK.search(e.lower())), emails, args.number * 10),
+    ])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Micro-benchmark for name_match against the difflib-based name checks it replaced.
+
+    python benchmark/name_match_benchmark.py
+    python benchmark/name_match_benchmark.py --names 2000 --number 10
+
+Pairs are built from the benchmark corpus the way they show up in a run: the
+card name against the detail pane name (legal suffixes added or dropped, case,
+a dropped letter, a branch word), plus pairs of different businesses. Reports
+the time per comparison and how often each version accepts the true pairs and
+rejects the false ones.
+"""
+import os
+import sys
+import random
+import difflib
+import timeit
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import name_match  # noqa: E402
+from corpus import build_corpus  # noqa: E402
+
+
+# --- previous implementations, kept here as the baseline ---
+
+def legacy_same_business(expected_name, name):
+    norm_expected = expected_name.lower().replace('pvt', '').replace('ltd', '').replace('company', '').replace('.', '').replace(' ', '')
+    norm_actual = name.lower().replace('pvt', '').replace('ltd', '').replace('company', '').replace('.', '').replace(' ', '')
+    if norm_expected not in norm_actual and norm_actual not in norm_expected:
+        ratio = difflib.SequenceMatcher(None, norm_expected, norm_actual).ratio()
+        if ratio < 0.6:
+            return False
+    return True
+
+
+def legacy_overlaps(last_company_name, current_candidate):
+    return last_company_name.lower() in current_candidate.lower() or current_candidate.lower() in last_company_name.lower()
+
+
+def legacy_similar(a, b, threshold):
+    if not a or not b:
+        return False
+    matcher = difflib.SequenceMatcher(None, a, b)
+    return matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
+
+
+# --- corpus ---
+
+def variant(name, rng):
+    kind = rng.choice(["suffix", "upper", "typo", "branch", "same"])
+    if kind == "suffix":
+        return name + rng.choice([" Pvt. Ltd.", " Private Limited", " LLP", " & Co."])
+    if kind == "upper":
+        return "The " + name.upper()
+    if kind == "typo":
+        i = rng.randrange(1, len(name) - 1)
+        return name[:i] + name[i + 1:]
+    if kind == "branch":
+        return f"{name} - {rng.choice(['Adajan', 'Vesu Branch', 'Head Office'])}"
+    return name
+
+
+def name_pairs(count, seed=7):
+    rng = random.Random(seed)
+    names = [c["name"] for c in build_corpus(["Adajan", "Vesu", "Athwa", "Pal"], per_area=max(1, count // 4), seed=seed)["companies"]]
+    same = [(n, variant(n, rng)) for n in names]
+    different = [(a, b) for a, b in zip(names, rng.sample(names, len(names))) if a != b]
+    return same, different
+
+
+def bench(label, legacy, new, pairs, number):
+    old_t = timeit.timeit(lambda: [legacy(a, b) for a, b in pairs], number=number)
+    new_t = timeit.timeit(lambda: [new(a, b) for a, b in pairs], number=number)
+    calls = len(pairs) * number
+    print(f"{label:<28}{old_t / calls * 1e6:>12.2f}{new_t / calls * 1e6:>12.2f}{old_t / new_t:>9.1f}x")
+
+
+def accuracy(label, check, same, different):
+    accepted = sum(bool(check(a, b)) for a, b in same)
+    rejected = sum(not check(a, b) for a, b in different)
+    print(f"{label:<28}{accepted / len(same):>12.1%}{rejected / len(different):>16.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--names", type=int, default=1000, help="Business names to generate")
+    parser.add_argument("--number", type=int, default=20, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    same, different = name_pairs(args.names)
+    pairs = same + different
+    keys = [(name_match.match_key(a), name_match.match_key(b)) for a, b in pairs]
+    lowered = [(a.lower(), b.lower()) for a, b in pairs]
+    print(f"Corpus: {len(same)} same-business pairs, {len(different)} different-business pairs\n")
+
+    print(f"{'check':<28}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+    bench("card vs pane (0.6)", legacy_same_business, name_match.same_business, pairs, args.number)
+    bench("click verification", legacy_overlaps, name_match.overlaps, pairs, args.number)
+    bench("dedup keys (0.9)", lambda a, b: legacy_similar(a, b, 0.9), lambda a, b: name_match.similar(a, b, 0.9), keys, args.number)
+    bench("dedup addresses (0.7)", lambda a, b: legacy_similar(a, b, 0.7), lambda a, b: name_match.similar(a, b, 0.7), lowered, args.number)
+
+    print(f"\n{'card vs pane (0.6)':<28}{'same kept':>12}{'other rejected':>16}")
+    accuracy("  difflib", legacy_same_business, same, different)
+    accuracy("  name_match", name_match.same_business, same, different)
+
+
+if __name__ == "__main__":
+    main()
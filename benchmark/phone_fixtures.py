@@ -0,0 +1,161 @@
+"""Fixture checks and timings for phone_parser.
+
+    python benchmark/phone_fixtures.py                          # fixtures + synthetic panes
+    python benchmark/phone_fixtures.py --html-dir saved_panes/  # also time real saved pane HTML (*.html)
+
+FIXTURES are pane snippets the way Maps and business pages write numbers, with
+the E.164 numbers that must come out of them. Exits non-zero if any fixture
+fails. The timing compares extract_phones with the previous six-regex scan,
+kept below as legacy_find_phone, over panes with reviews and other numeric noise.
+"""
+import os
+import re
+import sys
+import glob
+import random
+import timeit
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import phone_parser  # noqa: E402
+from corpus import build_corpus  # noqa: E402
+
+# (description, pane html, pane text or None to derive it from the html, expected numbers)
+FIXTURES = [
+    ("data-item-id landline",
+     '<button data-item-id="phone:tel:02612345678" aria-label="Phone: 0261 234 5678"><div>0261 234 5678</div></button>',
+     None, ["+912612345678"]),
+    ("data-item-id with +91",
+     '<button data-item-id="phone:tel:+919876543210"><div>+91 98765 43210</div></button>',
+     None, ["+919876543210"]),
+    ("tel: link wins over text order",
+     '<div>Call 0261 2470000</div><a href="tel:09876543210">Call</a>',
+     None, ["+919876543210", "+912612470000"]),
+    ("tel: link for a foreign number", '<a href="tel:+14155552671">Call</a>', None, ["+14155552671"]),
+    ("mobile with trunk 0", "", "Surat, Gujarat 395007\n098765 43210", ["+919876543210"]),
+    ("mobile, bare 10 digits", "", "Mobile 9876543210", ["+919876543210"]),
+    ("mobile, 0091 prefix", "", "0091 98765 43210", ["+919876543210"]),
+    ("mobile, 91 without plus", "", "91-98765-43210", ["+919876543210"]),
+    ("STD landline with hyphen", "", "0261-2345678", ["+912612345678"]),
+    ("STD landline with parentheses", "", "(0261) 2345678", ["+912612345678"]),
+    ("metro landline", "", "022 2659 1234", ["+912226591234"]),
+    ("landline starting 7 (Ahmedabad)", "", "079 2658 1234", ["+917926581234"]),
+    ("toll-free", "", "1800 123 4567", ["+9118001234567"]),
+    ("pincode glued to the number", "", "Gujarat 395007 98765 43210", ["+919876543210"]),
+    ("several numbers", "", "+91 98765 43210, 0261 2470000\n97250 11111", ["+919876543210", "+912612470000", "+919725011111"]),
+    ("duplicates across formats", '<a href="tel:+919876543210">x</a>', "098765 43210", ["+919876543210"]),
+    ("pincode alone", "", "Vesu, Surat, Gujarat 395007", []),
+    ("landline without its 0", "", "Plot 2612345678", []),
+    ("ID-like digits", "", "Order 1234567890", []),
+    ("repeated digits", "", "9999999999", []),
+    ("coordinates", "", "21.1702401, 72.8310045", []),
+    ("rating and review count", "", "4.5 (1,234) · 12 years in business", []),
+    ("foreign number in text", "", "+1 415 555 2671", []),
+    ("opening hours", "", "Open ⋅ Closes 7 pm\nMonday 9:30 am–7 pm", []),
+    ("limit", "", "98765 43210\n97250 11111\n99090 22222\n90990 33333",
+     ["+919876543210", "+919725011111", "+919909022222"]),
+]
+
+
+def check_fixtures():
+    failures = 0
+    for description, html, text, expected in FIXTURES:
+        got = phone_parser.extract_phones(html, text)
+        if got != expected:
+            failures += 1
+            print(f"❌ {description}: expected {expected}, got {got}")
+    print(f"{len(FIXTURES) - failures}/{len(FIXTURES)} fixtures passed")
+    return failures == 0
+
+
+# --- previous implementation, kept here as the baseline ---
+
+def legacy_find_phone(pane_source):
+    phone_patterns = [
+        r'Phone[:\s]*([+\d\s\-]{10,20})',
+        r'\+91\s*\d{5}\s*\d{5}',
+        r'\b\d{5}\s*\d{5}\b',
+        r'tel:([+\d]+)',
+        r'\b0\d{2,4}[-\s]+\d{6,8}\b',
+        r'\b\d{4}[-\s]+\d{7}\b'
+    ]
+    for pattern in phone_patterns:
+        for match in re.findall(pattern, pane_source, re.IGNORECASE):
+            if isinstance(match, tuple):
+                match = match[0]
+            clean_num = re.sub(r'\D', '', str(match))
+            if len(clean_num) >= 10:
+                if len(clean_num) > 10 and clean_num.startswith('91'):
+                    clean_num = clean_num[2:]
+                if len(clean_num) >= 10:
+                    return f"{clean_num[:5]} {clean_num[5:]}"
+    return None
+
+
+# --- pane corpus ---
+
+REVIEW = ('<div class="jftiEf fontBodyMedium" data-review-id="{i}"><div class="d4r55">Reviewer {i}</div>'
+          '<span class="kvMYJc" role="img" aria-label="5 stars"></span><span class="wiI7pd">Great team, delivered '
+          'our project on time. Highly recommended for web and app development in Surat.</span></div>')
+
+
+def synthetic_panes(count, seed=7):
+    """Pane innerHTML shaped like Maps: header, info buttons, a phone in one of several formats, reviews."""
+    rng = random.Random(seed)
+    companies = build_corpus(["Adajan", "Vesu", "Athwa"], per_area=max(1, count // 3 + 1), seed=seed)["companies"]
+    panes = []
+    for c in companies[:count]:
+        digits = c["phone"].replace(" ", "")
+        style = rng.choice(["button", "tel", "landline", "plus91", "none"])
+        phone_html = {
+            "button": f'<button data-item-id="phone:tel:0{digits}" aria-label="Phone: 0{c["phone"]}"><div class="Io6YTe">0{c["phone"]}</div></button>',
+            "tel": f'<a href="tel:+91{digits}">Call</a>',
+            "landline": '<div class="Io6YTe">0261 2345678</div>',
+            "plus91": f'<div class="Io6YTe">+91 {c["phone"]}</div>',
+            "none": "",
+        }[style]
+        reviews = "".join(REVIEW.format(i=i) for i in range(rng.randint(20, 60)))
+        panes.append(
+            f'<div class="lMbq3e"><h1 class="DUwDvf fontHeadlineLarge">{c["name"]}</h1>'
+            f'<div class="F7nice"><span aria-hidden="true">4.{rng.randint(0, 9)}</span><span>(1{rng.randint(0, 99)})</span></div></div>'
+            f'<div class="m6QErb"><button data-item-id="address"><div class="Io6YTe">{c["address"]}</div></button>'
+            f'{phone_html}<a data-item-id="authority" href="{c["website"] or ""}">website</a>'
+            f'<div class="OqCZI">Open ⋅ Closes 7 pm</div></div><div class="m6QErb DxyBCb">{reviews}</div>'
+        )
+    return panes
+
+
+def load_html_dir(directory):
+    panes = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, encoding="utf-8", errors="ignore") as fh:
+            panes.append(fh.read())
+    return panes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--panes", type=int, default=150, help="Synthetic panes to generate")
+    parser.add_argument("--html-dir", help="Directory of saved pane HTML files to use instead")
+    parser.add_argument("--number", type=int, default=5, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    ok = check_fixtures()
+
+    panes = load_html_dir(args.html_dir) if args.html_dir else synthetic_panes(args.panes)
+    old_t = timeit.timeit(lambda: [legacy_find_phone(p) for p in panes], number=args.number)
+    new_t = timeit.timeit(lambda: [phone_parser.extract_phones(p) for p in panes], number=args.number)
+    calls = len(panes) * args.number
+    found_old = sum(1 for p in panes if legacy_find_phone(p))
+    found_new = sum(1 for p in panes if phone_parser.extract_phones(p))
+    print(f"\n{len(panes)} panes ({sum(len(p) for p in panes) / 1024:.0f} KB)")
+    print(f"{'':<18}{'µs/pane':>10}{'with a phone':>14}")
+    print(f"{'six regexes':<18}{old_t / calls * 1e6:>10.1f}{found_old:>14}")
+    print(f"{'phone_parser':<18}{new_t / calls * 1e6:>10.1f}{found_new:>14}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Multi-process check of the work queue: leases, heartbeats, results, re-issue after a killed worker.
+
+    python benchmark/queue_check.py
+    python benchmark/queue_check.py --workers 6 --units 20 --cards 30
+
+Starts real worker processes (worker.Worker) on a temporary queue. Their units
+are scraped by a stand-in that "finds" one company per card, so no browser is
+needed. One worker is killed with SIGKILL mid-lease; its unit must be re-issued
+once the lease expires and finished by another worker from the results it had
+already pushed. Exits non-zero if any card is missing or duplicated.
+"""
+import os
+import sys
+import time
+import signal
+import logging
+import tempfile
+import argparse
+import multiprocessing
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from work_queue import WorkQueue  # noqa: E402
+from worker import Worker  # noqa: E402
+
+CARD_SECONDS = 0.05
+
+
+def fake_unit(unit, journal, progress_callback, cancel_token):
+    area = unit["params"]["area"]
+    target = unit["params"]["target"]
+    done = unit["resume"]["done_cards"]
+    for card in range(target):
+        if card in done:
+            continue
+        if cancel_token.sleep(CARD_SECONDS):
+            return False
+        journal.record_company(area, card, {"Area": area, "Company Name": f"{area} company {card}"})
+        progress_callback({"processed": card + 1, "total": target})
+    journal.complete_area(area)
+    return True
+
+
+def work(path, run_id, lease_seconds):
+    logging.basicConfig(level=logging.WARNING)
+    queue = WorkQueue(path, lease_seconds=lease_seconds)
+    Worker(queue, run_id=run_id, runner=fake_unit, poll=0.2).run()
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--units", type=int, default=12)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--lease-seconds", type=float, default=2.0)
+    parser.add_argument("--kill-after", type=float, default=0.5, help="Seconds before one worker is SIGKILLed")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="queue-check-"), "work_queue.db")
+    run_id = "check"
+    queue = WorkQueue(path, lease_seconds=args.lease_seconds)
+    queue.add_units(run_id, [(f"Area{i}", {"area": f"Area{i}", "target": args.cards}) for i in range(args.units)])
+
+    start = time.perf_counter()
+    procs = [multiprocessing.Process(target=work, args=(path, run_id, args.lease_seconds)) for _ in range(args.workers)]
+    for proc in procs:
+        proc.start()
+    time.sleep(args.kill_after)
+    victim = procs[0]
+    os.kill(victim.pid, signal.SIGKILL)
+    print(f"💀 Killed worker {victim.pid} after {args.kill_after}s")
+
+    seq = 0
+    results = []
+    reissued = 0
+    while True:
+        batch = queue.results_since(run_id, seq)
+        if batch:
+            seq = batch[-1][0]
+            results.extend(batch)
+        reissued += queue.reissue_expired(run_id)
+        if not queue.pending(run_id):
+            break
+        time.sleep(0.2)
+    results.extend(queue.results_since(run_id, seq))
+    elapsed = time.perf_counter() - start
+    for proc in procs:
+        proc.join(timeout=10)
+
+    units = queue.units(run_id)
+    cards = Counter((unit_id, card) for _, unit_id, card, _, _ in results)
+    missing = args.units * args.cards - len(cards)
+    duplicated = sum(n - 1 for n in cards.values() if n > 1)
+    statuses = Counter(u["status"] for u in units)
+    print(f"{args.units} units × {args.cards} cards on {args.workers} workers in {elapsed:.1f}s")
+    print(f"units: {dict(statuses)}, leases: {sum(u['attempts'] for u in units)}, "
+          f"re-issued by the coordinator: {reissued}")
+    print(f"results: {len(results)}, missing cards: {missing}, duplicated cards: {duplicated}")
+    queue.close()
+    ok = statuses.get("done") == args.units and not missing and not duplicated
+    print("✅ ok" if ok else "❌ failed")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Offline scraper benchmark against a local fake Maps and fake company websites.
+
+    python benchmark/run_benchmark.py --mode web --per-area 40 --latency-ms 80
+    python benchmark/run_benchmark.py --mode maps --areas Adajan Vesu --json after.json --baseline before.json
+
+"web" runs only the website/email stage (no browser needed); "maps" runs the
+full run_scraper pipeline in headless Chrome through the local proxy.
+Everything runs inside a temporary directory, so no journal, store or results
+file touches the working tree.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb(who="self"):
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / divisor, 1)
+
+
+def run_web(scraper, corpus, workers):
+    def enrich(company):
+        if company["website"]:
+            website, emails = company["website"], scraper.extract_emails_from_url(company["website"], company_name=company["name"])
+        else:
+            website, emails = scraper.auto_find_website_and_email(company["name"], company["area"])
+        return website, ", ".join(emails) if emails else "Not Found"
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(enrich, corpus["companies"]))
+
+    return [
+        {"Company Name": c["name"], "Website": website, "Email (Website)": email}
+        for c, (website, email) in zip(corpus["companies"], results)
+    ]
+
+
+def run_maps(scraper, args):
+    from result_reader import load_results
+    scraper.CONFIG["TARGET_PER_AREA_MIN"] = args.per_area
+    scraper.CONFIG["BROWSER_INSTANCES"] = args.workers
+    scraper.CONFIG["HEADLESS"] = True
+    filename = scraper.run_scraper(args.areas, args.city, category="it")
+    if not filename:
+        return []
+    return load_results(filename).to_dict("records")
+
+
+def expected_emails(corpus):
+    found = 0
+    for c in corpus["companies"]:
+        site = corpus["sites"].get(c["site_host"]) if c["site_host"] else None
+        if site and (site["home_emails"] or site["contact_emails"]):
+            found += 1
+    return found
+
+
+def build_report(args, corpus, rows, elapsed, fake):
+    requests = fake.stats()
+    processed = len(rows) or 1
+    with_email = sum(1 for r in rows if r.get("Email (Website)", "Not Found") not in ("Not Found", "", None))
+    report = {
+        "mode": args.mode,
+        "areas": args.areas,
+        "companies": len(rows),
+        "elapsed_s": round(elapsed, 2),
+        "companies_per_min": round(len(rows) / elapsed * 60, 1) if elapsed else None,
+        "web_requests": requests["web"],
+        "site_requests": requests["web"] - requests["dead"],
+        "dead_host_requests": requests["dead"],
+        "head_requests": requests["head"],
+        "throttled_responses": requests["throttled"],
+        "maps_requests": requests["maps"],
+        "maps_blocked": requests["maps_blocked"],
+        # Enrichment cost (requests that reached a company site) apart from guessed domains that do not exist
+        "requests_per_company": round((requests["web"] - requests["dead"]) / processed, 1),
+        "dead_probes_per_company": round(requests["dead"] / processed, 1),
+        "emails_found": with_email,
+        "emails_expected": expected_emails(corpus),
+        "peak_rss_mb": peak_rss_mb("self"),
+        "peak_child_rss_mb": peak_rss_mb("children"),
+    }
+    return report
+
+
+def print_report(report, baseline=None):
+    print(f"\n{'metric':<22}{'value':>12}" + (f"{'baseline':>12}{'change':>10}" if baseline else ""))
+    for key, value in report.items():
+        if isinstance(value, (list, str)) or value is None:
+            continue
+        line = f"{key:<22}{value:>12}"
+        base = (baseline or {}).get(key)
+        if isinstance(base, (int, float)):
+            change = f"{(value - base) / base * 100:+.0f}%" if base else "n/a"
+            line += f"{base:>12}{change:>10}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mode", choices=["web", "maps"], default="web")
+    parser.add_argument("--areas", nargs="+", default=["Adajan", "Vesu"])
+    parser.add_argument("--city", default="Surat")
+    parser.add_argument("--per-area", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=2, help="Parallel areas (maps) or companies (web)")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=50)
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="Share of website requests answered 503 or dropped")
+    parser.add_argument("--host-limit", type=float, default=None, help="Requests/second a site accepts before answering 429")
+    parser.add_argument("--maps-blocks", type=int, default=0, help="Maps searches answered with the unusual-traffic page first")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Write the report to this file")
+    parser.add_argument("--baseline", help="Earlier --json report to compare against")
+    parser.add_argument("--verbose", action="store_true", help="Show the scraper's own output")
+    args = parser.parse_args()
+
+    invoked_from = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="scraper-bench-")
+    os.chdir(workdir)  # scraper.log, journals and results all land here
+
+    import scraper
+    import email_scoring
+    from scraper_logging import setup_logging
+    from corpus import build_corpus
+    from fake_web import FakeWeb, MAPS_BASE_URL
+
+    corpus = build_corpus(args.areas, per_area=args.per_area, seed=args.seed)
+    fake = FakeWeb(
+        corpus,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        failure_rate=args.failure_rate,
+        host_limit=args.host_limit,
+        maps_blocks=args.maps_blocks,
+        seed=args.seed,
+    ).start()
+    scraper.set_proxy(fake.proxy_url)
+    # Everything goes to one proxy, so one connection pool must cover every crawl thread: per worker,
+    # its own crawl plus MAX_THREADS domain guesses. Guesses still running from the previous company
+    # can push past that, so the pool blocks instead of opening connections it would then discard.
+    pool_size = args.workers * (scraper.MAX_THREADS + 1)
+    for scheme in ("http://", "https://"):
+        scraper.session.mount(scheme, HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True))
+    scraper.CONFIG["MAPS_BASE_URL"] = MAPS_BASE_URL
+    scraper.BROWSER_POOL.cooldown_base = 2.0  # Seconds, not minutes, offline
+    # No DNS offline: only the corpus' own mail domains "have MX records"
+    mail_domains = {host.replace("www.", "").split(".")[0] + ".com" for host in corpus["sites"]}
+    email_scoring.set_resolver(lambda domain: domain in mail_domains)
+
+    print(f"🧪 {args.mode} benchmark: {len(corpus['companies'])} companies, {len(corpus['sites'])} sites, workdir {workdir}")
+    setup_logging(console_level=None if args.verbose else "WARNING")
+    start = time.perf_counter()
+    try:
+        rows = run_web(scraper, corpus, args.workers) if args.mode == "web" else run_maps(scraper, args)
+    finally:
+        fake.stop()
+    elapsed = time.perf_counter() - start
+
+    report = build_report(args, corpus, rows, elapsed, fake)
+    baseline = None
+    if args.baseline:
+        with open(os.path.join(invoked_from, args.baseline)) as fh:
+            baseline = json.load(fh)
+    print_report(report, baseline)
+
+    if args.json:
+        path = os.path.join(invoked_from, args.json)
+        with open(path, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\n📝 Report written to {path}")
+
+
+if __name__ == "__main__":
+    main()
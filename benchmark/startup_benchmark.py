@@ -0,0 +1,85 @@
+"""Startup-time guard for the web app.
+
+    python benchmark/startup_benchmark.py            # median of 5 cold imports of app.py
+    python benchmark/startup_benchmark.py --max-seconds 1.0
+
+Each run imports app in a fresh interpreter inside a temporary directory.
+Exits non-zero if the median import time exceeds --max-seconds, or if importing
+app pulled in any of HEAVY_MODULES (those must load only when a scrape or a
+results view needs them). Use it in CI or before merging import changes.
+"""
+import os
+import sys
+import json
+import tempfile
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["selenium", "webdriver_manager", "bs4", "pandas", "pyarrow", "openpyxl", "requests", "scraper"]
+
+PROBE = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_once(workdir):
+    probe = PROBE.format(root=ROOT, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", probe], cwd=workdir, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(workdir, top=10):
+    """Top self-time entries from python -X importtime."""
+    probe = f"import sys; sys.path.insert(0, {ROOT!r}); import app"
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", probe], cwd=workdir, capture_output=True, text=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if the median import time is above this")
+    parser.add_argument("--profile", action="store_true", help="Show the slowest imports (python -X importtime)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="app-startup-")
+    results = [measure_once(workdir) for _ in range(args.runs)]
+    times = [r["seconds"] for r in results]
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"import app: median {statistics.median(times) * 1000:.0f} ms, "
+          f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms over {args.runs} runs")
+
+    if args.profile:
+        print(f"\n{'cumulative ms':>14}{'self ms':>10}  module")
+        for cumulative, own, name in slowest_imports(workdir):
+            print(f"{cumulative / 1000:>14.1f}{own / 1000:>10.1f}  {name}")
+
+    failed = False
+    if loaded:
+        print(f"❌ Heavy modules imported at startup: {', '.join(loaded)}")
+        failed = True
+    if args.max_seconds is not None and statistics.median(times) > args.max_seconds:
+        print(f"❌ Median startup {statistics.median(times):.2f}s is above the {args.max_seconds:.2f}s budget")
+        failed = True
+    if not failed:
+        print("✅ Startup within budget")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import time
+import threading
+
+
+class CancelToken:
+    """Cooperative stop signal for a run: explicit cancel() or a time budget running out."""
+
+    def __init__(self, budget=None, parent=None):
+        self.parent = parent
+        self.deadline = time.monotonic() + budget if budget else None
+        if parent and parent.deadline and (self.deadline is None or parent.deadline < self.deadline):
+            self.deadline = parent.deadline
+        self._event = threading.Event()
+        self._reason = None
+
+    def child(self, budget=None):
+        return CancelToken(budget=budget, parent=self)
+
+    def cancel(self, reason="cancelled"):
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    def cancelled(self):
+        if self._event.is_set():
+            return True
+        if self.parent and self.parent.cancelled():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def reason(self):
+        if self._event.is_set():
+            return self._reason
+        if self.parent and self.parent.cancelled():
+            return self.parent.reason
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return "deadline"
+        return None
+
+    def remaining(self):
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def sleep(self, seconds):
+        """Sleep that wakes early on cancel; returns True if the token is cancelled."""
+        end = time.monotonic() + seconds
+        while not self.cancelled():
+            left = end - time.monotonic()
+            if left <= 0:
+                return False
+            self._event.wait(min(left, 0.25))
+        return True
@@ -0,0 +1,96 @@
+import sqlite3
+import threading
+from datetime import datetime
+from name_match import normalize_name
+
+
+def claim_keys(place_id=None, name=None):
+    # The place ID alone when there is one: chain branches share a normalized name
+    if place_id:
+        return [f"place:{place_id}"]
+    name_key = normalize_name(name) if name and name != "Not Found" else ""
+    return [f"name:{name_key}"] if name_key else []
+
+
+class ClaimRegistry:
+    """Businesses already taken by an area worker in this run, keyed by place ID (normalized name without one).
+
+    In memory by default. With a path, claims live in SQLite so several
+    processes working on the same run share them.
+    """
+
+    def __init__(self, run_id="", path=None):
+        self.run_id = run_id
+        self._lock = threading.Lock()
+        self._claims = {}
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS claims (
+                    run_id TEXT,
+                    key TEXT,
+                    owner TEXT,
+                    claimed_at TEXT,
+                    PRIMARY KEY (run_id, key)
+                )
+            """)
+
+    def claim(self, place_id=None, name=None, owner=None):
+        """True if the caller may process this business (unclaimed, or already its own)."""
+        keys = claim_keys(place_id, name)
+        if not keys:
+            return True
+        with self._lock:
+            if self._conn is None:
+                if any(self._claims.get(k, owner) != owner for k in keys):
+                    return False
+                for k in keys:
+                    self._claims[k] = owner
+                return True
+            return self._claim_db(keys, owner)
+
+    def _claim_db(self, keys, owner):
+        now = datetime.now().isoformat(timespec="seconds")
+        # IMMEDIATE takes the write lock up front, so check-then-insert is atomic across processes
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            marks = ",".join("?" * len(keys))
+            rows = self._conn.execute(
+                f"SELECT owner FROM claims WHERE run_id = ? AND key IN ({marks})", (self.run_id, *keys)
+            ).fetchall()
+            if any(row[0] != owner for row in rows):
+                self._conn.execute("ROLLBACK")
+                return False
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO claims (run_id, key, owner, claimed_at) VALUES (?, ?, ?, ?)",
+                [(self.run_id, k, owner, now) for k in keys]
+            )
+            self._conn.execute("COMMIT")
+            return True
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def release(self, place_id=None, name=None, owner=None):
+        """Give a business back, e.g. when its card could not be opened, so another area may try."""
+        keys = claim_keys(place_id, name)
+        with self._lock:
+            if self._conn is None:
+                for k in keys:
+                    if self._claims.get(k) == owner:
+                        del self._claims[k]
+                return
+            marks = ",".join("?" * len(keys))
+            if keys:
+                self._conn.execute(
+                    f"DELETE FROM claims WHERE run_id = ? AND owner = ? AND key IN ({marks})",
+                    (self.run_id, owner, *keys)
+                )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
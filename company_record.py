@@ -0,0 +1,70 @@
+from typing import List, Optional
+
+NOT_FOUND = "Not Found"
+
+
+def found(value):
+    """None for the "Not Found" / empty sentinels the page helpers return, else the value."""
+    return None if value in (None, "", NOT_FOUND) else value
+
+
+def _split(joined):
+    return [part.strip() for part in joined.split(",") if part.strip()] if joined else []
+
+
+class CompanyRecord:
+    """One scraped business as it moves through the pipeline.
+
+    Missing fields are None and phones/emails are lists; the display columns
+    ("Phone (Maps)", "Not Found", comma-joined lists) only exist in to_row(),
+    which is called once where a record leaves for the journal, store or writer.
+    """
+
+    __slots__ = ("name", "area", "address", "phones", "website", "emails", "source", "place_id")
+
+    name: str
+    area: str
+    address: Optional[str]
+    phones: List[str]          # E.164, most reliable first
+    website: Optional[str]
+    emails: List[str]
+    source: Optional[str]      # Where the website came from: "maps" or "backup" (domain search)
+    place_id: Optional[str]
+
+    def __init__(self, name, area="", address=None, phones=None, website=None, emails=None, source=None, place_id=None):
+        self.name = name
+        self.area = area
+        self.address = address
+        self.phones = phones if phones is not None else []
+        self.website = website
+        self.emails = emails if emails is not None else []
+        self.source = source
+        self.place_id = place_id
+
+    def __repr__(self):
+        return f"CompanyRecord({self.name!r}, area={self.area!r}, website={self.website!r}, emails={self.emails!r})"
+
+    def to_row(self):
+        return {
+            "Area": self.area,
+            "Company Name": self.name,
+            "Address": self.address or NOT_FOUND,
+            "Phone (Maps)": ", ".join(self.phones) if self.phones else NOT_FOUND,
+            "Website": self.website or NOT_FOUND,
+            "Email (Website)": ", ".join(self.emails) if self.emails else NOT_FOUND,
+        }
+
+    @classmethod
+    def from_row(cls, row, area=None, place_id=None):
+        """Record for a row written by to_row(), e.g. from a run journal or the company store."""
+        emails = found(row.get("Email (Website)"))
+        phones = found(row.get("Phone (Maps)"))
+        return cls(
+            name=row.get("Company Name", ""),
+            area=area if area is not None else row.get("Area", ""),
+            address=found(row.get("Address")),
+            phones=_split(phones),
+            website=found(row.get("Website")),
+            emails=_split(emails),
+            place_id=place_id,
+        )
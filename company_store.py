@@ -0,0 +1,112 @@
+import re
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from name_match import normalize_name
+
+STORE_PATH = "company_store.db"
+
+
+def phone_digits(phone):
+    # First number of a joined list; the last 10 digits match "+91..." and "0..." forms alike
+    digits = re.sub(r"\D", "", (phone or "").split(",")[0])
+    return digits[-10:] if len(digits) >= 10 else ""
+
+
+def website_host(url):
+    if not url or url == "Not Found":
+        return ""
+    host = re.sub(r"^https?://", "", url.strip().lower()).split("/")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+class CompanyStore:
+    """Persistent SQLite store of every company seen, for incremental re-scrapes."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS companies (
+                key TEXT PRIMARY KEY,
+                place_id TEXT,
+                name_key TEXT,
+                maps_website TEXT,
+                maps_phone TEXT,
+                data TEXT,
+                first_seen TEXT,
+                last_seen TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_companies_place ON companies(place_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name_key)")
+        self._conn.commit()
+
+    def lookup(self, place_id=None, name=None):
+        with self._lock:
+            row = None
+            if place_id:
+                row = self._conn.execute(
+                    "SELECT key, maps_website, maps_phone, data FROM companies WHERE place_id = ?", (place_id,)
+                ).fetchone()
+            name_key = normalize_name(name)
+            if row is None and name_key:
+                # A card with a place ID only matches rows stored without one: chain branches share a name
+                query = "SELECT key, maps_website, maps_phone, data FROM companies WHERE name_key = ?"
+                if place_id:
+                    query += " AND (place_id IS NULL OR place_id = '')"
+                row = self._conn.execute(query + " ORDER BY last_seen DESC", (name_key,)).fetchone()
+        if row is None:
+            return None
+        return {"key": row[0], "maps_website": row[1], "maps_phone": row[2], "data": json.loads(row[3])}
+
+    @staticmethod
+    def has_changed(record, listing):
+        # Only compare fields the listing card actually showed
+        website = website_host(listing.get("website"))
+        if website and website != record["maps_website"]:
+            return True
+        phone = phone_digits(listing.get("phone"))
+        if phone and phone != record["maps_phone"]:
+            return True
+        return False
+
+    def upsert(self, company, place_id=None, listing=None):
+        listing = listing or {}
+        name_key = normalize_name(company.get("Company Name"))
+        if not place_id and not name_key:
+            return
+        key = place_id or f"{name_key}|{normalize_name(company.get('Address'))}"
+        now = datetime.now().isoformat(timespec="seconds")
+        maps_website = website_host(listing.get("website") or company.get("Website"))
+        maps_phone = phone_digits(listing.get("phone") or company.get("Phone (Maps)"))
+        data = {k: v for k, v in company.items() if k != "Area"}
+
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO companies (key, place_id, name_key, maps_website, maps_phone, data, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    place_id = COALESCE(excluded.place_id, place_id),
+                    name_key = excluded.name_key,
+                    maps_website = excluded.maps_website,
+                    maps_phone = excluded.maps_phone,
+                    data = excluded.data,
+                    last_seen = excluded.last_seen
+            """, (key, place_id, name_key, maps_website, maps_phone, json.dumps(data, ensure_ascii=False), now, now))
+            self._conn.commit()
+
+    def touch(self, key):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE companies SET last_seen = ? WHERE key = ?",
+                (datetime.now().isoformat(timespec="seconds"), key)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,199 @@
+import re
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import matchers
+from name_match import normalize_name
+
+try:
+    import dns.resolver
+    import dns.exception
+except ImportError:
+    dns = None
+
+log = logging.getLogger(__name__)
+
+MAX_EMAILS = 3
+MX_WORKERS = 8
+MX_TIMEOUT = 3.0
+
+# Best first: the inboxes a business actually reads for enquiries
+ROLE_PREFIXES = ["contact", "info", "sales", "enquiry", "enquiries", "inquiry", "hello", "business",
+                 "support", "office", "admin", "hr", "careers", "jobs"]
+NO_REPLY = re.compile(r"^(no-?reply|do-?not-?reply|mailer-daemon|postmaster|abuse)\b")
+FREE_MAIL = {"gmail.com", "yahoo.com", "yahoo.co.in", "yahoo.in", "outlook.com", "hotmail.com", "live.com",
+             "rediffmail.com", "icloud.com", "protonmail.com", "zoho.com", "aol.com"}
+# Asset names that the address regex picks up from srcset/URLs: name@2x.png, bundle@1.2.3.min.js
+FILE_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "svg", "webp", "ico", "bmp", "js", "css", "map", "json",
+                   "php", "html", "htm", "xml", "pdf", "woff", "woff2", "ttf", "mp4"}
+LOCAL_PART = re.compile(r"^[a-z0-9](?:[a-z0-9_.+-]{0,62}[a-z0-9_+-])?$")
+DOMAIN_LABEL = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$")
+TLD = re.compile(r"^[a-z]{2,24}$")
+
+SITE_DOMAIN = 3       # Same registered domain as the company website
+NAME_DOMAIN = 2       # Domain spells the company name
+FREE_MAIL_DOMAIN = 1
+
+
+def normalize_email(email):
+    """Lowercased address with mailto/trailing punctuation stripped, or None if it is not a usable address."""
+    if not email:
+        return None
+    email = email.strip().lower().strip(".,;:'\"<>()[]")
+    if email.count("@") != 1:
+        return None
+    local, domain = email.split("@")
+    labels = domain.split(".")
+    if (not LOCAL_PART.match(local) or ".." in local or len(labels) < 2
+            or not all(DOMAIN_LABEL.match(label) for label in labels)):
+        return None
+    tld = labels[-1]
+    if not TLD.match(tld) or tld in FILE_EXTENSIONS:
+        return None
+    if matchers.EMAIL_JUNK.search(email) or NO_REPLY.match(local):
+        return None
+    return email
+
+
+def site_domain(url):
+    """Host of a website URL without www., e.g. "acme.co.in"."""
+    if not url or url == "Not Found":
+        return ""
+    host = re.sub(r"^[a-z]+://", "", url.strip().lower()).split("/")[0].split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+def _same_site(domain, site):
+    return bool(site) and (domain == site or domain.endswith("." + site) or site.endswith("." + domain))
+
+
+def score_email(email, site="", name_key=""):
+    """(domain score, role score) for a normalized address; higher is better, compared in that order."""
+    local, domain = email.split("@")
+    domain_score = 0
+    if _same_site(domain, site):
+        domain_score = SITE_DOMAIN
+    elif name_key and len(name_key) >= 4 and name_key in domain.replace("-", ""):
+        domain_score = NAME_DOMAIN
+    elif domain in FREE_MAIL:
+        domain_score = FREE_MAIL_DOMAIN
+    role_score = 0
+    for rank, prefix in enumerate(ROLE_PREFIXES):
+        if local == prefix or local.startswith(prefix + ".") or local.startswith(prefix + "_"):
+            role_score = len(ROLE_PREFIXES) - rank
+            break
+    return domain_score, role_score
+
+
+class MXChecker:
+    """Cached, batched check that an email domain can receive mail.
+
+    resolver(domain) returns True (has MX, or an A record as implicit MX), False
+    (does not exist / no mail host) or None (unknown: timeout, no resolver).
+    Unknown domains are kept, and are not cached so a later run can retry them.
+    """
+
+    def __init__(self, resolver=None, workers=MX_WORKERS):
+        self.resolver = resolver if resolver is not None else default_resolver()
+        self.workers = workers
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def deliverable(self, domains):
+        """{domain: True/False/None} for a batch of domains, resolving the uncached ones in parallel."""
+        domains = set(domains)
+        with self._lock:
+            results = {d: self._cache[d] for d in domains if d in self._cache}
+        pending = [d for d in domains if d not in results]
+        if pending and self.resolver:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+                resolved = dict(zip(pending, executor.map(self._resolve, pending)))
+            with self._lock:
+                self._cache.update({d: ok for d, ok in resolved.items() if ok is not None})
+            results.update(resolved)
+        return {d: results.get(d) for d in domains}
+
+    def _resolve(self, domain):
+        try:
+            return self.resolver(domain)
+        except Exception as e:
+            log.debug(f"MX lookup failed for {domain}: {e}")
+            return None
+
+
+def dns_resolver(domain):
+    """MX lookup with dnspython, falling back to an A record (RFC 5321 implicit MX)."""
+    resolver = dns.resolver.Resolver()
+    resolver.lifetime = MX_TIMEOUT
+    try:
+        return bool(resolver.resolve(domain, "MX"))
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
+        return False
+    except dns.resolver.NoAnswer:
+        pass
+    except dns.exception.Timeout:
+        return None
+    try:
+        return bool(resolver.resolve(domain, "A"))
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.NoNameservers):
+        return False
+    except dns.exception.Timeout:
+        return None
+
+
+def default_resolver():
+    if dns is None:
+        log.warning("dnspython not installed; email domains are not MX-checked (pip install dnspython)")
+        return None
+    return dns_resolver
+
+
+_checker = None
+_checker_lock = threading.Lock()
+
+
+def get_mx_checker():
+    global _checker
+    with _checker_lock:
+        if _checker is None:
+            _checker = MXChecker()
+        return _checker
+
+
+def set_resolver(resolver):
+    """Swap the MX resolver (e.g. a stub for offline benchmarks); clears the cache."""
+    global _checker
+    with _checker_lock:
+        _checker = MXChecker(resolver=resolver)
+
+
+def best_emails(emails, website=None, company_name=None, limit=MAX_EMAILS, verify_mx=True):
+    """Usable addresses from a crawl, best first.
+
+    Artefacts, junk and no-reply addresses are dropped. The rest is ranked by domain
+    (company site > company-name domain > free mail > anything else), then role
+    prefix (contact, info, sales, ...), then length. Third-party domains are only
+    kept when nothing better was found. With verify_mx, domains that cannot
+    receive mail are dropped.
+    """
+    site = site_domain(website)
+    name_key = normalize_name(company_name)
+    scored = {}
+    for email in emails or ():
+        email = normalize_email(email)
+        if email and email not in scored:
+            scored[email] = score_email(email, site, name_key)
+    if not scored:
+        return []
+
+    ranked = sorted(scored, key=lambda e: (-scored[e][0], -scored[e][1], len(e), e))
+    if scored[ranked[0]][0]:
+        ranked = [e for e in ranked if scored[e][0]]
+
+    if verify_mx:
+        checker = get_mx_checker()
+        if checker.resolver:
+            ok = checker.deliverable(e.split("@")[1] for e in ranked)
+            ranked = [e for e in ranked if ok[e.split("@")[1]] is not False]
+    return ranked[:limit]
@@ -0,0 +1,98 @@
+import math
+import logging
+import threading
+from collections import namedtuple
+
+log = logging.getLogger(__name__)
+
+TILE_KM = 1.5           # Edge of one tile; small enough that its feed ends well before the ~120 card cap
+MAX_TILES = 16          # Per area; larger areas get larger tiles instead
+MIN_ZOOM, MAX_ZOOM = 12, 18
+VIEWPORT_PX = 800       # Map width next to the results list in the scraper's window
+METERS_PER_PX_Z0 = 156543.03
+KM_PER_DEGREE = 111.32
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_LIMIT = (1.0, 1)   # (rate, burst): the usage policy allows one request per second
+
+
+class Tile(namedtuple("Tile", "lat lng zoom")):
+    """One map viewport of an area: centre and Maps zoom level."""
+
+    __slots__ = ()
+
+    @property
+    def label(self):
+        return f"{self.lat:.4f},{self.lng:.4f}"
+
+    def url_suffix(self):
+        return f"/@{self.lat:.6f},{self.lng:.6f},{self.zoom}z"
+
+
+def unit_name(area, tile=None):
+    """Journal / claims key of an area, or of one tile of it."""
+    return f"{area} @{tile.label}" if tile else area
+
+
+def zoom_for(tile_km, lat):
+    """Largest Maps zoom whose viewport still spans tile_km at this latitude."""
+    meters_per_px = tile_km * 1000 / VIEWPORT_PX
+    zoom = math.floor(math.log2(METERS_PER_PX_Z0 * math.cos(math.radians(lat)) / meters_per_px))
+    return max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+
+
+def tile_grid(bounds, tile_km=TILE_KM, max_tiles=MAX_TILES):
+    """Tiles covering a (south, west, north, east) box, row by row from the south-west."""
+    south, west, north, east = bounds
+    mid_lat = (south + north) / 2
+    height_km = (north - south) * KM_PER_DEGREE
+    width_km = (east - west) * KM_PER_DEGREE * math.cos(math.radians(mid_lat))
+    rows = max(1, math.ceil(height_km / tile_km))
+    cols = max(1, math.ceil(width_km / tile_km))
+    if rows * cols > max_tiles:
+        shrink = math.sqrt(max_tiles / (rows * cols))
+        rows = max(1, math.floor(rows * shrink))
+        cols = max(1, math.floor(cols * shrink))
+    zoom = zoom_for(max(height_km / rows, width_km / cols, 0.1), mid_lat)
+    step_lat = (north - south) / rows
+    step_lng = (east - west) / cols
+    return [
+        Tile(round(south + (r + 0.5) * step_lat, 6), round(west + (c + 0.5) * step_lng, 6), zoom)
+        for r in range(rows) for c in range(cols)
+    ]
+
+
+_bounds_cache = {}
+_bounds_lock = threading.Lock()
+
+
+def area_bounds(area, city, get, overrides=None, timeout=10):
+    """(south, west, north, east) of an area from overrides or OpenStreetMap's geocoder; None if unknown.
+
+    get is a requests-style GET (the scraper's rate-limited session).
+    """
+    for key in (area, area.title(), area.lower()):
+        if overrides and key in overrides:
+            return tuple(overrides[key])
+    cache_key = (area.lower(), city.lower())
+    with _bounds_lock:
+        if cache_key in _bounds_cache:
+            return _bounds_cache[cache_key]
+    bounds = None
+    try:
+        response = get(
+            NOMINATIM_URL,
+            params={"q": f"{area}, {city}", "format": "json", "limit": 1},
+            headers={"User-Agent": "company-contacts-scraper/1.0"},
+            timeout=timeout,
+        )
+        places = response.json() if response.status_code == 200 else []
+        if places:
+            # Nominatim's boundingbox is [south, north, west, east] as strings
+            south, north, west, east = (float(v) for v in places[0]["boundingbox"])
+            bounds = (south, west, north, east)
+    except Exception as e:
+        log.warning(f"⚠️ Could not geocode {area}, {city}: {e}")
+        return None
+    with _bounds_lock:
+        _bounds_cache[cache_key] = bounds
+    return bounds
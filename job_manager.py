@@ -0,0 +1,230 @@
+import json
+import uuid
+import sqlite3
+import threading
+from datetime import datetime
+from cancellation import CancelToken
+
+JOBS_PATH = "jobs.db"
+JOB_SLOTS = 2  # Jobs run at the same time; browsers are still capped by scraper.BROWSER_POOL
+LOG_LINES_KEPT = 50
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def new_progress(status="Queued"):
+    return {
+        "total": 0,
+        "processed": 0,
+        "current_area": "",
+        "log": [],
+        "status": status
+    }
+
+
+class JobManager:
+    """Persistent scrape queue drained by a fixed number of job slots."""
+
+    def __init__(self, runner, path=JOBS_PATH, slots=JOB_SLOTS, on_event=None):
+        # runner(job, progress_callback, cancel_token) -> result filename or None
+        self.runner = runner
+        self.on_event = on_event or (lambda job_id, event, data: None)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._progress = {}
+        self._tokens = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                params TEXT,
+                status TEXT,
+                resume INTEGER DEFAULT 0,
+                result_file TEXT,
+                error TEXT,
+                created_at TEXT,
+                started_at TEXT,
+                finished_at TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+        # Jobs that were running when the process died go back to the queue and resume from their journal
+        self._conn.execute("UPDATE jobs SET status = 'queued', resume = 1 WHERE status = 'running'")
+        self._conn.commit()
+
+        for i in range(slots):
+            threading.Thread(target=self._worker, name=f"job-slot-{i+1}", daemon=True).start()
+
+    # --- public API ---
+
+    def submit(self, params):
+        job_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, params, status, created_at) VALUES (?, ?, 'queued', ?)",
+                (job_id, json.dumps(params), _now())
+            )
+            self._conn.commit()
+            self._progress[job_id] = new_progress()
+            self._wakeup.notify()
+        return self.get(job_id)
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            return self._to_dict(row)
+
+    def list(self, limit=50):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC, rowid DESC LIMIT ?", (limit,)
+            ).fetchall()
+            return [self._to_dict(r) for r in rows]
+
+    def latest(self):
+        jobs = self.list(limit=1)
+        return jobs[0] if jobs else None
+
+    def has_active_jobs(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM jobs WHERE status IN ('queued', 'running') LIMIT 1"
+            ).fetchone() is not None
+
+    def active_run_ids(self):
+        """Journal run IDs that queued or running jobs write to: their own, or the run they resume."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, params FROM jobs WHERE status IN ('queued', 'running')").fetchall()
+        run_ids = set()
+        for row in rows:
+            run_ids.add(row["id"])
+            resume_run_id = json.loads(row["params"]).get("resume_run_id")
+            if resume_run_id:
+                run_ids.add(resume_run_id)
+        return run_ids
+
+    def cancel(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False, "Job not found"
+            if row["status"] == "running":
+                # Running jobs stop cooperatively and still save what they have
+                self._tokens[job_id].cancel("cancelled")
+                self._progress[job_id]["status"] = "Cancelling"
+                return True, "cancelling"
+            if row["status"] != "queued":
+                return False, f"Job is {row['status']}"
+            self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ?", (_now(), job_id)
+            )
+            self._conn.commit()
+            self._progress.setdefault(job_id, new_progress())["status"] = "Cancelled"
+        self.on_event(job_id, "complete", {"status": "Cancelled", "latest_file": None, "log": "Job cancelled"})
+        return True, "cancelled"
+
+    # --- internals ---
+
+    def _to_dict(self, row):
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["resume"] = bool(job["resume"])
+        job["progress"] = self._progress.get(job["id"]) or new_progress(job["status"].title())
+        return job
+
+    def _claim_next(self):
+        row = self._conn.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at, rowid LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute(
+            "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?", (_now(), row["id"])
+        )
+        self._conn.commit()
+        progress = self._progress.setdefault(row["id"], new_progress())
+        progress.update({"status": "Running", "current_area": "Initializing...", "log": ["Starting scraper..."]})
+        self._tokens[row["id"]] = CancelToken()
+        return self._to_dict(row)
+
+    def _worker(self):
+        while True:
+            with self._wakeup:
+                job = self._claim_next()
+                while job is None:
+                    self._wakeup.wait()
+                    job = self._claim_next()
+            self._run(job)
+
+    def _finish(self, job_id, status, result_file=None, error=None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result_file = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, result_file, error, _now(), job_id)
+            )
+            self._conn.commit()
+
+    def _run(self, job):
+        job_id = job["id"]
+        progress = self._progress[job_id]
+        self.on_event(job_id, "snapshot", job)
+
+        def progress_callback(update_data):
+            """Callback to update this job's progress from scraper"""
+            if "total" in update_data: progress["total"] = update_data["total"]
+            if "processed" in update_data: progress["processed"] = update_data["processed"]
+            if "current_area" in update_data:
+                if update_data["current_area"] != progress["current_area"]:
+                    self.on_event(job_id, "area", {"current_area": update_data["current_area"]})
+                progress["current_area"] = update_data["current_area"]
+            if "partial_file" in update_data: progress["partial_file"] = update_data["partial_file"]
+            if "metrics" in update_data: progress["metrics"] = update_data["metrics"]
+            if "status" in update_data: progress["status"] = update_data["status"]
+            if "processed" in update_data or "total" in update_data:
+                self.on_event(job_id, "progress", {
+                    "processed": progress["processed"],
+                    "total": progress["total"],
+                    "current_area": progress["current_area"]
+                })
+            if "log" in update_data:
+                progress["log"].append(update_data["log"])
+                # Keep log size manageable
+                if len(progress["log"]) > LOG_LINES_KEPT:
+                    progress["log"].pop(0)
+                self.on_event(job_id, "log", {"line": update_data["log"].replace("[POPUP]", "").strip()})
+            if update_data.get("popup"):
+                self.on_event(job_id, "popup", {
+                    "message": update_data.get("log", "").replace("[POPUP]", "").strip(),
+                    "duration": update_data.get("duration", 8000)
+                })
+
+        token = self._tokens[job_id]
+        filename = None
+        try:
+            filename = self.runner(job, progress_callback, token)
+            if token.reason == "cancelled":
+                progress["status"] = "Cancelled"
+                progress["log"].append("Scraping cancelled, partial results saved." if filename else "Scraping cancelled.")
+                self._finish(job_id, "cancelled", result_file=filename)
+            else:
+                progress["status"] = "Completed"
+                progress["log"].append("Scraping completed successfully!")
+                self._finish(job_id, "completed", result_file=filename)
+        except Exception as e:
+            progress["status"] = "Failed"
+            progress["log"].append(f"Error: {str(e)}")
+            self._finish(job_id, "failed", error=str(e))
+        finally:
+            with self._lock:
+                self._tokens.pop(job_id, None)
+            self.on_event(job_id, "complete", {
+                "status": progress["status"],
+                "latest_file": filename,
+                "log": progress["log"][-1]
+            })
@@ -0,0 +1,126 @@
+import time
+import logging
+import threading
+
+from selenium.webdriver.common.by import By
+
+log = logging.getLogger(__name__)
+
+COOLDOWN_BASE = 60.0     # Seconds new areas wait after the first block, doubling per strike
+COOLDOWN_MAX = 600.0
+RECOVER_AFTER = 3        # Clean feeds in a row before one more browser is allowed again
+MAX_RECYCLES = 2         # Fresh drivers an area tries after a block before leaving it for a resume
+SHORT_FEED_CARDS = 10    # A feed stuck below this many cards ...
+SHORT_FEED_SCROLLS = 5   # ... for this many scrolls, without the end-of-list note, is a soft block
+
+CONSENT_HOSTS = ("consent.google.", "consent.youtube.")
+# The /sorry/ interstitial and reCAPTCHA challenges Google shows to automated traffic
+BLOCK_MARKERS = (
+    "/sorry/index",
+    "unusual traffic from your computer network",
+    "our systems have detected unusual traffic",
+    "www.google.com/recaptcha/api",
+    'id="captcha-form"',
+)
+CONSENT_BUTTONS = [
+    "//form//button[.//span[contains(., 'Reject all')] or contains(., 'Reject all')]",
+    "//form//button[.//span[contains(., 'Accept all')] or contains(., 'Accept all')]",
+    "//button[@aria-label='Reject all' or @aria-label='Accept all']",
+]
+
+
+def classify_page(url, source):
+    """"consent", "captcha" or None for a Maps page given its URL and HTML."""
+    url = (url or "").lower()
+    if any(host in url for host in CONSENT_HOSTS):
+        return "consent"
+    if "/sorry/" in url:
+        return "captcha"
+    source = (source or "").lower()
+    if any(marker in source for marker in BLOCK_MARKERS):
+        return "captcha"
+    return None
+
+
+def detect_block(driver):
+    try:
+        return classify_page(driver.current_url, driver.page_source)
+    except Exception as e:
+        log.debug(f"Block check failed: {e}")
+        return None
+
+
+def accept_consent(driver, wait=3):
+    """Dismiss a cookie consent page; True if the browser is back on Maps."""
+    for xpath in CONSENT_BUTTONS:
+        try:
+            buttons = driver.find_elements(By.XPATH, xpath)
+            if buttons:
+                buttons[0].click()
+                time.sleep(wait)
+                return detect_block(driver) is None
+        except Exception:
+            continue
+    return False
+
+
+class BrowserPool:
+    """Browser slots shared by every run in the process, narrowed while Maps is blocking us.
+
+    acquire/release work like a semaphore of max_browsers. Each reported block
+    takes one slot away (down to one) and holds back new browsers for a
+    cool-down that doubles per strike; RECOVER_AFTER clean feeds in a row give a
+    slot back.
+    """
+
+    def __init__(self, max_browsers, cooldown_base=COOLDOWN_BASE, cooldown_max=COOLDOWN_MAX):
+        self.max_browsers = max_browsers
+        self.limit = max_browsers
+        self.cooldown_base = cooldown_base
+        self.cooldown_max = cooldown_max
+        self.active = 0
+        self.strikes = 0
+        self.clean = 0
+        self.cooldown_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self.active < self.limit and now >= self.cooldown_until:
+                    self.active += 1
+                    return True
+                wait = self.cooldown_until - now if self.active < self.limit else None
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    wait = min(wait, deadline - now) if wait is not None else deadline - now
+                self._cond.wait(wait)
+
+    def release(self):
+        with self._cond:
+            self.active = max(0, self.active - 1)
+            self._cond.notify_all()
+
+    def report_block(self, reason):
+        """Narrow the pool after a block; returns the cool-down in seconds."""
+        with self._cond:
+            self.strikes += 1
+            self.clean = 0
+            self.limit = max(1, self.limit - 1)
+            cooldown = min(self.cooldown_max, self.cooldown_base * 2 ** (self.strikes - 1))
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + cooldown)
+        log.warning(f"🚧 Maps block ({reason}): {self.limit} browser(s) allowed, cooling down {cooldown:.0f}s")
+        return cooldown
+
+    def report_clean(self):
+        with self._cond:
+            self.clean += 1
+            if self.clean >= RECOVER_AFTER and (self.limit < self.max_browsers or self.strikes):
+                self.clean = 0
+                self.strikes = max(0, self.strikes - 1)
+                self.limit = min(self.max_browsers, self.limit + 1)
+                self._cond.notify_all()
+                log.info(f"🟢 Maps looks clean again: {self.limit} browser(s) allowed")
@@ -0,0 +1,68 @@
+import re
+
+# Compiled once at import; the helpers in scraper.py run these per card, per URL and per email.
+
+
+def keyword_matcher(keywords):
+    """One alternation for a substring keyword list: a single scan instead of any(k in s ...)."""
+    # Longest first so a keyword never loses to its own prefix
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered))
+
+
+SOCIAL_OR_GOOGLE = keyword_matcher([
+    "facebook.com", "instagram.com", "linkedin.com",
+    "youtube.com", "google.com", "maps.google",
+    "g.page", "justdial.com", "indiamart.com", "sulekha.com"
+])
+
+GENERIC_WEBSITES = keyword_matcher([
+    "indiamart.com", "justdial.com", "tradeindia.com",
+    "sulekha.com", "quikr.com", "olx.in", "yellowpages.in",
+    "g.page", "maps.google.com", "facebook.com", "instagram.com",
+    "linkedin.com", "youtube.com", "twitter.com"
+])
+
+NON_BUSINESS = keyword_matcher([
+    "talab", "stp", "sewage", "treatment plant",
+    "community hall", "fire station", "police station",
+    "bus stop", "gate no", "unnamed road",
+    "digital seva csc", "government service",
+    "housing society", "apartment", "complex",
+    "chhath talav", "krishna park", "millenium park",
+    "shopping center", "market", "mall", "park", "garden",
+    "playground", "swimming pool", "sports complex"
+])
+STREET_ONLY_NAME = re.compile(r"^\d+\s+[a-z]+\s+(road|street|society|nagar)$")
+
+EMAIL_JUNK = keyword_matcher([
+    "bootstrap", "sentry", "example", "domain", "react", "jquery",
+    "node_modules", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp",
+    "wix", "shopify", "godaddy", "namecheap"
+])
+
+# --- text cleaning ---
+NON_TEXT_CHARS = re.compile(r"[^\x00-\x7F\u0900-\u097F]+")
+WHITESPACE = re.compile(r"\s+")
+TEXT_DISALLOWED = re.compile(r"[^\w\s.,#\-()&/'\"]")
+ADDRESS_DISALLOWED = re.compile(r"[^\w\s,.\-/()&'\"]")
+LEADING_COMMA = re.compile(r"^,\s*")
+
+# --- backup domain search ---
+DOMAIN_STOPWORDS = re.compile(
+    r"\b(pvt|ltd|llp|private|company|co|services|solutions|technologies|tech|software|systems|the)\b",
+    re.IGNORECASE
+)
+NON_ALNUM = re.compile(r"[^A-Za-z0-9\s]")
+NON_ALNUM_LOWER = re.compile(r"[^a-z0-9]")
+
+# --- result cards ---
+PLACE_ID = re.compile(r"!19s(ChIJ[\w-]+)")
+FEATURE_ID = re.compile(r"!1s(0x[0-9a-f]+:0x[0-9a-f]+)")
+CARD_PHONE = re.compile(r"(?:\+91[\s-]?)?\d{5}\s?\d{5}|0\d{2,4}[\s-]?\d{6,8}")
+PIN_CODE = re.compile(r"\d{6}")
+
+# --- website crawl ---
+EMAIL = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+CLOUDFLARE_EMAIL = re.compile(r"/cdn-cgi/l/email-protection#([a-f0-9]+)")
+CONTACT_LINK = re.compile(r"contact|about|touch|connect|reach|support", re.IGNORECASE)
@@ -0,0 +1,190 @@
+import time
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+STAGES = [
+    "driver_startup",
+    "listing",
+    "card_click",
+    "field_extraction",
+    "email_crawl",
+    "selenium_fallback",
+    "backup_search",
+    "excel_write",
+]
+
+RUNS_KEPT = 10  # Finished runs still visible in /api/metrics
+
+_runs = OrderedDict()
+_runs_lock = threading.Lock()
+
+
+class Histogram:
+    def __init__(self):
+        self.samples = []
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.samples.append(seconds)
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self):
+        return {
+            "count": len(self.samples),
+            "p50": round(self.quantile(0.5), 3),
+            "p95": round(self.quantile(0.95), 3),
+            "max": round(self.max, 3),
+            "total": round(self.total, 3),
+        }
+
+
+class RunMetrics:
+    """Timing spans and event counters for one run, aggregated per stage and per area."""
+
+    def __init__(self, run_id):
+        self.run_id = run_id
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._areas = {}
+        self._events = Counter()
+        self._area_events = {}
+
+    def count(self, event, area=None, amount=1):
+        with self._lock:
+            self._events[event] += amount
+            if area:
+                self._area_events.setdefault(area, Counter())[event] += amount
+
+    def observe(self, stage, seconds, area=None):
+        with self._lock:
+            self._stages.setdefault(stage, Histogram()).observe(seconds)
+            if area:
+                self._areas.setdefault(area, {}).setdefault(stage, Histogram()).observe(seconds)
+
+    @contextmanager
+    def span(self, stage, area=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, area)
+
+    def export(self):
+        """Raw samples and counters, for merging into another process's RunMetrics."""
+        with self._lock:
+            return {
+                "stages": {s: list(h.samples) for s, h in self._stages.items()},
+                "areas": {area: {s: list(h.samples) for s, h in stages.items()} for area, stages in self._areas.items()},
+                "events": dict(self._events),
+                "area_events": {area: dict(events) for area, events in self._area_events.items()},
+            }
+
+    def merge(self, exported):
+        """Add what another RunMetrics exported (e.g. a worker process's share of a distributed run)."""
+        with self._lock:
+            for stage, samples in exported.get("stages", {}).items():
+                histogram = self._stages.setdefault(stage, Histogram())
+                for seconds in samples:
+                    histogram.observe(seconds)
+            for area, stages in exported.get("areas", {}).items():
+                for stage, samples in stages.items():
+                    histogram = self._areas.setdefault(area, {}).setdefault(stage, Histogram())
+                    for seconds in samples:
+                        histogram.observe(seconds)
+            self._events.update(exported.get("events", {}))
+            for area, events in exported.get("area_events", {}).items():
+                self._area_events.setdefault(area, Counter()).update(events)
+
+    def summary(self):
+        with self._lock:
+            return {
+                "run_id": self.run_id,
+                "elapsed": round(time.time() - self.started, 1),
+                "stages": {s: h.summary() for s, h in _ordered(self._stages)},
+                "areas": {
+                    area: {s: h.summary() for s, h in _ordered(stages)}
+                    for area, stages in self._areas.items()
+                },
+                "events": dict(self._events),
+                "area_events": {area: dict(events) for area, events in self._area_events.items()},
+            }
+
+    def format_summary(self):
+        summary = self.summary()
+        lines = [f"{'stage':<18}{'count':>7}{'p50':>9}{'p95':>9}{'max':>9}{'total':>10}"]
+        for stage, s in summary["stages"].items():
+            lines.append(f"{stage:<18}{s['count']:>7}{s['p50']:>9.2f}{s['p95']:>9.2f}{s['max']:>9.2f}{s['total']:>10.1f}")
+        if summary["events"]:
+            lines.append("events: " + ", ".join(f"{event}={n:g}" for event, n in sorted(summary["events"].items())))
+        return "\n".join(lines)
+
+
+def _ordered(stages):
+    known = [(s, stages[s]) for s in STAGES if s in stages]
+    extra = [(s, h) for s, h in stages.items() if s not in STAGES]
+    return known + extra
+
+
+def start_run(run_id):
+    metrics = RunMetrics(run_id)
+    with _runs_lock:
+        _runs[run_id] = metrics
+        while len(_runs) > RUNS_KEPT:
+            _runs.popitem(last=False)
+    return metrics
+
+
+def get_run(run_id):
+    with _runs_lock:
+        return _runs.get(run_id)
+
+
+def all_runs():
+    with _runs_lock:
+        return list(_runs.values())
+
+
+def _labels(**labels):
+    return ",".join(f'{k}="{str(v).replace(chr(34), chr(39))}"' for k, v in labels.items())
+
+
+def prometheus_text():
+    lines = [
+        "# HELP scraper_stage_seconds Time spent per scraper stage.",
+        "# TYPE scraper_stage_seconds summary",
+    ]
+    max_lines = [
+        "# HELP scraper_stage_seconds_max Slowest single span per scraper stage.",
+        "# TYPE scraper_stage_seconds_max gauge",
+    ]
+    event_lines = [
+        "# HELP scraper_events_total Notable scraper events (Maps blocks, driver recycles, ...).",
+        "# TYPE scraper_events_total counter",
+    ]
+    for metrics in all_runs():
+        summary = metrics.summary()
+        for area, events in [("all", summary["events"])] + list(summary["area_events"].items()):
+            for event, n in events.items():
+                event_lines.append(f"scraper_events_total{{{_labels(run=metrics.run_id, area=area, event=event)}}} {n}")
+        scopes = [("all", summary["stages"])] + list(summary["areas"].items())
+        for area, stages in scopes:
+            for stage, s in stages.items():
+                base = _labels(run=metrics.run_id, area=area, stage=stage)
+                for q in ("0.5", "0.95"):
+                    value = s["p50"] if q == "0.5" else s["p95"]
+                    lines.append(f'scraper_stage_seconds{{{base},quantile="{q}"}} {value}')
+                lines.append(f"scraper_stage_seconds_sum{{{base}}} {s['total']}")
+                lines.append(f"scraper_stage_seconds_count{{{base}}} {s['count']}")
+                max_lines.append(f"scraper_stage_seconds_max{{{base}}} {s['max']}")
+    return "\n".join(lines + max_lines + event_lines) + "\n"
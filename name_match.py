@@ -0,0 +1,70 @@
+import re
+from functools import lru_cache
+
+# Legal-form words that Maps, websites and directories add or drop at will
+NAME_NOISE = re.compile(r"\b(pvt|private|ltd|limited|llp|company|co|the)\b")
+NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_name(name):
+    """Lowercase alphanumerics with legal-form noise removed: "The Acme Pvt. Ltd." -> "acme"."""
+    if not name:
+        return ""
+    return NON_ALNUM.sub("", NAME_NOISE.sub(" ", name.lower()))
+
+
+def match_key(name):
+    """normalize_name, falling back to the lowercased text for names with no Latin letters or digits."""
+    if not name or name == "Not Found":
+        return ""
+    return normalize_name(name) or name.lower().strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _bigrams(key):
+    if len(key) < 2:
+        return frozenset((key,))
+    return frozenset(key[i:i + 2] for i in range(len(key) - 1))
+
+
+def key_similarity(a, b, threshold=0.0):
+    """Dice coefficient of the character bigrams of two normalized keys, 0.0 to 1.0.
+
+    Returns 0.0 early when the bigram counts alone cannot reach threshold.
+    """
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    ga, gb = _bigrams(a), _bigrams(b)
+    total = len(ga) + len(gb)
+    # Length prefilter: the overlap is at most the smaller set
+    if 2 * min(len(ga), len(gb)) < threshold * total:
+        return 0.0
+    return 2 * len(ga & gb) / total
+
+
+def similarity(a, b):
+    """Similarity of two raw company names, 0.0 to 1.0."""
+    return key_similarity(match_key(a), match_key(b))
+
+
+def similar(a, b, threshold):
+    """True if two normalized keys are at least threshold similar."""
+    return key_similarity(a, b, threshold) >= threshold
+
+
+def overlaps(a, b):
+    """True if one name's key contains the other's (extra branch or location words on one side)."""
+    ka, kb = match_key(a), match_key(b)
+    return bool(ka and kb) and (ka in kb or kb in ka)
+
+
+def same_business(expected, actual, threshold=0.6):
+    """True if a detail pane's name plausibly belongs to the card that was clicked."""
+    if overlaps(expected, actual):
+        return True
+    return key_similarity(match_key(expected), match_key(actual), threshold) >= threshold
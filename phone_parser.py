@@ -0,0 +1,89 @@
+import re
+
+MAX_NUMBERS = 3
+
+# Maps puts the number in the phone button's data-item-id ("phone:tel:0261...") and tel: links
+TEL_LINK = re.compile(r"tel:(\+?[\d\- ().]{6,24})")
+# A run of digits with the separators people write between groups, never across lines
+TEXT_NUMBER = re.compile(r"(?<![\w+(])[+(]?\d[\d \-()]{6,22}\d(?!\w)")
+SEPARATORS = re.compile(r"[ \-()]+")
+NON_DIGITS = re.compile(r"\D")
+TAGS = re.compile(r"<[^>]*>")
+TOLL_FREE = re.compile(r"18[06]0\d{6,7}")
+
+
+def _national_number(digits, plus):
+    """Strip the country code or trunk prefix: (national number, whether a prefix was written)."""
+    if plus:
+        return digits[2:], True
+    if digits.startswith("0091"):
+        return digits[4:], True
+    if len(digits) == 12 and digits.startswith("91"):
+        return digits[2:], True
+    if len(digits) == 11 and digits.startswith("0"):
+        return digits[1:], True
+    return digits, False
+
+
+def parse_phone(raw, trusted=False):
+    """E.164 form of one written Indian number ("+919876543210"), or None if it is not a valid one.
+
+    Mobiles are 10 digits starting 6-9. STD landlines (area code + subscriber, 10 digits
+    starting 1-5) must be written with their 0 / +91 prefix unless the source is trusted
+    (a tel: link), so pincodes, IDs and counts in free text are not taken for phones.
+    trusted also accepts non-Indian numbers written with a +country code.
+    """
+    if not raw:
+        return None
+    raw = raw.strip()
+    plus = raw.startswith("+")
+    digits = NON_DIGITS.sub("", raw)
+    if plus and not digits.startswith("91"):
+        return f"+{digits}" if trusted and 8 <= len(digits) <= 15 else None
+    national, prefixed = _national_number(digits, plus)
+    if TOLL_FREE.fullmatch(national):
+        return f"+91{national}"
+    if len(national) != 10 or national[0] == "0" or len(set(national)) <= 2:
+        return None
+    if national[0] not in "6789" and not (prefixed or trusted):
+        return None
+    return f"+91{national}"
+
+
+def _parse_candidate(candidate):
+    number = parse_phone(candidate)
+    if number:
+        return number
+    # A neighbouring number (pincode, floor, plot no.) can be glued on with a space;
+    # try the longest runs of the written digit groups instead
+    groups = [g for g in SEPARATORS.split(candidate.lstrip("+(")) if g]
+    for size in range(len(groups) - 1, 0, -1):
+        for start in range(len(groups) - size + 1):
+            number = parse_phone(" ".join(groups[start:start + size]))
+            if number:
+                return number
+    return None
+
+
+def extract_phones(html="", text=None, limit=MAX_NUMBERS):
+    """Valid numbers on a details pane as E.164, tel: / data-item-id numbers first.
+
+    One scan of the HTML for tel: values and one scan of the visible text (derived
+    from the HTML if not given) for written numbers; duplicates are dropped.
+    """
+    numbers = []
+
+    def add(number):
+        if number and number not in numbers:
+            numbers.append(number)
+        return len(numbers) >= limit
+
+    for match in TEL_LINK.finditer(html or ""):
+        if add(parse_phone(match.group(1), trusted=True)):
+            return numbers
+    if text is None:
+        text = TAGS.sub("\n", html or "")
+    for match in TEXT_NUMBER.finditer(text):
+        if add(_parse_candidate(match.group())):
+            break
+    return numbers
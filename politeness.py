@@ -0,0 +1,237 @@
+import time
+import socket
+import logging
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+log = logging.getLogger(__name__)
+
+HOST_RATE = 2.0          # Requests per second to one host, sustained
+HOST_BURST = 4           # Homepage + contact pages of one site go out without waiting
+IP_RATE = 10.0           # Shared hosting: many company sites behind one address
+IP_BURST = 10
+BACKOFF_BASE = 2.0       # Seconds after the first 429/503, doubling per strike
+BACKOFF_MAX = 60.0
+MAX_WAIT = 10.0          # Fail fast instead of parking a worker longer than this
+MIN_RATE = 0.1
+DNS_TTL = 300.0          # Seconds a resolved (or failed) host lookup is reused
+MAX_TRACKED = 10000      # Hosts / IPs / DNS answers kept; least recently used go first
+THROTTLE_STATUSES = {429, 503}
+THROTTLE_RETRIES = 1     # Retries of a throttled request once its backoff has passed
+
+
+class HostBackoff(requests.RequestException):
+    """Waiting for the host (its backoff, or its rate limit with requests queued ahead) would outlast MAX_WAIT."""
+
+
+class RobotsDisallowed(requests.RequestException):
+    """robots.txt disallows the URL (only raised with respect_robots)."""
+
+
+def _touch(table, key):
+    """Mark key most recently used and drop the least recently used past MAX_TRACKED (caller holds the lock)."""
+    table.move_to_end(key)
+    while len(table) > MAX_TRACKED:
+        table.popitem(last=False)
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.base_rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self, now):
+        """Take a token, going into debt if needed; returns how long the caller must wait for it."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self):
+        self.tokens += 1
+
+
+class _HostState:
+    __slots__ = ("bucket", "blocked_until", "strikes", "robots")
+
+    def __init__(self, rate, burst):
+        self.bucket = TokenBucket(rate, burst)
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.robots = None
+
+
+class PoliteSession:
+    """Rate-limited front for a requests.Session shared by every crawl thread.
+
+    Each request takes a token from its host's bucket and from its server IP's
+    bucket. A 429/503 puts the host in backoff (Retry-After or exponential) and
+    halves its rate, and the request is retried once the backoff has passed
+    (or raises HostBackoff if that is longer than max_wait); successes restore
+    the rate gradually. host_limits maps a host to its own (rate, burst) for
+    APIs with a published limit. Unresolvable hosts
+    fail at once from a DNS cache instead of waiting on a connect timeout.
+    """
+
+    def __init__(self, session, host_rate=HOST_RATE, host_burst=HOST_BURST, ip_rate=IP_RATE, ip_burst=IP_BURST,
+                 respect_robots=False, max_wait=MAX_WAIT, host_limits=None):
+        self.session = session
+        self.host_limits = dict(host_limits or {})
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.ip_rate = ip_rate
+        self.ip_burst = ip_burst
+        self.respect_robots = respect_robots
+        self.max_wait = max_wait
+        # LRU-bounded: the web app crawls an open-ended set of hosts for as long as it runs
+        self._hosts = OrderedDict()
+        self._ips = OrderedDict()
+        self._dns = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "throttled": 0, "backoff_skips": 0, "dns_failures": 0, "robots_blocked": 0, "waited_s": 0.0}
+
+    def configure(self, host_rate=None, host_burst=None, ip_rate=None, ip_burst=None, respect_robots=None):
+        with self._lock:
+            if host_rate is not None:
+                self.host_rate = host_rate
+            if host_burst is not None:
+                self.host_burst = host_burst
+            if ip_rate is not None:
+                self.ip_rate = ip_rate
+            if ip_burst is not None:
+                self.ip_burst = ip_burst
+            if respect_robots is not None:
+                self.respect_robots = respect_robots
+            # Buckets are rebuilt lazily with the new limits
+            self._hosts.clear()
+            self._ips.clear()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, waited_s=round(self._stats["waited_s"], 2))
+
+    # --- public verbs ---
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        host = (urlparse(url).hostname or "").lower()
+        ip = self._resolve(host)
+        if self.respect_robots and not self._allowed(url, host, kwargs.get("headers")):
+            self._count("robots_blocked")
+            raise RobotsDisallowed(f"robots.txt disallows {url}")
+
+        for attempt in range(THROTTLE_RETRIES + 1):
+            self._wait_for_turn(host, ip)
+            self._count("requests")
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in THROTTLE_STATUSES:
+                self._succeeded(host)
+                return response
+            self._throttled(host, response)
+        return response
+
+    # --- internals ---
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def _host(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(*self.host_limits.get(host, (self.host_rate, self.host_burst)))
+        _touch(self._hosts, host)
+        return state
+
+    def _resolve(self, host):
+        """Server IP for the per-IP bucket; None when a proxy resolves names for us."""
+        if not host or self.session.proxies:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            ip, expires = self._dns.get(host, (None, 0.0))
+        if ip is None or expires < now:
+            try:
+                ip = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)[0][4][0]
+            except (socket.gaierror, UnicodeError):
+                ip = False
+            with self._lock:
+                self._dns[host] = (ip, now + DNS_TTL)
+                _touch(self._dns, host)
+        if ip is False:
+            self._count("dns_failures")
+            raise requests.ConnectionError(f"cannot resolve {host}")
+        return ip
+
+    def _wait_for_turn(self, host, ip):
+        now = time.monotonic()
+        with self._lock:
+            state = self._host(host)
+            backoff = state.blocked_until - now
+            if backoff > self.max_wait:
+                self._stats["backoff_skips"] += 1
+                raise HostBackoff(f"{host} is backing off for {backoff:.0f}s")
+            buckets = [state.bucket]
+            if ip:
+                bucket = self._ips.get(ip)
+                if bucket is None:
+                    bucket = self._ips[ip] = TokenBucket(self.ip_rate, self.ip_burst)
+                _touch(self._ips, ip)
+                buckets.append(bucket)
+            wait = max([backoff] + [b.reserve(now) for b in buckets])
+            if wait > self.max_wait:
+                # Queued behind too many requests to this host / IP: give the tokens back and fail fast
+                for b in buckets:
+                    b.refund()
+                self._stats["backoff_skips"] += 1
+                raise HostBackoff(f"{host} is rate limited for {wait:.0f}s")
+            self._stats["waited_s"] += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def _throttled(self, host, response):
+        retry_after = response.headers.get("Retry-After", "")
+        with self._lock:
+            state = self._host(host)
+            state.strikes += 1
+            delay = float(retry_after) if retry_after.isdigit() else BACKOFF_BASE * 2 ** (state.strikes - 1)
+            state.blocked_until = time.monotonic() + min(delay, BACKOFF_MAX)
+            state.bucket.rate = max(MIN_RATE, state.bucket.rate / 2)
+            self._stats["throttled"] += 1
+        log.debug(f"⏳ {host} answered {response.status_code}; backing off {min(delay, BACKOFF_MAX):.1f}s")
+
+    def _succeeded(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state and (state.strikes or state.bucket.rate < state.bucket.base_rate):
+                state.strikes = 0
+                state.bucket.rate = min(state.bucket.base_rate, state.bucket.rate + state.bucket.base_rate / 10)
+
+    def _allowed(self, url, host, headers=None):
+        parsed = urlparse(url)
+        with self._lock:
+            robots = self._host(host).robots
+        if robots is None:
+            robots = RobotFileParser()
+            try:
+                self._wait_for_turn(host, self._resolve(host))
+                r = self.session.get(f"{parsed.scheme}://{parsed.netloc}/robots.txt", headers=headers, timeout=5, verify=False)
+                robots.parse(r.text.splitlines() if r.status_code == 200 else [])
+            except requests.RequestException:
+                robots.parse([])
+            with self._lock:
+                self._host(host).robots = robots
+        agent = (headers or {}).get("User-Agent", "*")
+        return robots.can_fetch(agent, url)
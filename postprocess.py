@@ -0,0 +1,163 @@
+import logging
+from collections import defaultdict
+import pandas as pd
+import matchers
+import name_match
+from name_match import NAME_NOISE
+
+log = logging.getLogger(__name__)
+
+MISSING = ("", "Not Found")
+NAME_MATCH = 0.9          # Name similarity that, with a similar address, means the same business
+CORROBORATED_NAME = 0.6   # Lower bar when phone or website host already agree
+ADDRESS_MATCH = 0.7
+MAX_BLOCK = 40            # Name-token blocks larger than this are too generic to compare pairwise
+
+# Tokens shared by too many IT businesses to say anything about identity
+GENERIC_TOKENS = {
+    "technologies", "technology", "tech", "solutions", "solution", "software", "softwares", "systems",
+    "infotech", "infosys", "services", "digital", "web", "it", "and", "india", "surat", "studio", "labs",
+}
+
+
+def clean_frame(df):
+    """clean_text / clean_address for whole columns at once.
+
+    Compiled patterns keep Python re semantics (\\w, \\s) even on Arrow-backed string columns.
+    """
+    df = df.fillna("").astype(str)
+    if "Company Name" in df:
+        name = df["Company Name"].str.replace(matchers.NON_TEXT_CHARS, " ", regex=True)
+        name = name.str.replace(matchers.WHITESPACE, " ", regex=True).str.strip()
+        df["Company Name"] = name.str.replace(matchers.TEXT_DISALLOWED, "", regex=True)
+    if "Address" in df:
+        address = df["Address"].str.replace(matchers.ADDRESS_DISALLOWED, "", regex=True)
+        address = address.str.replace(matchers.WHITESPACE, " ", regex=True).str.strip()
+        address = address.str.replace(matchers.LEADING_COMMA, "", regex=True)
+        df["Address"] = address.mask(df["Address"].isin(MISSING), "Not Found")
+    return df
+
+
+def blocking_keys(df):
+    """Normalized name, name tokens, phone digits and website host per row."""
+    lowered = df["Company Name"].str.lower().str.replace(NAME_NOISE.pattern, " ", regex=True)
+    tokens = lowered.str.replace(r"[^a-z0-9\s]", " ", regex=True).str.split()
+    name_key = lowered.str.replace(r"[^a-z0-9]", "", regex=True)
+
+    digits = df["Phone (Maps)"].str.split(",").str[0].str.replace(r"\D", "", regex=True) if "Phone (Maps)" in df else pd.Series("", index=df.index)
+    phone = digits.where(digits.str.len() >= 10, "").str[-10:]
+
+    website = df["Website"] if "Website" in df else pd.Series("", index=df.index)
+    host = website.str.lower().str.extract(r"^(?:https?://)?(?:www\.)?([^/:?#]+)", expand=False).fillna("")
+    host = host.mask(website.isin(MISSING), "")
+
+    return pd.DataFrame({
+        "name_key": name_key,
+        "tokens": tokens,
+        "phone": phone,
+        "host": host,
+        "address": df["Address"].str.lower() if "Address" in df else "",
+    }, index=df.index)
+
+
+def completeness(df):
+    filled = (~df.isin(MISSING)).sum(axis=1)
+    # More emails is more complete
+    emails = df["Email (Website)"].str.count(",") if "Email (Website)" in df else 0
+    return filled + emails * 0.1
+
+
+class _UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def find_duplicate_groups(keys):
+    """Groups of row positions that describe the same business."""
+    names = keys["name_key"].tolist()
+    phones = keys["phone"].tolist()
+    hosts = keys["host"].tolist()
+    addresses = keys["address"].tolist()
+    uf = _UnionFind(len(keys))
+
+    def same_business(i, j):
+        corroborated = (phones[i] and phones[i] == phones[j]) or (hosts[i] and hosts[i] == hosts[j])
+        if corroborated:
+            return name_match.similar(names[i], names[j], CORROBORATED_NAME)
+        return name_match.similar(names[i], names[j], NAME_MATCH) and name_match.similar(addresses[i], addresses[j], ADDRESS_MATCH)
+
+    blocks = defaultdict(list)
+    for pos, (name, phone, host, tokens) in enumerate(zip(names, phones, hosts, keys["tokens"])):
+        if name:
+            blocks[("name", name)].append(pos)
+        if phone:
+            blocks[("phone", phone)].append(pos)
+        if host:
+            blocks[("host", host)].append(pos)
+        for token in set(tokens or ()):
+            if len(token) >= 3 and token not in GENERIC_TOKENS:
+                blocks[("token", token)].append(pos)
+
+    compared = set()
+    for (kind, _), members in blocks.items():
+        if len(members) < 2 or (kind == "token" and len(members) > MAX_BLOCK):
+            continue
+        for a_idx, i in enumerate(members):
+            for j in members[a_idx + 1:]:
+                if uf.find(i) == uf.find(j) or (i, j) in compared:
+                    continue
+                compared.add((i, j))
+                if same_business(i, j):
+                    uf.union(i, j)
+
+    groups = defaultdict(list)
+    for pos in range(len(keys)):
+        groups[uf.find(pos)].append(pos)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def merge_near_duplicates(df):
+    """Collapse rows for the same business (across areas) into its most complete record.
+
+    The kept row's missing fields are filled from the other rows of its group.
+    """
+    df = df.reset_index(drop=True)
+    if len(df) < 2:
+        return df, 0
+    groups = find_duplicate_groups(blocking_keys(df))
+    if not groups:
+        return df, 0
+
+    score = completeness(df).tolist()
+    drop = []
+    for group in groups:
+        best = max(group, key=lambda pos: (score[pos], -pos))
+        for col in df.columns:
+            if df.at[best, col] in MISSING:
+                for pos in group:
+                    if df.at[pos, col] not in MISSING:
+                        df.at[best, col] = df.at[pos, col]
+                        break
+        drop.extend(pos for pos in group if pos != best)
+    return df.drop(index=drop).reset_index(drop=True), len(drop)
+
+
+def finalize_frame(df):
+    """Final dataset pass run once at save time: clean, then merge near-duplicates."""
+    df = clean_frame(df)
+    df = df.drop_duplicates(subset=[c for c in ("Company Name", "Address") if c in df]).reset_index(drop=True)
+    df, merged = merge_near_duplicates(df)
+    if merged:
+        log.info(f"🔗 Merged {merged} near-duplicate rows (same business under several areas)")
+    return df
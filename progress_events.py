@@ -0,0 +1,60 @@
+import json
+import queue
+import threading
+
+KEEPALIVE_SECONDS = 15
+SUBSCRIBER_QUEUE_SIZE = 500
+
+
+class ProgressBroadcaster:
+    """Fans scraper progress events out to every connected dashboard."""
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        q = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def subscribed(self, q):
+        with self._lock:
+            return q in self._subscribers
+
+    def publish(self, event, data):
+        message = format_sse(event, data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait(message)
+            except queue.Full:
+                # A stalled client must not hold events for everyone else; its stream ends
+                # and the browser's EventSource reconnects to a fresh snapshot
+                self.unsubscribe(q)
+
+    def stream(self, initial_event=None, initial_data=None):
+        q = self.subscribe()
+        try:
+            if initial_event:
+                yield format_sse(initial_event, initial_data)
+            while True:
+                try:
+                    message = q.get(timeout=KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    message = ": keepalive\n\n"
+                if not self.subscribed(q):
+                    return
+                yield message
+        finally:
+            self.unsubscribe(q)
+
+
+def format_sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
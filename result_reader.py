@@ -0,0 +1,85 @@
+import os
+import threading
+from collections import OrderedDict
+import pandas as pd
+from result_writer import sidecar_path, pa, pq
+
+MISSING_VALUES = ("", "Not Found")
+SORTABLE_COLUMNS = ["Area", "Company Name", "Address", "Phone (Maps)", "Website", "Email (Website)"]
+
+# Parsed datasets keyed by (filename, mtime, columns); a rewritten file gets a new key
+DATASET_CACHE_SIZE = 8
+_dataset_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_results(filename, columns=None):
+    """Load a results file, preferring its Parquet sidecar over parsing the xlsx.
+
+    columns: only these (those the file has); the sidecar reads just their column chunks.
+    """
+    parquet = sidecar_path(filename)
+    if pa is not None and os.path.exists(parquet) and os.path.getmtime(parquet) >= os.path.getmtime(filename):
+        try:
+            if columns is not None:
+                present = set(pq.read_schema(parquet).names)
+                columns = [c for c in columns if c in present]
+            return pd.read_parquet(parquet, columns=columns)
+        except Exception:
+            pass
+
+    if pa is None and columns is not None:
+        wanted = set(columns)
+        return pd.read_excel(filename, usecols=lambda c: c in wanted, dtype=str)
+
+    df = pd.read_excel(filename, dtype=str)
+
+    # Backfill the sidecar so older files only pay the openpyxl cost once
+    if pa is not None:
+        try:
+            df.to_parquet(parquet, index=False)
+        except Exception:
+            pass
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def get_dataset(filename, columns=None):
+    columns = tuple(dict.fromkeys(columns)) if columns else None
+    key = (os.path.abspath(filename), os.path.getmtime(filename), columns)
+    with _cache_lock:
+        if key in _dataset_cache:
+            _dataset_cache.move_to_end(key)
+            return _dataset_cache[key]
+
+    df = load_results(filename, list(columns) if columns else None).fillna("").astype(str)
+
+    with _cache_lock:
+        _dataset_cache[key] = df
+        _dataset_cache.move_to_end(key)
+        while len(_dataset_cache) > DATASET_CACHE_SIZE:
+            _dataset_cache.popitem(last=False)
+    return df
+
+
+def _has_value(series):
+    return ~series.str.strip().isin(MISSING_VALUES)
+
+
+def query_results(df, area=None, has_email=None, has_website=None, sort=None, descending=False, offset=0, limit=50):
+    mask = pd.Series(True, index=df.index)
+    if area and "Area" in df:
+        mask &= df["Area"].str.lower() == area.lower()
+    if has_email is not None and "Email (Website)" in df:
+        mask &= _has_value(df["Email (Website)"]) == has_email
+    if has_website is not None and "Website" in df:
+        mask &= _has_value(df["Website"]) == has_website
+
+    view = df[mask]
+    if sort in SORTABLE_COLUMNS and sort in view:
+        view = view.sort_values(sort, ascending=not descending, key=lambda s: s.str.lower(), kind="stable")
+
+    total = len(view)
+    page = view.iloc[offset:offset + limit]
+    return page, total
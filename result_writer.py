@@ -0,0 +1,149 @@
+import os
+import csv
+import logging
+import threading
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pq
+except ImportError:
+    pa = pa_csv = pq = None
+
+log = logging.getLogger(__name__)
+
+COLUMNS = ["Area", "Company Name", "Address", "Phone (Maps)", "Website", "Email (Website)"]
+
+# MOBILE-FRIENDLY: Maximum column widths for better mobile viewing
+MAX_WIDTHS = {"Company Name": 30, "Address": 35}
+DEFAULT_MAX_WIDTH = 40
+
+
+def sidecar_path(filename):
+    return os.path.splitext(filename)[0] + ".parquet"
+
+
+def write_parquet_sidecar(source, filename):
+    # Columnar copy of the results for the viewer; the xlsx stays the download.
+    # source is the CSV spool path, or the final DataFrame when a postprocess step rewrote the rows.
+    if pa is None:
+        return None
+    try:
+        if isinstance(source, str):
+            table = pa_csv.read_csv(
+                source,
+                convert_options=pa_csv.ConvertOptions(column_types={col: pa.string() for col in COLUMNS})
+            )
+        else:
+            table = pa.Table.from_pandas(source, preserve_index=False)
+        path = sidecar_path(filename)
+        pq.write_table(table, path)
+        return path
+    except Exception as e:
+        log.warning(f"⚠️ Could not write Parquet sidecar: {e}")
+        return None
+
+
+class StreamingExcelWriter:
+    """Appends companies to a CSV spool as they are extracted and builds the xlsx once at the end.
+
+    postprocess, if given, receives the whole spool as a DataFrame at finalize time
+    (vectorized cleaning, cross-area dedup) and returns the rows to save.
+    """
+
+    def __init__(self, filename, cleaners=None, postprocess=None):
+        self.filename = filename
+        self.partial_path = os.path.splitext(filename)[0] + ".partial.csv"
+        self.cleaners = cleaners or {}
+        self.postprocess = postprocess
+        self.row_count = 0
+        self._seen = set()
+        # Running maxima replace the second pass over every cell
+        self._widths = {col: len(col) for col in COLUMNS}
+        self._lock = threading.Lock()
+        self._fh = open(self.partial_path, "w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._fh)
+        self._csv.writerow(COLUMNS)
+        self._fh.flush()
+
+    def append(self, company):
+        row = []
+        for col in COLUMNS:
+            value = company.get(col, "")
+            if col in self.cleaners:
+                value = self.cleaners[col](value)
+            row.append("" if value is None else str(value))
+
+        key = (row[1], row[2])  # Company Name + Address
+        with self._lock:
+            if key in self._seen or self._fh.closed:
+                return False
+            self._seen.add(key)
+            self._csv.writerow(row)
+            # Flushed per row so the partial file is always downloadable mid-run
+            self._fh.flush()
+            self.row_count += 1
+            for col, value in zip(COLUMNS, row):
+                if len(value) > self._widths[col]:
+                    self._widths[col] = len(value)
+        return True
+
+    def extend(self, companies):
+        for company in companies:
+            self.append(company)
+
+    def column_widths(self, widths=None):
+        widths = widths or self._widths
+        return {
+            col: min(widths[col] + 2, MAX_WIDTHS.get(col, DEFAULT_MAX_WIDTH))
+            for col in COLUMNS
+        }
+
+    def _processed_rows(self):
+        import pandas as pd
+        df = pd.read_csv(self.partial_path, dtype=str, keep_default_na=False)
+        df = self.postprocess(df)[COLUMNS]
+        self.row_count = len(df)
+        widths = {col: max(len(col), int(df[col].str.len().max() or 0)) for col in COLUMNS}
+        return df, widths
+
+    def finalize(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+        frame, widths = self._processed_rows() if self.postprocess else (None, None)
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        # Write-only sheets need dimensions before the first row
+        for idx, (col, width) in enumerate(self.column_widths(widths).items(), start=1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
+
+        if frame is None:
+            with open(self.partial_path, newline="", encoding="utf-8") as fh:
+                for row in csv.reader(fh):
+                    ws.append([value if value != "" else None for value in row])
+        else:
+            ws.append(COLUMNS)
+            for row in frame.itertuples(index=False, name=None):
+                ws.append([value if value != "" else None for value in row])
+        wb.save(self.filename)
+        write_parquet_sidecar(self.partial_path if frame is None else frame, self.filename)
+
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+        return self.filename
+
+    def discard(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
@@ -0,0 +1,101 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+CATALOG_PATH = "results_catalog.db"
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+class ResultsCatalog:
+    """Every produced results file, recorded at write time."""
+
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT,
+                city TEXT,
+                areas TEXT,
+                row_count INTEGER,
+                path TEXT UNIQUE,
+                started_at TEXT,
+                finished_at TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_finished ON results(finished_at)")
+        self._conn.commit()
+        self._latest = None
+        self._import_existing_files()
+        self._latest = self._query_latest()
+
+    def _import_existing_files(self):
+        # One-time backfill of outputs written before the catalog existed
+        if self._conn.execute("SELECT 1 FROM results LIMIT 1").fetchone():
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        for f in os.listdir(directory):
+            if f.endswith('.xlsx') and '_data_' in f:
+                mtime = datetime.fromtimestamp(os.path.getmtime(os.path.join(directory, f))).isoformat(timespec="seconds")
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO results (path, finished_at) VALUES (?, ?)", (f, mtime)
+                )
+        self._conn.commit()
+
+    def _query_latest(self):
+        row = self._conn.execute("SELECT * FROM results ORDER BY finished_at DESC, id DESC LIMIT 1").fetchone()
+        return _row_to_dict(row) if row else None
+
+    def record(self, path, run_id=None, city=None, areas=None, row_count=None, started_at=None):
+        finished_at = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO results (run_id, city, areas, row_count, path, started_at, finished_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    run_id = excluded.run_id,
+                    city = excluded.city,
+                    areas = excluded.areas,
+                    row_count = excluded.row_count,
+                    started_at = excluded.started_at,
+                    finished_at = excluded.finished_at
+            """, (run_id, city, json.dumps(areas or []), row_count, path, started_at, finished_at))
+            self._conn.commit()
+            self._latest = self._query_latest()
+            return self._latest
+
+    def latest(self):
+        with self._lock:
+            while self._latest and not os.path.exists(self._latest["path"]):
+                # Deleted by hand; drop it and fall back to the next newest
+                self._conn.execute("DELETE FROM results WHERE path = ?", (self._latest["path"],))
+                self._conn.commit()
+                self._latest = self._query_latest()
+            return self._latest
+
+    def list(self, limit=50, offset=0):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM results ORDER BY finished_at DESC, id DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [_row_to_dict(r) for r in rows]
+
+
+def _row_to_dict(row):
+    entry = dict(row)
+    entry["areas"] = json.loads(entry["areas"]) if entry.get("areas") else []
+    return entry
+
+
+def get_catalog(path=CATALOG_PATH):
+    with _catalogs_lock:
+        if path not in _catalogs:
+            _catalogs[path] = ResultsCatalog(path)
+        return _catalogs[path]
@@ -0,0 +1,132 @@
+import os
+import json
+import threading
+from datetime import datetime
+
+JOURNAL_DIR = "runs"
+
+
+def new_run_id():
+    return datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+
+class RunJournal:
+    """Append-only JSONL journal of a scraping run (one event per line)."""
+
+    def __init__(self, run_id=None, directory=JOURNAL_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.run_id = run_id or new_run_id()
+        self.path = os.path.join(directory, f"{self.run_id}.jsonl")
+        self._lock = threading.Lock()
+        self.completed = set()  # Areas / units completed by this process
+        self._fh = open(self.path, "a", encoding="utf-8")
+        self._terminate_partial_line()
+
+    def _terminate_partial_line(self):
+        # A crash mid-write leaves a line without "\n"; don't glue the next event onto it
+        if os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, "rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                self._fh.write("\n")
+                self._fh.flush()
+
+    def _append(self, event, **fields):
+        entry = {"event": event, "ts": datetime.now().isoformat(timespec="seconds"), **fields}
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.write(line + "\n")
+            # Flush every line so a killed process loses at most the line in flight
+            self._fh.flush()
+
+    def start(self, areas, city, category, custom_query, tiled=False, tiles=None):
+        # tiles: {area: [[lat, lng, zoom], ...] or None (searched whole)}, so a resume reuses the same units
+        self._append("run_start", areas=areas, city=city, category=category, custom_query=custom_query,
+                     tiled=tiled, tiles=tiles)
+
+    def record_company(self, area, card_index, company, place_id=None):
+        # place_id is kept beside the display row so a resume can re-claim the business by it
+        self._append("company", area=area, card=card_index, data=company, place_id=place_id)
+
+    def record_card(self, area, card_index):
+        self._append("card_done", area=area, card=card_index)
+
+    def complete_area(self, area):
+        self.completed.add(area)
+        self._append("area_done", area=area)
+
+    def record_metrics(self, summary):
+        self._append("metrics", summary=summary)
+
+    def finish(self, filename):
+        self._append("run_done", file=filename)
+
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+
+def load_journal(run_id, directory=JOURNAL_DIR):
+    state = {
+        "run_id": run_id,
+        "meta": {},
+        "companies": {},
+        "claimed": {},
+        "done_cards": {},
+        "done_areas": set(),
+        "finished": False,
+        "started_at": None,
+    }
+    path = os.path.join(directory, f"{run_id}.jsonl")
+    if not os.path.exists(path):
+        return None
+
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Truncated last line from a crash mid-write
+                continue
+
+            event = entry.get("event")
+            area = entry.get("area")
+            if event == "run_start":
+                state["meta"] = {k: entry.get(k) for k in ("areas", "city", "category", "custom_query", "tiled", "tiles")}
+                state["started_at"] = entry.get("ts")
+            elif event == "company":
+                state["companies"].setdefault(area, []).append(entry["data"])
+                state["claimed"].setdefault(area, []).append((entry.get("place_id"), entry["data"].get("Company Name")))
+                state["done_cards"].setdefault(area, set()).add(entry["card"])
+            elif event == "card_done":
+                state["done_cards"].setdefault(area, set()).add(entry["card"])
+            elif event == "area_done":
+                state["done_areas"].add(area)
+            elif event == "run_done":
+                state["finished"] = True
+    return state
+
+
+def find_resumable_run(directory=JOURNAL_DIR, exclude=()):
+    """Return the run ID of the most recently started journal that never reached run_done.
+
+    exclude: run IDs that are in use (queued or running jobs), never handed out twice.
+    """
+    if not os.path.isdir(directory):
+        return None
+    candidates = []
+    for f in os.listdir(directory):
+        if not f.endswith(".jsonl"):
+            continue
+        run_id = f[:-len(".jsonl")]
+        if run_id in exclude:
+            continue
+        state = load_journal(run_id, directory)
+        if state and state["meta"] and not state["finished"]:
+            # Run IDs are random job IDs: order by when the run started, then by last write
+            candidates.append((state["started_at"] or "", os.path.getmtime(os.path.join(directory, f)), run_id))
+    return max(candidates)[2] if candidates else None
@@ -1,10 +1,12 @@
 import os
 import re
+import sys
+import subprocess
 import time
 import random
-import pandas as pd
 import requests
 import logging
+from contextlib import nullcontext
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,26 +16,35 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urlunparse
 from datetime import datetime
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import urllib3
+from run_journal import RunJournal, load_journal
+from company_store import CompanyStore
+from company_record import CompanyRecord, found
+from claims import ClaimRegistry
+from work_queue import WorkQueue, QUEUE_PATH, MAX_ATTEMPTS
+from result_writer import StreamingExcelWriter
+from results_catalog import get_catalog
+from cancellation import CancelToken
+from politeness import PoliteSession
+from site_probe import SiteProbe, bare_host
+import metrics as run_metrics
+import maps_guard
+import geo_tiles
+import matchers
+import name_match
+import phone_parser
+import email_scoring
+import postprocess
+from scraper_logging import setup_logging, set_log_context, clear_log_context
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-if os.path.exists('scraper.log'):
-    try:
-        os.remove('scraper.log')
-    except:
-        pass
-
-logging.basicConfig(
-    filename='scraper.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    encoding='utf-8'
-)
+log = logging.getLogger("scraper")
 
 CONFIG = {
     "AREAS": ["Adajan"], # Default
@@ -43,7 +54,28 @@ CONFIG = {
     "MAX_THREADS": 20,
     "REQUEST_TIMEOUT": 8,
     "HEADLESS":True, # User explicitly requested visibility Code work better with true 
-    "BROWSER_INSTANCES": 2
+    "BROWSER_INSTANCES": 2,
+    "INCREMENTAL": False, # Carry forward unchanged businesses from company_store.db
+    "RUN_TIME_BUDGET": None,  # Seconds; stop the whole run and save partial results after this
+    "AREA_TIME_BUDGET": None, # Seconds per area
+    "MAPS_BASE_URL": "https://www.google.com/maps",
+    "VERIFY_EMAIL_MX": True, # Drop emails whose domain has no mail server (needs dnspython; skipped without it)
+    "HOST_RATE": 2.0, # Requests/second to one company site (burst HOST_BURST); halved on 429/503
+    "HOST_BURST": 4,
+    "IP_RATE": 10.0, # Requests/second to one server IP, for sites on shared hosting
+    "RESPECT_ROBOTS": False, # Fetch and obey robots.txt (cached per host) before crawling a site
+    "CLAIMS_DB": None, # SQLite path to share cross-area claims between processes; None = in memory per run
+    "WORKER_PROCESSES": None, # None = areas run on threads in this process; N = coordinator + N worker.py processes (0: workers started by hand)
+    "QUEUE_DB": QUEUE_PATH, # Work queue shared with worker processes (distributed runs)
+    "LEASE_SECONDS": 120, # A unit whose worker stops heartbeating for this long is re-issued
+    "GEO_TILES": False, # Search each area as a grid of map viewports (scraped in parallel) instead of one capped feed
+    "TILE_KM": 1.5, # Tile edge; areas with more than MAX_TILES_PER_AREA tiles get larger ones
+    "TILE_TARGET": 40, # Cards per tile feed
+    "MAX_TILES_PER_AREA": 16,
+    "AREA_BOUNDS": {}, # {"Adajan": [south, west, north, east]}; others are geocoded with OpenStreetMap
+    "PROXY": None, # e.g. "http://127.0.0.1:8899"; used by requests and Chrome (see benchmark/)
+    "LOG_LEVEL": None, # scraper.log and logs/<run_id>.log; None = $SCRAPER_LOG_LEVEL or DEBUG
+    "CONSOLE_LOG_LEVEL": None # None = $SCRAPER_CONSOLE_LEVEL or INFO
 }
 
 AREAS = CONFIG["AREAS"]
@@ -56,28 +88,54 @@ REQUEST_TIMEOUT = CONFIG["REQUEST_TIMEOUT"]
 HEADLESS = CONFIG["HEADLESS"]
 BROWSER_INSTANCES = CONFIG["BROWSER_INSTANCES"]
 
+# Shared by every run in the process, so concurrent jobs never open more than BROWSER_INSTANCES Chromes;
+# narrowed, with cool-downs, while Google Maps is blocking us
+BROWSER_POOL = maps_guard.BrowserPool(BROWSER_INSTANCES)
+
 CANDIDATE_TLDS = [".com", ".in", ".co.in", ".net", ".org", ".biz", ".info"]
 
+# Consecutive failed cards after which the browser is assumed dead and the area is left open for a resume
+MAX_CARD_ERRORS = 3
+
 UA_POOL = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/122.0"
 ]
 
 session = requests.Session()
+# Every request to company sites goes through here: per-host / per-IP rate limits and 429/503 backoff
+http = PoliteSession(
+    session,
+    host_rate=CONFIG["HOST_RATE"],
+    host_burst=CONFIG["HOST_BURST"],
+    ip_rate=CONFIG["IP_RATE"],
+    respect_robots=CONFIG["RESPECT_ROBOTS"],
+    host_limits={urlparse(geo_tiles.NOMINATIM_URL).hostname: geo_tiles.NOMINATIM_LIMIT},
+)
+# Remembers which candidate domains are live (and their canonical URL) across companies and areas
+probe = SiteProbe(http, timeout=REQUEST_TIMEOUT)
+
+def set_proxy(proxy):
+    CONFIG["PROXY"] = proxy
+    session.proxies = {"http": proxy, "https": proxy} if proxy else {}
+
+set_proxy(CONFIG["PROXY"])
+
+def timed(metrics, stage, area=None):
+    return metrics.span(stage, area) if metrics else nullcontext()
 
 def check_internet_speed():
-    print("🌐 Checking network connection...")
+    log.info("🌐 Checking network connection...")
     try:
         start = time.time()
-        requests.get("https://www.google.com", timeout=5)
+        http.get("https://www.google.com", timeout=5)
         latency = (time.time() - start) * 1000
-        print(f" Network is Online (Latency: {latency:.0f}ms)")
+        log.info(f" Network is Online (Latency: {latency:.0f}ms)")
         if latency > 500:
-            print("⚠️ Warning: High Latency. Scraper might be slow.")
+            log.warning("⚠️ Warning: High Latency. Scraper might be slow.")
         return True
     except Exception as e:
-        print(" Network Error: No Internet Connection!")
-        print(f"   Error: {e}")
+        log.error(f" Network Error: No Internet Connection! ({e})")
         return False
 
 
@@ -91,25 +149,15 @@ def clean_url(url):
 def is_social_or_google(url):
     if not url:
         return True
-    bad = [
-        "facebook.com", "instagram.com", "linkedin.com",
-        "youtube.com", "google.com", "maps.google",
-        "g.page", "justdial.com", "indiamart.com", "sulekha.com"
-    ]
-    return any(b in url.lower() for b in bad)
+    return matchers.SOCIAL_OR_GOOGLE.search(url.lower()) is not None
 
 def generate_candidate_domains(company_name, area_hint=None):
     if not company_name:
         return []
 
-    name = re.sub(
-        r"\b(pvt|ltd|llp|private|company|co|services|solutions|technologies|tech|software|systems|the)\b",
-        "",
-        company_name,
-        flags=re.I
-    )
+    name = matchers.DOMAIN_STOPWORDS.sub("", company_name)
 
-    cleaned = re.sub(r"[^A-Za-z0-9\s]", " ", name)
+    cleaned = matchers.NON_ALNUM.sub(" ", name)
     parts = [p.lower() for p in cleaned.split() if p]
 
     bases = set()
@@ -126,52 +174,30 @@ def generate_candidate_domains(company_name, area_hint=None):
             domains.append("www." + base + tld)
 
     if area_hint:
-        area = re.sub(r"[^a-z0-9]", "", area_hint.lower())
+        area = matchers.NON_ALNUM_LOWER.sub("", area_hint.lower())
         for base in bases:
             domains.append(f"{base}{area}.com")
             domains.append(f"{base}-{area}.com")
 
     return list(dict.fromkeys(domains))
 
-def is_domain_live(domain):
-    if not domain:
-        return False
+def extract_emails_from_url(url, homepage_html=None, company_name=None):
+    """Ranked emails from a site's homepage and up to two contact pages.
 
-    base = domain.replace("http://", "").replace("https://", "").strip("/")
-    urls = [
-        f"http://{base}",
-        f"https://{base}",
-        f"http://www.{base}",
-        f"https://www.{base}",
-    ]
-
-    headers = {"User-Agent": random.choice(UA_POOL)}
-
-    for url in urls:
-        try:
-            r = session.head(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
-            if 200 <= r.status_code < 400:
-                return clean_url(r.url)
-
-            r = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True, verify=False)
-            if 200 <= r.status_code < 400:
-                return clean_url(r.url)
-        except:
-            continue
-
-    return False
-
-def extract_emails_from_url(url):
+    homepage_html: the homepage body when the caller already fetched it (a live probe), so it is not downloaded twice.
+    company_name: ranks addresses on a domain matching the name above other third-party ones.
+    """
     # Simple cache to avoid re-scraping same URLs
     if not hasattr(extract_emails_from_url, '_cache'):
         extract_emails_from_url._cache = {}
     
-    if url in extract_emails_from_url._cache:
-        return extract_emails_from_url._cache[url]
+    cache_key = (url, company_name)
+    if cache_key in extract_emails_from_url._cache:
+        return extract_emails_from_url._cache[cache_key]
     
     extracted_emails = set()
     visited_urls = set()
-    contact_keywords = re.compile(r'contact|about|touch|connect|reach|support', re.IGNORECASE)
+    contact_keywords = matchers.CONTACT_LINK
     
     def decode_cloudflare_email(encoded_string):
         """Decode CloudFlare protected emails"""
@@ -189,16 +215,20 @@ def extract_emails_from_url(url):
         
         try:
             headers = {"User-Agent": random.choice(UA_POOL)}
-            r = session.get(target_url, headers=headers, timeout=10, verify=False)
+            r = http.get(target_url, headers=headers, timeout=10, verify=False)
             if r.status_code != 200:
                 return
-            html = r.text
-            
+            return page_emails(r.text)
+        except:
+            return ""
+
+    def page_emails(html):
+        try:
             # 1. Extract emails with regex
-            found = re.findall(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", html)
+            found = matchers.EMAIL.findall(html)
             
             # 2. Extract CloudFlare protected emails
-            cf_emails = re.findall(r'/cdn-cgi/l/email-protection#([a-f0-9]+)', html)
+            cf_emails = matchers.CLOUDFLARE_EMAIL.findall(html)
             for cf_code in cf_emails:
                 decoded = decode_cloudflare_email(cf_code)
                 if decoded:
@@ -214,28 +244,17 @@ def extract_emails_from_url(url):
             except:
                 pass
             
-            junk_keywords = [
-                'bootstrap', 'sentry', 'example', 'domain', 'react', 'jquery', 
-                'node_modules', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp',
-                'wix', 'shopify', 'godaddy', 'namecheap'
-            ]
-            for e in found:
-                e_lower = e.lower()
-                if any(junk in e_lower for junk in junk_keywords):
-                    continue
-                try:
-                    domain_part = e_lower.split('@')[1]
-                    if domain_part[0].isdigit(): 
-                         continue
-                except:
-                    pass
-                
-                extracted_emails.add(e_lower)
-            return r.text 
+            # Validated and ranked once the crawl is done (email_scoring.best_emails)
+            extracted_emails.update(found)
+            return html
         except:
             return ""
 
-    homepage_html = get_page_emails(url)
+    if homepage_html is None:
+        homepage_html = get_page_emails(url)
+    else:
+        visited_urls.add(url)
+        homepage_html = page_emails(homepage_html)
     
     if homepage_html:
         try:
@@ -255,28 +274,44 @@ def extract_emails_from_url(url):
         except:
             pass
 
-    final_emails = sorted(list(extracted_emails), key=lambda x: len(x))[:3]
-    extract_emails_from_url._cache[url] = final_emails
+    final_emails = email_scoring.best_emails(extracted_emails, website=url, company_name=company_name, verify_mx=CONFIG["VERIFY_EMAIL_MX"])
+    extract_emails_from_url._cache[cache_key] = final_emails
     return final_emails
 
-def auto_find_website_and_email(company_name, area_hint=None):
-    domains = generate_candidate_domains(company_name, area_hint)
+def auto_find_website_and_email(company_name, area_hint=None, cancel_token=None):
+    # www.x.com and x.com are one probe
+    domains = list(dict.fromkeys(bare_host(d) for d in generate_candidate_domains(company_name, area_hint)))
+    if not domains:
+        return "Not Found", []
     def check(domain):
-        live = is_domain_live(domain)
-        if not live: return None
-        if is_social_or_google(live): return None
-        emails = extract_emails_from_url(live)
+        if cancel_token and cancel_token.cancelled(): return None
+        site = probe.probe(domain, headers={"User-Agent": random.choice(UA_POOL)})
+        if not site: return None
+        if is_social_or_google(site.url): return None
         return {
-            "website": live,
-            "email": ", ".join(emails) if emails else "Not Found"
+            "website": site.url,
+            "emails": extract_emails_from_url(site.url, homepage_html=site.html, company_name=company_name)
         }
-    with ThreadPoolExecutor(max_workers=min(MAX_THREADS, len(domains))) as executor:
-        futures = [executor.submit(check, d) for d in domains]
-        for future in as_completed(futures):
-            result = future.result()
-            if result:
-                return result["website"], result["email"]
-    return "Not Found", "Not Found"
+    executor = ThreadPoolExecutor(max_workers=min(MAX_THREADS, len(domains)))
+    pending = {executor.submit(check, d) for d in domains}
+    try:
+        while pending:
+            if cancel_token and cancel_token.cancelled():
+                break
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception:
+                    continue
+                if result:
+                    return result["website"], result["emails"]
+    finally:
+        # Don't wait on the remaining probes once we have an answer (or were cancelled)
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return "Not Found", []
 
 def get_domain_from_url(url):
     try:
@@ -290,10 +325,17 @@ def get_domain_from_url(url):
 def clean_text(text):
     if not text:
         return ""
-    text = re.sub(r'[^\x00-\x7F\u0900-\u097F]+', ' ', text)    
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'[^\w\s.,#\-()&/\'"]', '', text)
-    return text
+    text = matchers.NON_TEXT_CHARS.sub(' ', text)
+    text = matchers.WHITESPACE.sub(' ', text).strip()
+    return matchers.TEXT_DISALLOWED.sub('', text)
+
+def driver_alive(driver):
+    """False once the Chrome session is gone (browser crashed, session expired)."""
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
 
 def create_driver(headless=None):
     if headless is None:
@@ -314,6 +356,9 @@ def create_driver(headless=None):
     
     if headless:
         options.add_argument("--headless=new")
+
+    if CONFIG.get("PROXY"):
+        options.add_argument(f"--proxy-server={CONFIG['PROXY']}")
     
     try:
         driver = webdriver.Chrome(
@@ -324,15 +369,15 @@ def create_driver(headless=None):
             "userAgent": random.choice(user_agents)
         })
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        logging.info(" Driver created successfully")
+        log.debug(" Driver created successfully")
         return driver
     except Exception as e:
-        logging.error(f" Driver creation failed: {e}")
+        log.error(f" Driver creation failed: {e}")
         return None
 
 
-def get_phone_number_from_page(driver):
-    phone = "Not Found"
+def get_phone_numbers_from_page(driver):
+    """Validated numbers on the open details pane, as E.164 (tel: / data-item-id values first)."""
     try:
         time.sleep(0.5)
         try:
@@ -342,47 +387,9 @@ def get_phone_number_from_page(driver):
         except:
             pane_source = driver.page_source
             pane_text = driver.find_element(By.TAG_NAME, 'body').text
-
-        try:
-            phone_btns = driver.find_elements(By.XPATH, "//button[contains(@data-item-id, 'phone')]")
-            if phone_btns:
-                for btn in phone_btns:
-                    if btn.is_displayed():
-                        text = btn.text or btn.get_attribute("aria-label") or ""
-                        nums = re.findall(r'\d{5}\s*\d{5}|\d{10}', text)
-                        if nums:
-                             return f"{nums[0][:5]} {nums[0][5:]}"
-        except:
-             pass
-
-        phone_patterns = [
-            r'Phone[:\s]*([+\d\s\-]{10,20})',
-            r'\+91\s*\d{5}\s*\d{5}',
-            r'\b\d{5}\s*\d{5}\b',
-            r'tel:([+\d]+)',
-            r'\b0\d{2,4}[-\s]+\d{6,8}\b',
-            r'\b\d{4}[-\s]+\d{7}\b'
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, pane_source, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple): match = match[0]
-                clean_num = re.sub(r'\D', '', str(match))
-                if len(clean_num) >= 10:
-                     if len(clean_num) > 10 and clean_num.startswith('91'):
-                         clean_num = clean_num[2:]
-                     if len(clean_num) >= 10:
-                         return f"{clean_num[:5]} {clean_num[5:]}"
-                         
-        for line in pane_text.split('\n'):
-             if re.search(r'\d{5}\s*\d{5}', line) or re.search(r'0\d{2,4}[-\s]+\d{6,8}', line):
-                 clean_num = re.sub(r'\D', '', line)
-                 if len(clean_num) >= 10:
-                      return f"{clean_num[:5]} {clean_num[5:]}"
-    except Exception as e:
-        pass
-    return phone
+        return phone_parser.extract_phones(pane_source, pane_text)
+    except Exception:
+        return []
 
 def get_address_from_page(driver):
     address = "Not Found"
@@ -414,7 +421,7 @@ def get_address_from_page(driver):
         lines = all_text.split('\n')
         for line in lines:
             line = line.strip()
-            if len(line) > 30 and ('Surat' in line or 'Gujarat' in line or re.search(r'\d{6}', line)):
+            if len(line) > 30 and ('Surat' in line or 'Gujarat' in line or matchers.PIN_CODE.search(line)):
                 address = clean_address(line)
                 if address != "Not Found":
                     return address
@@ -448,55 +455,29 @@ def get_website_from_page(driver):
     return website
 
 def is_generic_website(url):
-    generic_patterns = [
-        'indiamart.com', 'justdial.com', 'tradeindia.com',
-        'sulekha.com', 'quikr.com', 'olx.in', 'yellowpages.in',
-        'g.page', 'maps.google.com', 'facebook.com', 'instagram.com',
-        'linkedin.com', 'youtube.com', 'twitter.com'
-    ]
-    url_lower = url.lower()
-    for pattern in generic_patterns:
-        if pattern in url_lower:
-            return True
-    return False
+    return matchers.GENERIC_WEBSITES.search(url.lower()) is not None
 
 def clean_address(address):
     if not address or address == "Not Found":
         return "Not Found"
     
 
-    address = re.sub(r'[^\w\s,.\-/()&\'\"]', '', address, flags=re.UNICODE)
-    
-    address = re.sub(r'\b[A-Z0-9]{4,}\+[A-Z0-9]{2,}\b', '', address)
-    address = re.sub(r'[•|📍]', '', address)
-    address = re.sub(r'\s+', ' ', address).strip()
-    address = re.sub(r'^,\s*', '', address)
-    return address
+    # The first pass already strips '+', '•', '|' and '📍', so the old plus-code and
+    # bullet passes after it could never match and are gone
+    address = matchers.ADDRESS_DISALLOWED.sub('', address)
+    address = matchers.WHITESPACE.sub(' ', address).strip()
+    return matchers.LEADING_COMMA.sub('', address)
 
 def should_skip_company(company_name):
     if not company_name or company_name == "Not Found":
         return True
         
     name_lower = company_name.lower()
-    obvious_non_business = [
-        'talab', 'stp', 'sewage', 'treatment plant',
-        'community hall', 'fire station', 'police station',
-        'bus stop', 'gate no', 'unnamed road',
-        'digital seva csc', 'government service',
-        'housing society', 'apartment', 'complex',
-        'chhath talav', 'krishna park', 'millenium park',
-        'shopping center', 'market', 'mall', 'park', 'garden',
-        'playground', 'swimming pool', 'sports complex'
-    ]
-
-    for keyword in obvious_non_business:
-        if keyword in name_lower:
-            return True
-    if len(name_lower) < 4:
+    if matchers.NON_BUSINESS.search(name_lower):
         return True
-    if re.search(r'^\d+\s+[a-z]+\s+(road|street|society|nagar)$', name_lower):
+    if len(name_lower) < 4:
         return True
-    return False
+    return matchers.STREET_ONLY_NAME.search(name_lower) is not None
 
 def extract_emails_with_selenium(driver, url):
     extracted = set()
@@ -601,8 +582,8 @@ def extract_emails_with_selenium(driver, url):
              
     return list(extracted)
 
-def extract_company_details(driver, area_name, expected_name=None):
-    print("\n" + "="*60)
+def extract_company_details(driver, area_name, expected_name=None, cancel_token=None, metrics=None):
+    fields_start = time.perf_counter()
     
     name = "Not Found"
     name_selectors = [
@@ -627,96 +608,93 @@ def extract_company_details(driver, area_name, expected_name=None):
             continue
 
     if name == "Not Found":
-        logging.warning("Could not extract company name from card")
+        log.warning("Could not extract company name from card")
         return None
         
     if expected_name and expected_name != "Not Found":
-        norm_expected = expected_name.lower().replace('pvt', '').replace('ltd', '').replace('company', '').replace('.', '').replace(' ', '')
-        norm_actual = name.lower().replace('pvt', '').replace('ltd', '').replace('company', '').replace('.', '').replace(' ', '')
-        
-        if norm_expected not in norm_actual and norm_actual not in norm_expected:
-            import difflib
-            ratio = difflib.SequenceMatcher(None, norm_expected, norm_actual).ratio()
-            if ratio < 0.6: 
-                # Keep mismatch warning for debugging quality
-                print(f" MISMATCH WARNING: Expected '{expected_name}' but found '{name}'")
-                logging.warning(f"Card Mismatch! Expected: {expected_name}, Found: {name}. Skipping to prevent stale data.")
-                return None
+        if not name_match.same_business(expected_name, name, threshold=0.6):
+            # Keep mismatch warning for debugging quality
+            log.warning(f" MISMATCH WARNING: Expected '{expected_name}' but found '{name}'")
+            return None
     
     if should_skip_company(name):
-        print(f" ⏭️ Skipping non-business: {name}")
-        logging.info(f"Skipping non-business: {name}")
+        log.info(f" ⏭️ Skipping non-business: {name}")
         return None
     
-    print(f"🏢 Company: {name}")
-    logging.info(f"Processing company: {name}")
+    log.info(f"🏢 Company: {name}")
     
-    phone = get_phone_number_from_page(driver)
-    if phone != "Not Found":
-        print(f"   📞 Phone: {phone}")
-        logging.info(f"   📞 Phone: {phone}")
+    phones = get_phone_numbers_from_page(driver)
+    if phones:
+        log.debug(f"   📞 Phone: {', '.join(phones)}")
     else:
-        logging.info("   ⚠️ Phone not found on card")
+        log.debug("   ⚠️ Phone not found on card")
     
     address = get_address_from_page(driver)
     website = get_website_from_page(driver)
+    if metrics:
+        metrics.observe("field_extraction", time.perf_counter() - fields_start, area_name)
     
-    email = "Not Found"
+    emails = []
     final_website = "Not Found"
+    source = None
+    stopping = lambda: cancel_token is not None and cancel_token.cancelled()
     
     if website != "Not Found":
         if is_social_or_google(website):
-            print(f"   ⚠️ Maps website is generic/social ({website}), ignoring...")
+            log.debug(f"   ⚠️ Maps website is generic/social ({website}), ignoring...")
             website = "Not Found"
         else:
-            print(f"    Using Maps website: {website}")
-            logging.info(f"    Using Maps website: {website}")
+            log.debug(f"    Using Maps website: {website}")
             final_website = website
+            source = "maps"
             
-            print(f"   🔍 Extracting emails from Maps website...")
-            emails = extract_emails_from_url(final_website)
-            if not emails:
-                 print(f" ⚠️ No emails found via requests. Trying Selenium extraction (JS support)...")
-                 emails = extract_emails_with_selenium(driver, final_website)
+            log.debug(f"   🔍 Extracting emails from Maps website...")
+            with timed(metrics, "email_crawl", area_name):
+                emails = extract_emails_from_url(final_website, company_name=name)
+            if not emails and not stopping():
+                 log.debug(f" ⚠️ No emails found via requests. Trying Selenium extraction (JS support)...")
+                 with timed(metrics, "selenium_fallback", area_name):
+                     emails = extract_emails_with_selenium(driver, final_website)
+                 emails = email_scoring.best_emails(emails, website=final_website, company_name=name, verify_mx=CONFIG["VERIFY_EMAIL_MX"])
                  
             if emails:
-                email = ", ".join(emails)
-                print(f" 📧 Found emails: {email}")
+                log.debug(f" 📧 Found emails: {', '.join(emails)}")
             else:
-                print(f" ⚠️ No emails found on Maps website")
+                log.debug(f" ⚠️ No emails found on Maps website")
     
-    if final_website == "Not Found":
-        print(f" 🔄 Website missing/invalid in Maps, trying VALID BACKUP SEARCH...")
-        logging.info(f" 🔄 Starting Backup Search for: {name}")
-        backup_website, backup_email = auto_find_website_and_email(name, area_name)
+    if final_website == "Not Found" and not stopping():
+        log.debug(f" 🔄 Website missing/invalid in Maps, trying VALID BACKUP SEARCH...")
+        with timed(metrics, "backup_search", area_name):
+            backup_website, backup_emails = auto_find_website_and_email(name, area_name, cancel_token)
         
         if backup_website != "Not Found":
             final_website = backup_website
-            print(f"    Found backup website: {final_website}")
-            logging.info(f"    Found backup website: {final_website}")
+            source = "backup"
+            log.debug(f"    Found backup website: {final_website}")
             
-            # If auto_find found email, use it
-            if backup_email != "Not Found":
-                email = backup_email
-                print(f"   📧 Found backup email: {email}")
-            else:
+            # If auto_find found emails, use them
+            if backup_emails:
+                emails = backup_emails
+                log.debug(f"   📧 Found backup emails: {', '.join(emails)}")
+            elif not stopping():
                 # IMPORTANT: Manually extract email from backup website
-                print(f"   🔍 Extracting emails from backup website...")
-                extracted_backup_email = extract_emails_from_url(final_website)
-                # extract_emails_from_url returns a LIST, convert to string
-                if extracted_backup_email and isinstance(extracted_backup_email, list) and len(extracted_backup_email) > 0:
-                    email = ", ".join(extracted_backup_email)
-                    print(f" 📧 Found emails: {email}")
+                log.debug(f"   🔍 Extracting emails from backup website...")
+                with timed(metrics, "email_crawl", area_name):
+                    emails = extract_emails_from_url(final_website, company_name=name)
+                if emails:
+                    log.debug(f" 📧 Found emails: {', '.join(emails)}")
                 else:
-                    print(f" ⚠️ No emails found on backup website")
+                    log.debug(f" ⚠️ No emails found on backup website")
     
-    return {
-        "Company Name": name,
-        "Address": address,
-        "Phone (Maps)": phone,
-        "Website": final_website,
-        "Email (Website)": email
-    }
+    return CompanyRecord(
+        name,
+        area=area_name.title(),
+        address=found(address),
+        phones=phones,
+        website=found(final_website),
+        emails=list(emails),
+        source=source
+    )
 
 def extract_name_from_card(card):
     # Added Aria-Label extraction to prevent "Not Found" issues
@@ -764,134 +742,278 @@ def extract_name_from_card(card):
 
     return "Not Found"
 
-def scrape_single_area(area_name, target_count, config=None, progress_callback=None):
-    
-    print(f"\n{'='*60}", flush=True)
-    print(f"📍 STARTING AREA: {area_name.upper()}", flush=True)
-    print(f" TARGET: {target_count} companies", flush=True)
-    print(f"{'='*60}", flush=True)
-    logging.info(f"📍 STARTING AREA: {area_name.upper()} (Target: {target_count})")
+def read_card_listing(card):
+    # What the result list itself shows, without opening the card
+    listing = {"place_id": None, "website": None, "phone": None}
+    try:
+        link = card.find_element(By.CSS_SELECTOR, "a.hfpxzc")
+        href = link.get_attribute("href") or ""
+        match = matchers.PLACE_ID.search(href) or matchers.FEATURE_ID.search(href)
+        if match:
+            listing["place_id"] = match.group(1)
+    except:
+        pass
+    try:
+        site_links = card.find_elements(By.XPATH, ".//a[@data-value='Website' and @href]")
+        if site_links:
+            listing["website"] = clean_url(site_links[0].get_attribute("href"))
+    except:
+        pass
+    try:
+        match = matchers.CARD_PHONE.search(card.text or "")
+        if match:
+            listing["phone"] = match.group(0)
+    except:
+        pass
+    return listing
+
+def load_feed(driver, maps_url, area_name, target_count, progress_callback=None, cancel_token=None, metrics=None):
+    """Open the search feed and scroll it towards target_count cards.
+
+    Returns (block, stopped_early): block is "consent", "captcha" or "short_feed"
+    when Maps is refusing us instead of listing results (see maps_guard).
+    """
+    stopping = lambda: cancel_token is not None and cancel_token.cancelled()
+    stopped_early = False
+
+    log.info(f"🌐 Opening: {maps_url}")
+    driver.get(maps_url)
+    if cancel_token:
+        cancel_token.sleep(5)
+    else:
+        time.sleep(5)
+
+    block = maps_guard.detect_block(driver)
+    if block == "consent" and maps_guard.accept_consent(driver):
+        log.info(f"   🍪 Dismissed the cookie consent page for {area_name}")
+        if metrics:
+            metrics.count("consent_dismissed", area_name)
+        block = None
+    if block:
+        return block, stopped_early
+
+    if progress_callback:
+        progress_callback({
+            "status": "Scrolling",
+            "log": f"Scrolling results for {area_name}..."
+        })
     
-    companies = []
-    driver = None
+    log.debug(f"📜 Loading companies for {area_name}...")
     
+    scrollable_div = None
     try:
-        headless_pref = config.get("HEADLESS", CONFIG["HEADLESS"]) if config else CONFIG["HEADLESS"]
-        driver = create_driver(headless=headless_pref)
-        if not driver:
-            return []
-        
-        # Search Query
-        search_tmpl = config.get("SEARCH_QUERY_TEMPLATE", CONFIG["SEARCH_QUERY_TEMPLATE"]) if config else CONFIG["SEARCH_QUERY_TEMPLATE"]
-        search_query = search_tmpl.format(area=area_name)
-        encoded_query = requests.utils.quote(search_query)
-        maps_url = f"https://www.google.com/maps/search/{encoded_query}"
+        scrollable_div = driver.find_element(By.XPATH, "//div[@role='feed']")
+    except:
+        log.warning("⚠️ Could not find feed element, trying body scroll...")
+    
+    last_card_count = 0
+    same_count_retries = 0
+    max_retries = 20  # Increased from 10 for better loading
 
-        print(f"🌐 Opening: {maps_url}")
-        driver.get(maps_url)
-        time.sleep(5)
+    while True:
+        if stopping():
+            log.info(f"   🛑 Stopping scroll ({cancel_token.reason})")
+            stopped_early = True
+            break
 
-        if progress_callback:
-            progress_callback({
-                "status": "Scrolling",
-                "log": f"Scrolling results for {area_name}..."
-            })
+        cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'Nv2PK')]")
+        current_count = len(cards)
         
-        print(f"📜 Loading companies for {area_name}...", flush=True)
+        log.debug(f"   📋 Cards loaded: {current_count} / {target_count}")
+        if progress_callback and current_count % 20 == 0:
+             progress_callback({"log": f"Loaded {current_count} cards for {area_name}..."})
         
-        scrollable_div = None
-        try:
-            scrollable_div = driver.find_element(By.XPATH, "//div[@role='feed']")
-        except:
-            print("⚠️ Could not find feed element, trying body scroll...")
+        if current_count >= target_count:
+            log.debug(f"    Reached target count!")
+            break
         
-        last_card_count = 0
-        same_count_retries = 0
-        max_retries = 20  # Increased from 10 for better loading
+        if current_count == last_card_count:
+            same_count_retries += 1
 
-        while True:
-            cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'Nv2PK')]")
-            current_count = len(cards)
+            # A real small feed shows the end-of-list note long before this; a stalled one is Maps throttling us
+            if scrollable_div and same_count_retries == maps_guard.SHORT_FEED_SCROLLS and current_count < maps_guard.SHORT_FEED_CARDS:
+                return maps_guard.detect_block(driver) or "short_feed", stopped_early
             
-            print(f"   📋 Cards loaded: {current_count} / {target_count}", flush=True)
-            if progress_callback and current_count % 20 == 0:
-                 progress_callback({"log": f"Loaded {current_count} cards for {area_name}..."})
+            if same_count_retries >= 3:
+                 try:
+                     if cards:
+                        driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", cards[-1])
+                        time.sleep(1)
+                        try:
+                            cards[-1].click()
+                        except:
+                            driver.execute_script("arguments[0].click();", cards[-1])
+                        time.sleep(1)
+                        # Return focus to body/list
+                        try:
+                            driver.find_element(By.TAG_NAME, "body").click()
+                        except: pass
+                 except: pass
             
-            if current_count >= target_count:
-                print(f"    Reached target count!", flush=True)
+            if same_count_retries >= max_retries:
+                log.warning(f"   ⚠️ No new cards found after {max_retries} scrolls. Stopping.")
                 break
-            
-            if current_count == last_card_count:
-                same_count_retries += 1
-                
-                if same_count_retries >= 3:
-                     try:
-                         if cards:
-                            driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", cards[-1])
-                            time.sleep(1)
-                            try:
-                                cards[-1].click()
-                            except:
-                                driver.execute_script("arguments[0].click();", cards[-1])
-                            time.sleep(1)
-                            # Return focus to body/list
-                            try:
-                                driver.find_element(By.TAG_NAME, "body").click()
-                            except: pass
-                     except: pass
-                
-                if same_count_retries >= max_retries:
-                    print(f"   ⚠️ No new cards found after {max_retries} scrolls. Stopping.", flush=True)
-                    break
-            else:
-                same_count_retries = 0
-                last_card_count = current_count
-            
-            try:
-                if scrollable_div:
+        else:
+            same_count_retries = 0
+            last_card_count = current_count
+        
+        try:
+            if scrollable_div:
+                try:
+                    ActionChains(driver).move_to_element(scrollable_div).perform()
+                    scrollable_div.send_keys(Keys.PAGE_DOWN)
+                except Exception:
                     try:
-                        ActionChains(driver).move_to_element(scrollable_div).perform()
-                        scrollable_div.send_keys(Keys.PAGE_DOWN)
+                        ActionChains(driver).move_to_element(scrollable_div).click().send_keys(Keys.PAGE_DOWN).perform()
                     except Exception:
-                        try:
-                            ActionChains(driver).move_to_element(scrollable_div).click().send_keys(Keys.PAGE_DOWN).perform()
-                        except Exception:
-                            driver.execute_script("arguments[0].scrollTop += 700;", scrollable_div)
-                    
-                    time.sleep(0.5)
-                    try:
-                        scrollable_div.send_keys(Keys.END)
-                    except:
-                        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", scrollable_div)
-
-                else:
-                    driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                        driver.execute_script("arguments[0].scrollTop += 700;", scrollable_div)
                 
-                time.sleep(random.uniform(1.5, 2.5))  # Faster scroll loading
+                time.sleep(0.5)
+                try:
+                    scrollable_div.send_keys(Keys.END)
+                except:
+                    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", scrollable_div)
+
+            else:
+                driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            
+            time.sleep(random.uniform(1.5, 2.5))  # Faster scroll loading
+            
+            # Check for "You've reached the end of the list"
+            if "You've reached the end of the list" in driver.page_source:
+                log.debug("    Reached end of list.")
+                break
                 
-                # Check for "You've reached the end of the list"
-                if "You've reached the end of the list" in driver.page_source:
-                    print("    Reached end of list.", flush=True)
-                    break
-                    
-            except Exception as e:
-                print(f"   ⚠️ Scroll loop error: {e}", flush=True)
-                # Recover by trying to refocus the body
-                try: driver.find_element(By.TAG_NAME, "body").click() 
-                except: pass
-                time.sleep(2)
+        except Exception as e:
+            log.warning(f"   ⚠️ Scroll loop error: {e}")
+            # Recover by trying to refocus the body
+            try: driver.find_element(By.TAG_NAME, "body").click() 
+            except: pass
+            time.sleep(2)
+
+    return None, stopped_early
+
+
+def scrape_single_area(area_name, target_count, config=None, progress_callback=None, journal=None, resume_state=None, store=None, writer=None, cancel_token=None, metrics=None, claims=None, tile=None):
+    # Pool threads are reused across areas, so reset the tags every record from this thread carries
+    clear_log_context()
+    # A tile of an area is its own unit in the journal and claims; its companies still belong to the area
+    unit = geo_tiles.unit_name(area_name, tile)
+    set_log_context(run_id=journal.run_id if journal else None, area=unit)
+    log.info(f"📍 STARTING AREA: {unit.upper()} (Target: {target_count})")
+    
+    companies = []
+    done_cards = set()
+    incremental = bool(store) and (config.get("INCREMENTAL", CONFIG["INCREMENTAL"]) if config else CONFIG["INCREMENTAL"])
+    carried_count = 0
+    claimed_elsewhere = 0
+    if resume_state:
+        companies = [CompanyRecord.from_row(row) for row in resume_state.get("companies", [])]
+        if writer:
+            writer.extend(resume_state.get("companies", []))
+        done_cards = set(resume_state.get("done_cards", set()))
+        log.info(f"♻️ Resuming {area_name}: {len(companies)} companies, {len(done_cards)} cards already done")
+        if len(companies) >= target_count:
+            if journal:
+                journal.complete_area(unit)
+            return companies
+
+    stopping = lambda: cancel_token is not None and cancel_token.cancelled()
+    stopped_early = False
+
+    # Wait for a free browser slot, but give up if the run is cancelled meanwhile
+    while not BROWSER_POOL.acquire(timeout=1):
+        if stopping():
+            log.info(f"🛑 {area_name}: run stopped ({cancel_token.reason}) before a browser was free")
+            return companies
+    driver = None
+
+    # The per-area budget starts once the area actually has a browser
+    area_budget = config.get("AREA_TIME_BUDGET") if config else CONFIG.get("AREA_TIME_BUDGET")
+    if area_budget:
+        cancel_token = (cancel_token or CancelToken()).child(area_budget)
+    
+    try:
+        if stopping():
+            return companies
+
+        headless_pref = config.get("HEADLESS", CONFIG["HEADLESS"]) if config else CONFIG["HEADLESS"]
+        with timed(metrics, "driver_startup", area_name):
+            driver = create_driver(headless=headless_pref)
+        if not driver:
+            return companies
         
-        cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'Nv2PK')]")
-        print(f"\n✅ Total Cards Loaded: {len(cards)}", flush=True)
+        # Search Query
+        search_tmpl = config.get("SEARCH_QUERY_TEMPLATE", CONFIG["SEARCH_QUERY_TEMPLATE"]) if config else CONFIG["SEARCH_QUERY_TEMPLATE"]
+        search_query = search_tmpl.format(area=area_name)
+        if tile:
+            # The viewport does the locating, so the tile query leaves the area name out
+            search_query = (config or CONFIG).get("TILE_QUERY") or search_query
+        encoded_query = requests.utils.quote(search_query)
+        maps_base = config.get("MAPS_BASE_URL", CONFIG["MAPS_BASE_URL"]) if config else CONFIG["MAPS_BASE_URL"]
+        maps_url = f"{maps_base}/search/{encoded_query}" + (tile.url_suffix() if tile else "")
+
+        listing_start = time.perf_counter()
+        block, stopped_early = load_feed(driver, maps_url, area_name, target_count, progress_callback, cancel_token, metrics)
+
+        # --- MAPS BLOCKED: narrow the pool, cool down, retry with a fresh browser ---
+        recycles = 0
+        while block:
+            if metrics:
+                metrics.count(f"maps_{block}", area_name)
+            cooldown = BROWSER_POOL.report_block(block)
+            if recycles >= maps_guard.MAX_RECYCLES or stopping():
+                break
+            recycles += 1
+            log.warning(f"   🚧 {area_name}: Maps {block}; new browser in {cooldown:.0f}s ({recycles}/{maps_guard.MAX_RECYCLES})")
+            try:
+                driver.quit()
+            except: pass
+            driver = None
+            if cancel_token:
+                cancel_token.sleep(cooldown)
+            else:
+                time.sleep(cooldown)
+            if stopping():
+                break
+            with timed(metrics, "driver_startup", area_name):
+                driver = create_driver(headless=headless_pref)
+            if not driver:
+                return companies
+            if metrics:
+                metrics.count("driver_recycled", area_name)
+            block, stopped_early = load_feed(driver, maps_url, area_name, target_count, progress_callback, cancel_token, metrics)
+
+        if block:
+            # Leave the area open in the journal; a resume picks it up once Maps lets us back in
+            stopped_early = True
+            cards = []
+            if not stopping():
+                log.warning(f"🚧 {area_name}: still blocked by Maps ({block}); leaving it for a resume")
+                if metrics:
+                    metrics.count("area_deferred", area_name)
+                if progress_callback:
+                    progress_callback({
+                        "log": f"[POPUP] 🚧 Google Maps is rate limiting this machine. {area_name} was deferred; resume the run later.",
+                        "popup": True,
+                        "duration": 12000
+                    })
+        else:
+            cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'Nv2PK')]")
+            if not stopped_early:
+                BROWSER_POOL.report_clean()
+        if metrics:
+            metrics.observe("listing", time.perf_counter() - listing_start, area_name)
+        log.info(f"✅ Total Cards Loaded: {len(cards)}")
         
-        if len(cards) < 40 and progress_callback:
+        if len(cards) < 40 and progress_callback and not stopped_early and not tile:
             warning_msg = (
                 "⚠️ LOW RESULTS DETECTED!\n"
                 "Please check your internet connection.\n"
                 "SUGGESTION: Clear your browser cache/history and run again for maximum results."
             )
-            print(f"\n{warning_msg}\n")
+            log.warning(warning_msg)
             if progress_callback:
                 # Custom popup logic for frontend - using 'log' with specific prefix
                 progress_callback({
@@ -901,21 +1023,32 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                 })
         
         limit_to_process = min(len(cards), target_count)
-        print(f"\n🔄 Processing {limit_to_process} cards...")
+        log.info(f"🔄 Processing {limit_to_process} cards...")
         
         # DON'T scroll to top - it closes the list panel!
         # Just start processing cards directly
         
-        processed_count = 0
+        processed_count = len(companies)
         skipped_count = 0
-        seen_companies = set()
+        seen_companies = {c.name for c in companies}
+        card_errors = 0
         
         for i in range(limit_to_process):
             if len(companies) >= target_count:
-                print(f"    ✅ Reached target count of {target_count}!", flush=True)
+                log.info(f"    ✅ Reached target count of {target_count}!")
+                break
+
+            if i in done_cards:
+                continue
+
+            if stopping():
+                log.info(f"   🛑 Stopping {area_name} at card {i+1} ({cancel_token.reason}); keeping {len(companies)} companies")
+                stopped_early = True
                 break
             
-            print(f"\n--- Card {i+1}/{limit_to_process} ---", flush=True)
+            log.debug(f"--- Card {i+1}/{limit_to_process} ---")
+            card_handled = False
+            card_name, listing = "Not Found", {}
             
             try:
                 # Refresh cards list to avoid stale elements after navigation
@@ -923,19 +1056,20 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                 
                 # CRITICAL: If list is empty/too small after navigation, wait for reload
                 if len(cards_fresh) < limit_to_process and i > 0:
-                    print(f"   ⚠️ List shrunk ({len(cards_fresh)} cards). Waiting for reload...", flush=True)
+                    log.debug(f"   ⚠️ List shrunk ({len(cards_fresh)} cards). Waiting for reload...")
                     retry_count = 0
                     while len(cards_fresh) < limit_to_process and retry_count < 5:
                         time.sleep(2)
                         cards_fresh = driver.find_elements(By.XPATH, "//div[contains(@class, 'Nv2PK')]")
                         retry_count += 1
-                    print(f"   ✅ List reloaded: {len(cards_fresh)} cards", flush=True)
+                    log.debug(f"   ✅ List reloaded: {len(cards_fresh)} cards")
                 
                 if i >= len(cards_fresh):
-                    print(f"   ⚠️ Card index {i+1} out of range (list has {len(cards_fresh)} cards). Skipping.")
+                    log.warning(f"   ⚠️ Card index {i+1} out of range (list has {len(cards_fresh)} cards). Skipping.")
                     continue
                     
                 card = cards_fresh[i]  # Use list index instead of XPath
+                card_handled = True
                 
                 try:
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'auto'});", card)
@@ -955,7 +1089,7 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                     try:
                          try:
                              outer_html = card.get_attribute('outerHTML')
-                             logging.warning(f"FAILED CARD HTML (Card {i+1}): {outer_html}")
+                             log.warning(f"FAILED CARD HTML (Card {i+1}): {outer_html}")
                          except: pass
 
                          # Force re-fetch of list if element is stale/invalid
@@ -967,23 +1101,59 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                         pass
                 
                 if card_name != "Not Found" and card_name in seen_companies:
-                    print(f"   ⏭️ Already processed: {card_name[:30]}...")
+                    log.debug(f"   ⏭️ Already processed: {card_name[:30]}...")
+                    skipped_count += 1
+                    continue
+
+                listing = read_card_listing(card) if (store or claims) else {}
+
+                # --- CROSS-AREA CLAIMS: another area already has this business ---
+                if claims and not claims.claim(listing.get("place_id"), card_name, owner=unit):
+                    log.debug(f"   ⏭️ Claimed by another area: {card_name[:40]}")
+                    claimed_elsewhere += 1
                     skipped_count += 1
                     continue
+
+                # --- INCREMENTAL MODE: carry forward unchanged businesses ---
+                if incremental and card_name != "Not Found":
+                    known = store.lookup(listing.get("place_id"), card_name)
+                    if known and not store.has_changed(known, listing):
+                        record = CompanyRecord.from_row(known["data"], area=area_name.title(), place_id=listing.get("place_id"))
+                        if record.name not in seen_companies:
+                            seen_companies.add(record.name)
+                            seen_companies.add(card_name)
+                            companies.append(record)
+                            store.touch(known["key"])
+                            row = record.to_row()
+                            if journal:
+                                journal.record_company(unit, i, row, record.place_id)
+                            if writer:
+                                writer.append(row)
+                            processed_count += 1
+                            carried_count += 1
+                            log.debug(f"   ♻️ Unchanged, carried forward: {card_name[:40]}")
+                            if progress_callback:
+                                progress_callback({
+                                    "processed": processed_count,
+                                    "total": target_count,
+                                    "current_area": area_name
+                                })
+                        continue
                 
                 # DON'T try to close buttons before processing!
                 # It accidentally closes the search results panel
                 
                 click_success = False
+                click_start = time.perf_counter()
                 max_click_retries = 3
-                last_company_name = companies[-1]['Company Name'] if companies else None
+                last_company_name = companies[-1].name if companies else None
 
                 for click_attempt in range(max_click_retries):
                     if click_success:
                         break
                         
                     try:
-                        print(f"   🔄 Click attempt {click_attempt + 1}/{max_click_retries}...", flush=True)
+                        log.debug(f"   🔄 Click attempt {click_attempt + 1}/{max_click_retries}...")
                         try:
                             ActionChains(driver).move_to_element(card).perform()
                         except:
@@ -999,7 +1169,7 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                         start_wait = time.time()
                         details_name = "Not Found"
                         
-                        while time.time() - start_wait < 6: # Wait up to 6s
+                        while time.time() - start_wait < 6 and not stopping(): # Wait up to 6s
                             try:
                                  # 1. Try Name Verification
                                  verification_selectors = [
@@ -1024,7 +1194,7 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                                          continue
                                 
                                  if current_candidate != "Not Found":
-                                     if last_company_name and (last_company_name.lower() in current_candidate.lower() or current_candidate.lower() in last_company_name.lower()):
+                                     if last_company_name and name_match.overlaps(last_company_name, current_candidate):
                                           time.sleep(0.3)
                                           continue
                                      
@@ -1053,37 +1223,56 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                     except Exception as e:
                         time.sleep(1)
 
+                if metrics:
+                    metrics.observe("card_click", time.perf_counter() - click_start, area_name)
                 company_details = None  # Initialize to avoid UnboundLocalError
                 
                 if not click_success:
-                     print(f" Failed to open card for: {card_name}. Processing next...", flush=True)
+                     # A challenge page mid-area: stop here and leave the remaining cards for a resume
+                     block = maps_guard.detect_block(driver)
+                     if block:
+                         if metrics:
+                             metrics.count(f"maps_{block}", area_name)
+                         BROWSER_POOL.report_block(block)
+                         log.warning(f"🚧 {area_name}: Maps {block} at card {i+1}; leaving the rest for a resume")
+                         if claims:
+                             claims.release(listing.get("place_id"), card_name, owner=unit)
+                         card_handled = False
+                         stopped_early = True
+                         break
+                     log.warning(f" Failed to open card for: {card_name}. Processing next...")
                      # DO NOT CONTINUE HERE - We must still try to go back/reset state!
                      # continue 
                 else: 
                      # Increased delay to ensure data loads properly
                      time.sleep(2.5)  # Reverted for reliability 
-                     company_details = extract_company_details(driver, area_name, expected_name=card_name)
+                     company_details = extract_company_details(driver, area_name, expected_name=card_name, cancel_token=cancel_token, metrics=metrics)
                 
                 if company_details:
-                    company_name = company_details['Company Name']
+                    company_name = company_details.name
                     
                     # STUCK PANE DETECTION: If the extracted name matches the PREVIOUSLY processed company
-                    if len(companies) > 0 and company_name == companies[-1]['Company Name']:
-                         print(f"   ⚠️ Stuck on previous company ({company_name}). Retrying card...")
+                    if len(companies) > 0 and company_name == companies[-1].name:
+                         log.warning(f"   ⚠️ Stuck on previous company ({company_name}). Retrying card...")
                          pass
 
                     if company_name in seen_companies:
-                        print(f"   ⏭️ Duplicate company skipped: {company_name[:30]}...")
+                        log.debug(f"   ⏭️ Duplicate company skipped: {company_name[:30]}...")
                         skipped_count += 1
                     else:
                         seen_companies.add(company_name)
-                        company_data = {
-                            "Area": area_name.title(),
-                            **company_details
-                        }
-                        companies.append(company_data)
+                        company_details.place_id = listing.get("place_id")
+                        companies.append(company_details)
+                        # Display columns only from here on: journal, spool file, store
+                        row = company_details.to_row()
+                        if journal:
+                            journal.record_company(unit, i, row, company_details.place_id)
+                        if writer:
+                            writer.append(row)
+                        if store:
+                            store.upsert(row, company_details.place_id, listing)
                         processed_count += 1
-                        print(f" {area_name}: {processed_count}. {company_details['Company Name'][:40]}...")
+                        log.info(f" {area_name}: {processed_count}. {company_name[:40]}...")
 
                         # --- PROGRESS UPDATE FOR FRONTEND ---
                         if progress_callback:
@@ -1096,6 +1285,9 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                         # ------------------------------------
                 else:
                     skipped_count += 1
+                    if claims:
+                        # Nothing was extracted; let another area that lists it try
+                        claims.release(listing.get("place_id"), card_name, owner=unit)
                 
                 # --- NAVIGATION RESET LOGIC ---
                # CRITICAL: Close detail panel after extraction
@@ -1108,9 +1300,21 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                     # ESC fallback
                     driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
                     time.sleep(0.5)
+                card_errors = 0
                                     
             except Exception as e:
-                print(f"    Error processing card {i+1}: {str(e)[:50]}")
+                # Not recorded as done: a resume (or another area) retries it
+                if card_handled and claims:
+                    claims.release(listing.get("place_id"), card_name, owner=unit)
+                card_handled = False
+                card_errors += 1
+                if isinstance(e, InvalidSessionIdException) or card_errors >= MAX_CARD_ERRORS or not driver_alive(driver):
+                    log.error(f"💥 {area_name}: browser lost at card {i+1} ({str(e)[:80]}); leaving the rest for a resume")
+                    if metrics:
+                        metrics.count("browser_lost", area_name)
+                    stopped_early = True
+                    break
+                log.warning(f"    Error processing card {i+1}: {str(e)[:50]}")
                 # Only use browser back if we are sure we are not on the list page
                 # to avoid clearing the search query.
                 try:
@@ -1119,40 +1323,273 @@ def scrape_single_area(area_name, target_count, config=None, progress_callback=N
                 except:
                     pass
                 continue
-
-        print(f"\n✅ {area_name}: Collected {len(companies)} companies, Skipped {skipped_count}")
+            finally:
+                if journal and card_handled:
+                    journal.record_card(unit, i)
+
+        log.info(f"✅ {area_name}: Collected {len(companies)} companies, Skipped {skipped_count}")
+        if incremental:
+            log.info(f"   ♻️ {carried_count} unchanged companies carried forward from the store")
+        if claimed_elsewhere:
+            log.info(f"   🔗 {claimed_elsewhere} businesses skipped, already claimed by another area")
+        backup_sites = sum(1 for c in companies if c.source == "backup")
+        if backup_sites:
+            log.info(f"   🔍 {backup_sites} websites found by the backup domain search")
+        # A stopped area stays open in the journal so a resume can finish it
+        if journal and not stopped_early:
+            journal.complete_area(unit)
         
     except Exception as e:
-        print(f" Error scraping {area_name}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f" Error scraping {area_name}: {str(e)}")
     
     finally:
         if driver:
             try:
                 driver.quit()
             except: pass
+        BROWSER_POOL.release()
     
     return companies
 
-def run_scraper(areas, city, category="it", custom_query="", progress_callback=None):
-    print("\n" + "="*60, flush=True)
-    print("🏢 SURAT IT COMPANIES SCRAPER - INTEGRATED MODE", flush=True)
-    print("="*60, flush=True)
+def run_areas(area_tasks, progress_callback, journal, store, writer, run_token, metrics, claims):
+    """Scrape the areas on threads in this process, up to BROWSER_INSTANCES at a time."""
+    max_workers = max(1, min(CONFIG.get("BROWSER_INSTANCES", 2), len(area_tasks)))
+    log.info(f"🚀 Starting {max_workers} parallel browser(s) for {len(area_tasks)} area(s)...")
     
-    all_companies = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Submit all tasks
+        future_to_area = {
+            executor.submit(scrape_single_area, area, target, config, progress_callback, journal, area_state, store, writer, run_token, metrics, claims, tile): geo_tiles.unit_name(area, tile)
+            for area, target, config, area_state, tile in area_tasks
+        }
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_area):
+            area_name = future_to_area[future]
+            try:
+                area_results = future.result()
+                if area_results:
+                    log.info(f"✅ {area_name}: Successfully collected {len(area_results)} companies")
+                else:
+                    log.warning(f"⚠️ {area_name}: No results collected")
+            except Exception as e:
+                log.exception(f"❌ {area_name}: Error occurred - {str(e)[:100]}")
+
+def start_worker_process(queue_path, run_id):
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+    return subprocess.Popen([
+        sys.executable, worker_script, "--queue", os.path.abspath(queue_path), "--run-id", run_id,
+        "--lease-seconds", str(CONFIG["LEASE_SECONDS"])
+    ])
+
+def coordinate_workers(area_tasks, journal, writer, run_token, claims_path, processes, progress_callback=None, metrics=None):
+    """Run the areas as work-queue units leased by worker.py processes; their results stream into journal and writer.
+
+    Each lease's timings and event counters are merged into metrics as its unit finishes.
+    """
+    run_id = journal.run_id
+    queue = WorkQueue(CONFIG["QUEUE_DB"], lease_seconds=CONFIG["LEASE_SECONDS"])
+    units = []
+    collected = 0
+    for area, target, config, area_state, tile in area_tasks:
+        resume = None
+        if area_state:
+            # In-process areas add these in scrape_single_area; a worker only pushes what is new
+            writer.extend(area_state["companies"])
+            collected += len(area_state["companies"])
+            resume = {"companies": area_state["companies"], "done_cards": sorted(area_state["done_cards"])}
+        units.append((geo_tiles.unit_name(area, tile), {
+            "area": area, "tile": tile, "target": target, "config": config, "claims_db": claims_path, "resume": resume
+        }))
+    queue.add_units(run_id, units)
+    total = sum(task[1] for task in area_tasks)
+
+    workers = [start_worker_process(CONFIG["QUEUE_DB"], run_id) for _ in range(processes)]
+    respawns = processes * MAX_ATTEMPTS
+    log.info(f"🧩 {len(units)} area unit(s) queued in {CONFIG['QUEUE_DB']}; {processes} local worker process(es) started")
+
+    def replay(seq):
+        """Copy results pushed after seq into the run journal and writer; returns (last seq, companies added)."""
+        added = 0
+        for seq, area, card, row, place_id in queue.results_since(run_id, seq):
+            if row is None:
+                journal.record_card(area, card)
+            else:
+                journal.record_company(area, card, row, place_id)
+                writer.append(row)
+                added += 1
+        return seq, added
+
+    def merge_metrics(seq):
+        for seq, _, exported in queue.metrics_since(run_id, seq):
+            if metrics:
+                metrics.merge(exported)
+        return seq
+
+    seq = 0
+    metrics_seq = 0
+    finished = set()
+    stop_sent = False
+    last_progress = None
+    while True:
+        seq, added = replay(seq)
+        collected += added
+        metrics_seq = merge_metrics(metrics_seq)
+        queue.reissue_expired(run_id)
+        status = queue.units(run_id)
+        for unit in status:
+            if unit["status"] == "done" and unit["unit_id"] not in finished:
+                finished.add(unit["unit_id"])
+                journal.complete_area(unit["unit_id"])
+                log.info(f"✅ {unit['unit_id']}: unit done")
+        pending = [u for u in status if u["status"] in ("queued", "leased")]
+
+        live = queue.workers(run_id)
+        progress = (collected, len(finished), len(live))
+        if progress_callback and progress != last_progress:
+            last_progress = progress
+            progress_callback({
+                "processed": collected,
+                "total": total,
+                "current_area": f"{len(finished)}/{len(units)} areas · {len(live)} worker(s)"
+            })
+
+        if run_token.cancelled() and not stop_sent:
+            log.info(f"🛑 Stopping workers ({run_token.reason})")
+            queue.request_stop(run_id)
+            stop_sent = True
+        if not pending:
+            break
+        # A crashed local worker is replaced while there is queued work for it
+        if any(u["status"] == "queued" for u in pending) and not stop_sent:
+            for i, proc in enumerate(workers):
+                if proc.poll() is not None and respawns > 0:
+                    respawns -= 1
+                    log.warning(f"👷 Worker process {proc.pid} exited ({proc.returncode}); starting another")
+                    workers[i] = start_worker_process(CONFIG["QUEUE_DB"], run_id)
+        # Out of local workers and respawns, and nobody else is heartbeating: nothing will take the rest
+        if processes and respawns == 0 and not live and all(proc.poll() is not None for proc in workers):
+            abandoned = queue.abandon(run_id, "stopped" if stop_sent else "failed", None if stop_sent else "no worker processes left")
+            log.error(f"❌ All worker processes exited; {abandoned} unit(s) left for a resume")
+            break
+        time.sleep(1)
+
+    # Whatever the last workers pushed between the final poll and their finish
+    replay(seq)
+    merge_metrics(metrics_seq)
+    for unit in queue.units(run_id):
+        if unit["status"] == "failed":
+            log.error(f"❌ {unit['unit_id']}: failed after {unit['attempts']} lease(s): {unit['error']}")
+        elif unit["status"] != "done":
+            log.warning(f"⚠️ {unit['unit_id']}: {unit['status']}; left for a resume")
+    for proc in workers:
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.terminate()
+    queue.close()
+
+def area_tiles(area, city, config):
+    """Map viewports covering an area, each scraped as its own short feed; [None] (whole area) if it cannot be located."""
+    bounds = geo_tiles.area_bounds(area, city, http.get, overrides=config.get("AREA_BOUNDS"))
+    if not bounds:
+        log.warning(f"⚠️ {area}: no bounding box, searching it as one area")
+        return [None]
+    tiles = geo_tiles.tile_grid(bounds, tile_km=config.get("TILE_KM", geo_tiles.TILE_KM),
+                                max_tiles=config.get("MAX_TILES_PER_AREA", geo_tiles.MAX_TILES))
+    log.info(f"🗺️ {area}: {len(tiles)} tile(s) at zoom {tiles[0].zoom}")
+    return tiles
+
+def tile_query(custom_query="", category="it", city=""):
+    """Search text inside a tile: the viewport is the location, so no area, city or "in ..." phrase.
+
+    "IT companies in {area} surat" -> "IT companies". Falls back to the category
+    when nothing but the location is left.
+    """
+    # "in {area} ..." runs to the end of the template: everything after it is location too
+    query = re.sub(r"\s*\b(?:in|near|around)\s+\{area\}.*$", " ", custom_query, flags=re.IGNORECASE)
+    query = query.replace("{area}", " ")
+    if city:
+        query = re.sub(rf"\b{re.escape(city)}\b", " ", query, flags=re.IGNORECASE)
+    query = " ".join(query.replace(",", " ").split())
+    query = re.sub(r"\s*\b(?:in|near|around)$", "", query, flags=re.IGNORECASE)
+    if query:
+        return query
+    return "IT companies" if category == "it" else category
+
+def run_scraper(areas, city, category="it", custom_query="", progress_callback=None, resume_run_id=None, incremental=None, run_id=None,
+                cancel_token=None, time_budget=None, area_time_budget=None, worker_processes=None, tiled=None):
+    setup_logging(CONFIG["LOG_LEVEL"], CONFIG["CONSOLE_LOG_LEVEL"])
+    log.info("🏢 SURAT IT COMPANIES SCRAPER - INTEGRATED MODE")
+    started_at = datetime.now().isoformat(timespec="seconds")
     
     # Get valid areas
     valid_areas = [area.strip() for area in areas if area.strip()]
     
     if not valid_areas:
-        print("⚠️ No valid areas provided!")
+        log.warning("⚠️ No valid areas provided!")
         return None
+
+    # --- RUN JOURNAL (checkpoint / resume) ---
+    resume = load_journal(resume_run_id) if resume_run_id else None
+    if tiled is None:
+        tiled = CONFIG.get("GEO_TILES", False)
+    # Tiles are fixed when the run starts; a resume reuses them so its unit keys match the journal
+    tiles_by_area = None
+    if resume and resume["meta"].get("tiled") is not None:
+        tiled = resume["meta"]["tiled"]
+        tiles_by_area = {
+            area: [geo_tiles.Tile(*t) for t in tiles] if tiles else [None]
+            for area, tiles in (resume["meta"].get("tiles") or {}).items()
+        }
+    if tiled:
+        tiles_by_area = tiles_by_area or {}
+        for area in valid_areas:
+            if area not in tiles_by_area:
+                tiles_by_area[area] = area_tiles(area, city, CONFIG)
+    if resume:
+        log.info(f"♻️ Resuming run {resume_run_id}: {len(resume['done_areas'])} area(s) already finished")
+        journal = RunJournal(run_id=resume_run_id)
+    else:
+        journal = RunJournal(run_id=run_id)
+        journal.start(valid_areas, city, category, custom_query, tiled=bool(tiled), tiles={
+            area: [list(t) for t in tiles] if tiles[0] else None for area, tiles in tiles_by_area.items()
+        } if tiled else None)
+    metrics = run_metrics.start_run(journal.run_id)
+    set_log_context(run_id=journal.run_id)
+
+    store = CompanyStore()
+    if worker_processes is None:
+        worker_processes = CONFIG.get("WORKER_PROCESSES")
+    # One claim per business per run, however many areas list it; worker processes share them through SQLite
+    claims_path = CONFIG.get("CLAIMS_DB") or (CONFIG["QUEUE_DB"] if worker_processes is not None else None)
+    claims = ClaimRegistry(run_id=journal.run_id, path=claims_path)
+    if resume:
+        # By place ID, like live cards; by name only for companies journaled without one
+        for area, claimed in resume["claimed"].items():
+            for place_id, name in claimed:
+                claims.claim(place_id, name, owner=area)
+    if incremental is None:
+        incremental = CONFIG.get("INCREMENTAL", False)
+    if incremental:
+        log.info("♻️ Incremental mode: only new or changed businesses will be enriched")
+
+    # --- CANCELLATION / TIME BUDGETS ---
+    run_token = CancelToken(budget=time_budget or CONFIG.get("RUN_TIME_BUDGET"), parent=cancel_token)
+    if area_time_budget is None:
+        area_time_budget = CONFIG.get("AREA_TIME_BUDGET")
+
+    # --- STREAMING OUTPUT: rows hit disk as soon as they are extracted ---
+    writer = StreamingExcelWriter(output_filename(journal.run_id), postprocess=postprocess.finalize_frame)
+    if progress_callback:
+        progress_callback({"partial_file": os.path.basename(writer.partial_path)})
     
-    # Prepare configs for each area
+    # Prepare configs for each area (or each tile of it)
     area_tasks = []
     for area in valid_areas:
         config = CONFIG.copy()
+        config["INCREMENTAL"] = incremental
+        config["AREA_TIME_BUDGET"] = area_time_budget
         if custom_query:
             config["SEARCH_QUERY_TEMPLATE"] = custom_query
         else:
@@ -1163,41 +1600,67 @@ def run_scraper(areas, city, category="it", custom_query="", progress_callback=N
         
         # Use CONFIG target (fallback uses global variable, so only change CONFIG!)
         target = config.get("TARGET_PER_AREA_MIN", TARGET_PER_AREA_MIN)
-        area_tasks.append((area, target, config))
+        tiles = tiles_by_area[area] if tiled else [None]
+        if tiles[0]:
+            target = config.get("TILE_TARGET", target)
+            config["TILE_QUERY"] = tile_query(custom_query, category, city)
+
+        for tile in tiles:
+            unit = geo_tiles.unit_name(area, tile)
+            if resume and unit in resume["done_areas"]:
+                carried = resume["companies"].get(unit, [])
+                writer.extend(carried)
+                log.info(f"⏭️ {unit}: finished in previous run ({len(carried)} companies)")
+                continue
+            area_state = None
+            if resume:
+                area_state = {
+                    "companies": resume["companies"].get(unit, []),
+                    "done_cards": resume["done_cards"].get(unit, set())
+                }
+            area_tasks.append((area, target, config, area_state, tile))
     
     # === PARALLEL PROCESSING ===
-    max_workers = min(CONFIG.get("BROWSER_INSTANCES", 2), len(valid_areas))
-    print(f"\n🚀 Starting {max_workers} parallel browser(s) for {len(valid_areas)} area(s)...\n", flush=True)
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_area = {
-            executor.submit(scrape_single_area, area, target, config, progress_callback): area
-            for area, target, config in area_tasks
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_area):
-            area_name = future_to_area[future]
-            try:
-                area_results = future.result()
-                if area_results:
-                    all_companies.extend(area_results)
-                    print(f"\n✅ {area_name}: Successfully collected {len(area_results)} companies\n", flush=True)
-                else:
-                    print(f"\n⚠️ {area_name}: No results collected\n", flush=True)
-            except Exception as e:
-                print(f"\n❌ {area_name}: Error occurred - {str(e)[:100]}\n", flush=True)
-                import traceback
-                traceback.print_exc()
+    if worker_processes is not None:
+        coordinate_workers(area_tasks, journal, writer, run_token, claims_path, worker_processes, progress_callback, metrics)
+    else:
+        run_areas(area_tasks, progress_callback, journal, store, writer, run_token, metrics, claims)
+
+    stop_reason = run_token.reason
+    if stop_reason:
+        log.info(f"🛑 Run stopped early ({stop_reason}); saving partial results")
+    # Units deferred by a Maps block, left open by a dead browser or abandoned by the workers keep the run resumable;
+    # so does a time budget. A user cancel closes it.
+    open_units = [geo_tiles.unit_name(task[0], task[4]) for task in area_tasks
+                  if geo_tiles.unit_name(task[0], task[4]) not in journal.completed]
+    if open_units and stop_reason != "cancelled":
+        log.info(f"♻️ {len(open_units)} unit(s) left open; resume the run to finish them")
+    close_journal = stop_reason == "cancelled" or (not stop_reason and not open_units)
              
-    if all_companies:
-        filename = save_to_excel_with_backup(all_companies)
+    if writer.row_count:
+        with metrics.span("excel_write"):
+            filename = writer.finalize()
+        log.info(f"💾 SAVED TO: {filename}")
+        get_catalog().record(
+            filename,
+            run_id=journal.run_id,
+            city=city,
+            areas=valid_areas,
+            row_count=writer.row_count,
+            started_at=started_at
+        )
+        report_run_metrics(metrics, journal, progress_callback)
+        if close_journal:
+            journal.finish(filename)
+        journal.close()
+        store.close()
+        claims.close()
         
         # --- FINAL COMPLETION NOTIFICATION ---
         if progress_callback:
+            headline = "✅ Scraping Completed!" if not stop_reason else f"🛑 Scraping stopped ({stop_reason})! Partial results saved."
             progress_callback({
-                "log": f"[POPUP] ✅ Scraping Completed! File ready Please Download: {os.path.basename(filename)}",
+                "log": f"[POPUP] {headline} File ready Please Download: {os.path.basename(filename)}",
                 "popup": True,
                 "duration": 20000, # 20 seconds
                 "status": "Completed"
@@ -1206,54 +1669,44 @@ def run_scraper(areas, city, category="it", custom_query="", progress_callback=N
         
         return filename
     
+    writer.discard()
+    report_run_metrics(metrics, journal, progress_callback)
+    if close_journal:
+        journal.finish(None)
+    journal.close()
+    store.close()
+    claims.close()
     return None
 
+def report_run_metrics(metrics, journal, progress_callback=None):
+    log.info(f"⏱️ RUN TIMINGS ({metrics.run_id})\n{metrics.format_summary()}")
+    log.info(f"🌐 Website requests since start: {http.stats()}")
+    log.info(f"🔎 Website probes since start: {probe.stats()}")
+    summary = metrics.summary()
+    journal.record_metrics(summary)
+    if progress_callback:
+        progress_callback({"metrics": summary})
+
+def output_filename(run_id=None):
+    date_str = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    base_name = f"Surat_data_{date_str}" 
+    if run_id:
+        # Concurrent jobs started in the same minute must not share a file (or its .partial.csv spool)
+        base_name += "_" + re.sub(r"[^A-Za-z0-9_-]", "_", str(run_id))
+    return f"{base_name}.xlsx"
+
 def save_to_excel_with_backup(all_data, filename=None):
     if not filename:
-        date_str = datetime.now().strftime("%Y-%m-%d_%H-%M")
-        base_name = f"Surat_data_{date_str}" 
-        filename = f"{base_name}.xlsx"
-    
-    df = pd.DataFrame(all_data, columns=["Area", "Company Name", "Address", "Phone (Maps)", "Website", "Email (Website)"])
-    df["Address"] = df["Address"].apply(clean_address)
-    df["Company Name"] = df["Company Name"].apply(clean_text)
-    
-    df_clean = df.drop_duplicates(subset=['Company Name', 'Address'], keep='first')
-    df_clean.to_excel(filename, index=False)
-    
-    try:
-        from openpyxl import load_workbook
-        wb = load_workbook(filename)
-        ws = wb.active
-        for column in ws.columns:
-            max_length = 0
-            column = [cell for cell in column]
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            
-            # MOBILE-FRIENDLY: Reduce column widths
-            # Set maximum widths for better mobile viewing
-            if column_letter == 'C':  # Address column
-                adjusted_width = min(max_length + 2, 35)
-            elif column_letter == 'B':  # Company Name column
-                adjusted_width = min(max_length + 2, 30)
-            else:
-                adjusted_width = min(max_length + 2, 40)  # Max 40 for all others
-            
-            ws.column_dimensions[column_letter].width = adjusted_width
-        wb.save(filename)
-    except:
-        pass
+        filename = output_filename()
+
+    writer = StreamingExcelWriter(filename, postprocess=postprocess.finalize_frame)
+    writer.extend(c.to_row() if isinstance(c, CompanyRecord) else c for c in all_data)
+    writer.finalize()
         
-    print(f"\n💾 SAVED TO: {filename}")
+    log.info(f"💾 SAVED TO: {filename}")
     return filename
 
 if __name__ == "__main__":
+    setup_logging(CONFIG["LOG_LEVEL"], CONFIG["CONSOLE_LOG_LEVEL"])
     scrape_single_area("Adajan", 5)
 
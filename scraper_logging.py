@@ -0,0 +1,182 @@
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FILE = "scraper.log"
+RUN_LOG_DIR = "logs"
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+RUN_FILES_OPEN = 8  # Per-run log files kept open by the listener at once
+
+# Standard LogRecord attributes; anything else on a record came in through extra=
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_context = threading.local()
+_listener = None
+_setup_lock = threading.Lock()
+
+
+def set_log_context(**fields):
+    """Tag every record logged from this thread (run_id, area, ...) until cleared."""
+    current = dict(getattr(_context, "fields", {}))
+    current.update({k: v for k, v in fields.items() if v is not None})
+    _context.fields = current
+
+
+def clear_log_context(*names):
+    if not names:
+        _context.fields = {}
+        return
+    current = dict(getattr(_context, "fields", {}))
+    for name in names:
+        current.pop(name, None)
+    _context.fields = current
+
+
+def get_log_context():
+    return dict(getattr(_context, "fields", {}))
+
+
+class ContextFilter(logging.Filter):
+    # Runs in the thread that logs, before the record is queued
+    def filter(self, record):
+        for key, value in getattr(_context, "fields", {}).items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage().strip("\n"),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RunFileHandler(logging.Handler):
+    """Writes records tagged with a run_id to <directory>/<run_id>.log."""
+
+    def __init__(self, directory=RUN_LOG_DIR, max_open=RUN_FILES_OPEN):
+        super().__init__()
+        self.directory = directory
+        self.max_open = max_open
+        self._files = OrderedDict()
+
+    def _file_for(self, run_id):
+        fh = self._files.pop(run_id, None)
+        if fh is None:
+            os.makedirs(self.directory, exist_ok=True)
+            fh = open(os.path.join(self.directory, f"{run_id}.log"), "a", encoding="utf-8")
+        self._files[run_id] = fh
+        while len(self._files) > self.max_open:
+            _, oldest = self._files.popitem(last=False)
+            oldest.close()
+        return fh
+
+    def emit(self, record):
+        run_id = getattr(record, "run_id", None)
+        if not run_id:
+            return
+        try:
+            fh = self._file_for(run_id)
+            fh.write(self.format(record) + "\n")
+            fh.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        for fh in self._files.values():
+            fh.close()
+        self._files.clear()
+        super().close()
+
+
+def _level(value, default):
+    if value is None:
+        return default
+    return value if isinstance(value, int) else logging.getLevelName(str(value).upper())
+
+
+def setup_logging(level=None, console_level=None, log_file=LOG_FILE, run_log_dir=RUN_LOG_DIR,
+                  max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    """Route all logging through a queue drained by one listener thread.
+
+    Callers only enqueue; the listener does the terminal and disk writes, so
+    worker threads never block on I/O. Levels default to SCRAPER_LOG_LEVEL /
+    SCRAPER_CONSOLE_LEVEL (DEBUG to files, INFO to the console). Safe to call
+    more than once; later calls only change the levels they are given.
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            file_handler, console_handler, run_handler = _listener.handlers
+            if level is not None:
+                file_handler.setLevel(_level(level, logging.DEBUG))
+                run_handler.setLevel(_level(level, logging.DEBUG))
+            if console_level is not None:
+                console_handler.setLevel(_level(console_level, logging.INFO))
+            logging.getLogger().setLevel(min(file_handler.level, console_handler.level))
+            return _listener
+
+        file_level = _level(level or os.environ.get("SCRAPER_LOG_LEVEL"), logging.DEBUG)
+        console_level = _level(console_level or os.environ.get("SCRAPER_CONSOLE_LEVEL"), logging.INFO)
+
+        json_format = JsonFormatter()
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(json_format)
+        file_handler.setLevel(file_level)
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        console_handler.setLevel(console_level)
+
+        run_handler = RunFileHandler(run_log_dir)
+        run_handler.setFormatter(json_format)
+        run_handler.setLevel(file_level)
+
+        # Unbounded, so put() never waits on a slow disk or terminal
+        records = queue.SimpleQueue()
+        queue_handler = QueueHandler(records)
+        queue_handler.addFilter(ContextFilter())
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(min(file_level, console_level))
+        for noisy in ("urllib3", "selenium", "WDM", "charset_normalizer"):
+            logging.getLogger(noisy).setLevel(logging.WARNING)
+
+        _listener = QueueListener(records, file_handler, console_handler, run_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging():
+    """Drain the queue and close the log files."""
+    global _listener
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
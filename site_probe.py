@@ -0,0 +1,166 @@
+import time
+import threading
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlparse, urlunparse
+
+import requests
+
+from politeness import RobotsDisallowed
+
+MAX_HOSTS = 50000          # Probe outcomes remembered per process
+DEAD_TTL = 3600            # Seconds a domain that did not answer stays "dead" before it is probed again
+
+Site = namedtuple("Site", "url html")  # Homepage root after redirects; its HTML when this probe fetched it with GET
+
+
+def bare_host(domain):
+    """"acme.com" for "https://www.acme.com/about", "www.acme.com" or "acme.com"."""
+    host = domain.strip().lower()
+    if "://" in host:
+        host = urlparse(host).netloc
+    host = host.split("/")[0].split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+def _root(url):
+    p = urlparse(url)
+    return urlunparse((p.scheme, p.netloc, "/", "", "", ""))
+
+
+class _ErrorStatus(Exception):
+    pass
+
+
+class _Transient(Exception):
+    """A host that may well answer later (timeout, throttling backoff, dropped connection)."""
+
+
+def _unresolvable(error):
+    text = str(error).lower()
+    return "resolve" in text or "name or service not known" in text or "getaddrinfo" in text
+
+
+def _refused(error):
+    # ConnectTimeout is a ConnectionError too, but a host that times out on 80 will not do better on 443
+    return not isinstance(error, requests.Timeout) and "refused" in str(error).lower()
+
+
+class SiteProbe:
+    """Finds the live homepage of a domain with as few requests as possible.
+
+    www.x.com and x.com are one probe. Each host gets one GET (redirects
+    followed, so scheme upgrades and www canonicalisation cost nothing extra);
+    https is only tried when plain http is refused by a host that resolves.
+    Only the resolved URL is remembered per bare domain. The homepage HTML goes
+    to the caller whose probe fetched it, once. Domains that did not answer are
+    remembered for DEAD_TTL; timeouts and throttling backoffs are not remembered.
+    Concurrent probes of the same domain share one request.
+    """
+
+    def __init__(self, http, timeout=8, dead_ttl=DEAD_TTL):
+        self.http = http
+        self.timeout = timeout
+        self.dead_ttl = dead_ttl
+        self._lock = threading.Lock()
+        self._sites = OrderedDict()     # bare host -> (homepage URL or None when dead, expiry or None)
+        self._inflight = {}             # bare host -> Event set when its probe is done
+
+    def probe(self, domain, headers=None):
+        """Site for a domain, or None if it serves nothing.
+
+        Site.html is only set when this call fetched the homepage; a remembered
+        domain comes back with its URL alone.
+        """
+        base = bare_host(domain)
+        if not base:
+            return None
+        waited = False
+        while True:
+            with self._lock:
+                known = self._known(base)
+                if known is not None:
+                    return Site(known, None) if known else None
+                if waited:
+                    # The probe we waited for hit a transient failure; don't pile on the host
+                    return None
+                event = self._inflight.get(base)
+                if event is None:
+                    event = self._inflight[base] = threading.Event()
+                    break
+            event.wait()
+            waited = True
+
+        site, transient = None, False
+        try:
+            site = self._probe_hosts(base, headers)
+        except _Transient:
+            transient = True
+        finally:
+            with self._lock:
+                if site or not transient:
+                    self._sites[base] = (site.url, None) if site else (None, time.time() + self.dead_ttl)
+                    self._sites.move_to_end(base)
+                while len(self._sites) > MAX_HOSTS:
+                    self._sites.popitem(last=False)
+                self._inflight.pop(base).set()
+        return site
+
+    def stats(self):
+        with self._lock:
+            return {
+                "domains": len(self._sites),
+                "live": sum(1 for url, _ in self._sites.values() if url),
+            }
+
+    # --- internals ---
+
+    def _known(self, base):
+        """Remembered URL, "" if remembered dead, None if unknown or expired (caller holds the lock)."""
+        entry = self._sites.get(base)
+        if entry is None:
+            return None
+        url, expires = entry
+        if expires is not None and expires < time.time():
+            del self._sites[base]
+            return None
+        return url or ""
+
+    def _probe_hosts(self, base, headers):
+        """Site of the first host that answers; None if none does, _Transient if one might later."""
+        transient = False
+        for host in (base, "www." + base):
+            try:
+                return self._fetch(f"http://{host}/", headers)
+            except requests.ConnectionError as e:
+                if _unresolvable(e):
+                    continue
+                if not _refused(e):
+                    transient = True
+                    continue
+                # Resolves but refuses plain http: some sites only listen on 443
+                try:
+                    return self._fetch(f"https://{host}/", headers)
+                except (_ErrorStatus, RobotsDisallowed):
+                    continue
+                except requests.ConnectionError as e:
+                    transient = transient or not (_unresolvable(e) or _refused(e))
+                    continue
+                except requests.RequestException:
+                    transient = True
+                    continue
+            except (_ErrorStatus, RobotsDisallowed):
+                continue
+            except requests.RequestException:
+                # Timeouts, HostBackoff, broken responses
+                transient = True
+                continue
+        if transient:
+            raise _Transient(base)
+        return None
+
+    def _fetch(self, url, headers):
+        """Site if url answers 2xx/3xx; raises _ErrorStatus if it answers with an error."""
+        r = self.http.get(url, headers=headers, timeout=self.timeout, allow_redirects=True, verify=False)
+        if 200 <= r.status_code < 400:
+            return Site(_root(r.url), r.text if r.status_code == 200 else None)
+        raise _ErrorStatus(r.status_code)
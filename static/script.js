@@ -7,7 +7,7 @@ let currentMode = 'it';
 
 document.addEventListener('DOMContentLoaded', () => {
     updateAreaTags();
-    pollStatus();
+    connectProgressStream();
 
     // --- Interactive Effects ---
     const cursor = document.querySelector('.cursor-glow');
@@ -139,8 +139,9 @@ async function startScraper() {
 
         const data = await response.json();
         if (data.status === 'success') {
+            watchedJobId = data.job_id;
             sendNotification("Scraper Started 🚀", "You can minimize this tab. The process will run in the background.");
-            pollStatus();
+            connectProgressStream();
         } else {
             alert('Error: ' + data.message);
             document.getElementById('loaderOverlay').style.display = 'none';
@@ -151,101 +152,135 @@ async function startScraper() {
     }
 }
 
-let pollingInterval = null;
-
-function pollStatus() {
-    if (pollingInterval) clearInterval(pollingInterval);
-
-
-    pollingInterval = setInterval(async () => {
-        try {
-            const res = await fetch('/api/status?t=' + new Date().getTime());
-            const data = await res.json();
-
-            if (data.is_scraping) {
-                // Show overlay if not already visible
-                const overlay = document.getElementById('loaderOverlay');
-                if (overlay.style.display === 'none' || overlay.style.display === '') {
-                    overlay.style.display = 'flex';
-                }
-
-                document.getElementById('statusIndicator').innerHTML =
-                    `<span class="dot" style="background: orange; box-shadow: 0 0 10px orange;"></span> Running...`;
-
-                // Update Progress UI
-                if (data.progress) {
-                    const progress = data.progress;
-                    const total = progress.total || 100; // avoid div by zero
-                    const processed = progress.processed || 0;
-                    const percent = Math.min(100, Math.round((processed / total) * 100));
-
-                    document.getElementById('progress-fill').style.width = `${percent}%`;
-                    document.getElementById('status-text').innerText = `${progress.current_area} | ${processed}/${total}`;
-
-                    // Update Logs
-                    const consoleDiv = document.getElementById('log-console');
-                    if (progress.log && progress.log.length > 0) {
-                        // Handle formatting and Popups
-                        const cleanedLogs = [];
-
-                        // Check for new logs to trigger popup
-                        if (progress.log.length > (window.lastLogCount || 0)) {
-                            const newLogs = progress.log.slice(window.lastLogCount || 0);
-                            newLogs.forEach(l => {
-                                if (l.startsWith('[POPUP]')) {
-                                    showToast(l.replace('[POPUP]', '').trim());
-                                }
-                            });
-                            window.lastLogCount = progress.log.length;
-                        }
-
-                        // Prepare logs for console (remove [POPUP] tag for cleaner look)
-                        progress.log.forEach(l => {
-                            cleanedLogs.push(l.replace('[POPUP]', ''));
-                        });
-
-                        consoleDiv.innerHTML = cleanedLogs.map(l => `<div class="log-entry">${l}</div>`).join('');
-                        consoleDiv.scrollTop = consoleDiv.scrollHeight;
-                    }
-                }
+let progressStream = null;
+let watchedJobId = null;
+let progressState = { is_scraping: false, latest_file: null, progress: { total: 0, processed: 0, current_area: '', log: [], status: 'Idle' } };
 
-            } else {
-                document.getElementById('loaderOverlay').style.display = 'none';
-                document.getElementById('statusIndicator').innerHTML =
-                    `<span class="dot"></span> System Ready`;
-
-                // START: Robust Result Logic
-                // If there is a file, we should show it, regardless of whether status is "Completed" or "Idle"
-                if (data.latest_file) {
-                    // Stop polling if we found a file
-                    if (pollingInterval) {
-                        clearInterval(pollingInterval);
-                        pollingInterval = null;
-                    }
+function connectProgressStream() {
+    // Server pushes events as they happen; no polling loop
+    if (progressStream) return;
 
-                    // Only trigger multiple times if we haven't shown it yet (check local var or UI state)
-                    // We check if the panel meets specific visibility or if we tracked the filename
-                    if (window.latestFilename !== data.latest_file) {
-                        sendNotification("Scraping Completed! ✅", "Your data is ready. Click to view results.");
-                        showResults(data.latest_file);
-                        document.getElementById('progress-fill').style.width = `100%`;
-                        document.getElementById('status-text').innerText = "Completed!";
-                    }
-                }
-                // Status says completed but NO file (e.g. 0 results found case)
-                else if (data.progress.status === "Completed" && !data.latest_file) {
-                    clearInterval(pollingInterval);
-                    pollingInterval = null;
-                    alert("Scraping finished but no data was collected. 📉\nTry a different area or keyword.");
-                    document.getElementById('status-text').innerText = "Completed (No Data)";
-                }
-                // END: Robust Result Logic
-            }
-        } catch (e) {
-            console.error(e);
+    progressStream = new EventSource('/api/events');
+
+    // Several jobs may run at once; this dashboard follows one of them
+    const forWatchedJob = (handler) => (e) => {
+        const data = JSON.parse(e.data);
+        if (data.job_id && watchedJobId && data.job_id !== watchedJobId) return;
+        handler(data);
+    };
+
+    progressStream.addEventListener('snapshot', (e) => {
+        const data = JSON.parse(e.data);
+        // Switch to a newly started job only when ours is idle
+        if (watchedJobId && data.job_id !== watchedJobId && progressState.is_scraping) return;
+        progressState = data;
+        watchedJobId = data.job_id || watchedJobId;
+        renderProgress();
+        renderLogs();
+        renderState();
+    });
+
+    progressStream.addEventListener('progress', forWatchedJob((data) => {
+        progressState.progress.processed = data.processed;
+        progressState.progress.total = data.total;
+        progressState.progress.current_area = data.current_area;
+        renderProgress();
+    }));
+
+    progressStream.addEventListener('area', forWatchedJob((data) => {
+        progressState.progress.current_area = data.current_area;
+        renderProgress();
+    }));
+
+    progressStream.addEventListener('log', forWatchedJob((data) => {
+        appendLog(data.line);
+    }));
+
+    progressStream.addEventListener('popup', forWatchedJob((data) => {
+        showToast(data.message);
+    }));
+
+    progressStream.addEventListener('complete', forWatchedJob((data) => {
+        progressState.is_scraping = false;
+        progressState.latest_file = data.latest_file;
+        progressState.progress.status = data.status;
+        appendLog(data.log);
+        renderState();
+
+        // Status says completed but NO file (e.g. 0 results found case)
+        if (data.status === "Completed" && !data.latest_file) {
+            alert("Scraping finished but no data was collected. 📉\nTry a different area or keyword.");
+            document.getElementById('status-text').innerText = "Completed (No Data)";
+        }
+    }));
+
+    progressStream.onerror = () => {
+        // EventSource reconnects by itself and gets a fresh snapshot
+        console.error('Progress stream disconnected, retrying...');
+    };
+}
+
+function renderProgress() {
+    const progress = progressState.progress;
+    const total = progress.total || 100; // avoid div by zero
+    const processed = progress.processed || 0;
+    const percent = Math.min(100, Math.round((processed / total) * 100));
+
+    if (progressState.is_scraping) {
+        document.getElementById('progress-fill').style.width = `${percent}%`;
+        document.getElementById('status-text').innerText = `${progress.current_area} | ${processed}/${total}`;
+    }
+}
+
+function renderLogs() {
+    const consoleDiv = document.getElementById('log-console');
+    const logs = progressState.progress.log || [];
+    if (logs.length === 0) return;
+
+    // Remove [POPUP] tag for cleaner look
+    consoleDiv.innerHTML = logs.map(l => `<div class="log-entry">${l.replace('[POPUP]', '')}</div>`).join('');
+    consoleDiv.scrollTop = consoleDiv.scrollHeight;
+}
+
+function appendLog(line) {
+    if (!line) return;
+    const consoleDiv = document.getElementById('log-console');
+    const entry = document.createElement('div');
+    entry.className = 'log-entry';
+    entry.textContent = line;
+    consoleDiv.appendChild(entry);
+
+    // Keep log size manageable
+    while (consoleDiv.children.length > 50) {
+        consoleDiv.removeChild(consoleDiv.firstChild);
+    }
+    consoleDiv.scrollTop = consoleDiv.scrollHeight;
+}
+
+function renderState() {
+    if (progressState.is_scraping) {
+        // Show overlay if not already visible
+        const overlay = document.getElementById('loaderOverlay');
+        if (overlay.style.display === 'none' || overlay.style.display === '') {
+            overlay.style.display = 'flex';
         }
-    }, 1000);
 
+        document.getElementById('statusIndicator').innerHTML =
+            `<span class="dot" style="background: orange; box-shadow: 0 0 10px orange;"></span> Running...`;
+        return;
+    }
+
+    document.getElementById('loaderOverlay').style.display = 'none';
+    document.getElementById('statusIndicator').innerHTML =
+        `<span class="dot"></span> System Ready`;
+
+    // If there is a file, we should show it, regardless of whether status is "Completed" or "Idle"
+    if (progressState.latest_file && window.latestFilename !== progressState.latest_file) {
+        sendNotification("Scraping Completed! ✅", "Your data is ready. Click to view results.");
+        showResults(progressState.latest_file);
+        document.getElementById('progress-fill').style.width = `100%`;
+        document.getElementById('status-text').innerText = "Completed!";
+    }
 }
 
 function showResults(filename) {
@@ -267,6 +302,11 @@ function downloadData() {
     }
 }
 
+const PREVIEW_PAGE_SIZE = 10;
+// Limit columns for preview; the server only reads these from the results file
+const PREVIEW_COLS = ['Company Name', 'Area', 'Phone (Maps)', 'Website', 'Email (Website)'];
+let viewState = { offset: 0, area: '', hasEmail: false, hasWebsite: false };
+
 async function viewData() {
     const container = document.getElementById('dataPreview');
     // FIX: Check if TABLE exists to toggle. If checking innerHTML != '', it fails because of the initial empty-state text.
@@ -280,29 +320,48 @@ async function viewData() {
         return;
     }
 
+    viewState = { offset: 0, area: '', hasEmail: false, hasWebsite: false };
+    await loadDataPage();
+}
+
+async function loadDataPage() {
+    // Server does the filtering and paging; we only ever render one page
+    const params = new URLSearchParams({ offset: viewState.offset, limit: PREVIEW_PAGE_SIZE, columns: PREVIEW_COLS.join(',') });
+    if (viewState.area) params.set('area', viewState.area);
+    if (viewState.hasEmail) params.set('has_email', '1');
+    if (viewState.hasWebsite) params.set('has_website', '1');
+
     try {
-        const res = await fetch(`/api/view/${window.latestFilename}`);
+        const res = await fetch(`/api/view/${window.latestFilename}?${params}`);
         const result = await res.json();
 
         if (result.status === 'success') {
             const container = document.getElementById('dataPreview');
 
-            if (result.data.length === 0) {
-                container.innerHTML = '<p>No data found in the file.</p>';
-                return;
-            }
+            let html = '<div class="view-filters" style="display: flex; gap: 12px; flex-wrap: wrap; margin-bottom: 10px;">';
+            html += '<select onchange="setViewFilter(\'area\', this.value)"><option value="">All Areas</option>';
+            (result.areas || []).forEach(a => {
+                html += `<option value="${a}" ${a === viewState.area ? 'selected' : ''}>${a}</option>`;
+            });
+            html += '</select>';
+            html += `<label><input type="checkbox" ${viewState.hasEmail ? 'checked' : ''} onchange="setViewFilter('hasEmail', this.checked)"> Has Email</label>`;
+            html += `<label><input type="checkbox" ${viewState.hasWebsite ? 'checked' : ''} onchange="setViewFilter('hasWebsite', this.checked)"> Has Website</label>`;
+            html += '</div>';
 
-            let html = '<div style="overflow-x: auto;"><table><thead><tr>';
+            html += '<div style="overflow-x: auto;"><table><thead><tr>';
 
-            // Limit columns for preview
-            const previewCols = ['Company Name', 'Area', 'Phone (Maps)', 'Website', 'Email (Website)'];
+            const previewCols = PREVIEW_COLS;
 
             previewCols.forEach(col => {
                 html += `<th>${col}</th>`;
             });
             html += '</tr></thead><tbody>';
 
-            result.data.slice(0, 10).forEach(row => {
+            if (result.data.length === 0) {
+                html += `<tr><td colspan="${previewCols.length}">No data found for these filters.</td></tr>`;
+            }
+
+            result.data.forEach(row => {
                 html += '<tr>';
                 previewCols.forEach(col => {
                     let maxChars = 30; // Truncate long text
@@ -322,9 +381,14 @@ async function viewData() {
             });
 
             html += '</tbody></table></div>';
-            if (result.data.length > 10) {
-                html += `<p style="text-align: center; margin-top: 10px; color: #888;">Showing first 10 of ${result.data.length} records. Download full Excel for more.</p>`;
-            }
+
+            const first = result.total === 0 ? 0 : result.offset + 1;
+            const last = result.offset + result.data.length;
+            html += '<div style="display: flex; justify-content: center; align-items: center; gap: 12px; margin-top: 10px; color: #888;">';
+            html += `<button class="action-btn" onclick="changeDataPage(-1)" ${result.offset === 0 ? 'disabled' : ''}><i class="fa-solid fa-chevron-left"></i></button>`;
+            html += `<span>Showing ${first}-${last} of ${result.total} records</span>`;
+            html += `<button class="action-btn" onclick="changeDataPage(1)" ${last >= result.total ? 'disabled' : ''}><i class="fa-solid fa-chevron-right"></i></button>`;
+            html += '</div>';
 
             container.innerHTML = html;
         }
@@ -333,6 +397,17 @@ async function viewData() {
     }
 }
 
+function changeDataPage(direction) {
+    viewState.offset = Math.max(0, viewState.offset + direction * PREVIEW_PAGE_SIZE);
+    loadDataPage();
+}
+
+function setViewFilter(key, value) {
+    viewState[key] = value;
+    viewState.offset = 0;
+    loadDataPage();
+}
+
 function closeResults() {
     const container = document.getElementById('dataPreview');
     // Restore the empty state HTML immediately
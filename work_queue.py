@@ -0,0 +1,294 @@
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from datetime import datetime
+
+QUEUE_PATH = "work_queue.db"
+LEASE_SECONDS = 120   # A unit goes back to the queue when its worker has been silent this long
+MAX_ATTEMPTS = 3      # Leases per unit before it is marked failed
+WORKER_SEEN = 30      # Seconds since the last heartbeat for a worker to count as alive
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """Units of distributed runs, leased to worker processes through one SQLite file.
+
+    A unit is one (city, category, area) of a run with the config to scrape it.
+    Workers lease a unit, heartbeat to keep the lease, and push each result
+    (a company row, or a card that yielded none) as they go, so the results
+    table doubles as a journal the coordinator replays. A lease that is not
+    renewed within lease_seconds is re-issued, and the next worker resumes
+    from the results already pushed.
+    """
+
+    def __init__(self, path=QUEUE_PATH, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS units (
+                run_id TEXT,
+                unit_id TEXT,
+                params TEXT,
+                status TEXT,
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER DEFAULT 0,
+                stop_requested INTEGER DEFAULT 0,
+                processed INTEGER DEFAULT 0,
+                total INTEGER DEFAULT 0,
+                error TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (run_id, unit_id)
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT,
+                unit_id TEXT,
+                card INTEGER,
+                row TEXT,
+                place_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id, seq);
+            CREATE TABLE IF NOT EXISTS metrics (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT,
+                unit_id TEXT,
+                data TEXT
+            );
+            CREATE TABLE IF NOT EXISTS workers (
+                worker TEXT PRIMARY KEY,
+                run_id TEXT,
+                unit_id TEXT,
+                last_seen REAL
+            );
+        """)
+        # Queue files created before results carried a place ID
+        if "place_id" not in {r["name"] for r in self._conn.execute("PRAGMA table_info(results)")}:
+            self._conn.execute("ALTER TABLE results ADD COLUMN place_id TEXT")
+
+    # --- coordinator side ---
+
+    def add_units(self, run_id, units):
+        """Queue (unit_id, params) pairs for a run, replacing any left from an earlier attempt at it."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM units WHERE run_id = ?", (run_id,))
+            self._conn.execute("DELETE FROM results WHERE run_id = ?", (run_id,))
+            self._conn.execute("DELETE FROM metrics WHERE run_id = ?", (run_id,))
+            self._conn.executemany(
+                "INSERT INTO units (run_id, unit_id, params, status, updated_at) VALUES (?, ?, ?, 'queued', ?)",
+                [(run_id, unit_id, json.dumps(params), _now()) for unit_id, params in units]
+            )
+            self._conn.execute("COMMIT")
+
+    def results_since(self, run_id, seq=0):
+        """(seq, unit_id, card, row or None, place_id or None) pushed for a run after seq."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, unit_id, card, row, place_id FROM results WHERE run_id = ? AND seq > ? ORDER BY seq", (run_id, seq)
+            ).fetchall()
+        return [(r["seq"], r["unit_id"], r["card"], json.loads(r["row"]) if r["row"] else None, r["place_id"]) for r in rows]
+
+    def metrics_since(self, run_id, seq=0):
+        """(seq, unit_id, exported RunMetrics) pushed for a run after seq."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, unit_id, data FROM metrics WHERE run_id = ? AND seq > ? ORDER BY seq", (run_id, seq)
+            ).fetchall()
+        return [(r["seq"], r["unit_id"], json.loads(r["data"])) for r in rows]
+
+    def abandon(self, run_id, status="failed", error=None):
+        """Close every queued or leased unit of a run, e.g. when no worker is left to take them; returns how many."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET status = ?, error = ?, worker = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE run_id = ? AND status IN ('queued', 'leased')",
+                (status, error, _now(), run_id)
+            )
+        return cursor.rowcount
+
+    def reissue_expired(self, run_id=None):
+        """Put units whose worker stopped heartbeating back in the queue (or fail them); returns how many."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            count = self._reissue_expired(run_id)
+            self._conn.execute("COMMIT")
+        return count
+
+    def request_stop(self, run_id):
+        """Cancel a run: queued units are dropped, leased ones stop at their worker's next heartbeat."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET status = 'cancelled', updated_at = ? WHERE run_id = ? AND status = 'queued'", (_now(), run_id)
+            )
+            self._conn.execute("UPDATE units SET stop_requested = 1 WHERE run_id = ? AND status = 'leased'", (run_id,))
+
+    def units(self, run_id):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT unit_id, status, worker, attempts, processed, total, error, updated_at FROM units "
+                "WHERE run_id = ? ORDER BY rowid", (run_id,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def workers(self, run_id=None):
+        """Workers heard from in the last WORKER_SEEN seconds."""
+        query = "SELECT worker, run_id, unit_id, last_seen FROM workers WHERE last_seen > ?"
+        args = [time.time() - WORKER_SEEN]
+        if run_id:
+            query += " AND run_id = ?"
+            args.append(run_id)
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [dict(r, last_seen=round(time.time() - r["last_seen"], 1)) for r in rows]
+
+    def pending(self, run_id):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM units WHERE run_id = ? AND status IN ('queued', 'leased')", (run_id,)
+            ).fetchone()[0]
+
+    # --- worker side ---
+
+    def lease(self, worker, run_id=None):
+        """Next queued unit for this worker (of run_id, or of any run), or None."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reissue_expired(run_id)
+                query = "SELECT run_id, unit_id, params, attempts FROM units WHERE status = 'queued'"
+                args = []
+                if run_id:
+                    query += " AND run_id = ?"
+                    args.append(run_id)
+                row = self._conn.execute(query + " ORDER BY rowid LIMIT 1", args).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE units SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                    "updated_at = ? WHERE run_id = ? AND unit_id = ?",
+                    (worker, now + self.lease_seconds, _now(), row["run_id"], row["unit_id"])
+                )
+                self._seen(worker, row["run_id"], row["unit_id"], now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return {
+            "run_id": row["run_id"],
+            "unit_id": row["unit_id"],
+            "params": json.loads(row["params"]),
+            "attempt": row["attempts"] + 1,
+        }
+
+    def heartbeat(self, unit, worker, processed=None, total=None):
+        """Renew the lease; False when it was lost (re-issued) or the run is being stopped."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET lease_expires = ?, processed = COALESCE(?, processed), total = COALESCE(?, total), "
+                "updated_at = ? WHERE run_id = ? AND unit_id = ? AND worker = ? AND status = 'leased' AND stop_requested = 0",
+                (now + self.lease_seconds, processed, total, _now(), unit["run_id"], unit["unit_id"], worker)
+            )
+            self._seen(worker, unit["run_id"], unit["unit_id"], now)
+        return cursor.rowcount == 1
+
+    def push(self, unit, worker, card, row=None, place_id=None):
+        """Record a finished card (with its company row, if any); ignored once the lease is lost."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO results (run_id, unit_id, card, row, place_id) SELECT ?, ?, ?, ?, ? WHERE EXISTS "
+                "(SELECT 1 FROM units WHERE run_id = ? AND unit_id = ? AND worker = ? AND status = 'leased')",
+                (unit["run_id"], unit["unit_id"], card, json.dumps(row) if row is not None else None, place_id,
+                 unit["run_id"], unit["unit_id"], worker)
+            )
+
+    def push_metrics(self, unit, worker, data):
+        """Timings and event counters of one lease (RunMetrics.export()), for the coordinator to merge."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO metrics (run_id, unit_id, data) SELECT ?, ?, ? WHERE EXISTS "
+                "(SELECT 1 FROM units WHERE run_id = ? AND unit_id = ? AND worker = ? AND status = 'leased')",
+                (unit["run_id"], unit["unit_id"], json.dumps(data), unit["run_id"], unit["unit_id"], worker)
+            )
+
+    def pushed(self, unit):
+        """Resume state from earlier leases of this unit: {"companies": [...], "done_cards": set()}."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT card, row FROM results WHERE run_id = ? AND unit_id = ? ORDER BY seq", (unit["run_id"], unit["unit_id"])
+            ).fetchall()
+        return {
+            "companies": [json.loads(r["row"]) for r in rows if r["row"]],
+            "done_cards": {r["card"] for r in rows},
+        }
+
+    def finish(self, unit, worker, status="done", error=None):
+        """Close a lease as done, stopped (partial, left for a resume) or failed (retried up to max_attempts)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT attempts, stop_requested FROM units WHERE run_id = ? AND unit_id = ? AND worker = ? AND status = 'leased'",
+                (unit["run_id"], unit["unit_id"], worker)
+            ).fetchone()
+            if row is not None:
+                if status == "failed" and row["attempts"] < self.max_attempts and not row["stop_requested"]:
+                    status = "queued"
+                self._conn.execute(
+                    "UPDATE units SET status = ?, error = ?, lease_expires = NULL, updated_at = ? WHERE run_id = ? AND unit_id = ?",
+                    (status, error, _now(), unit["run_id"], unit["unit_id"])
+                )
+            self._conn.execute("UPDATE workers SET unit_id = NULL WHERE worker = ?", (worker,))
+            self._conn.execute("COMMIT")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- internals (caller holds the lock and a write transaction where needed) ---
+
+    def _reissue_expired(self, run_id=None):
+        query = "SELECT run_id, unit_id, attempts, stop_requested FROM units WHERE status = 'leased' AND lease_expires < ?"
+        args = [time.time()]
+        if run_id:
+            query += " AND run_id = ?"
+            args.append(run_id)
+        expired = self._conn.execute(query, args).fetchall()
+        for row in expired:
+            if row["stop_requested"]:
+                status, error = "stopped", None
+            elif row["attempts"] >= self.max_attempts:
+                status, error = "failed", "lease expired too often"
+            else:
+                status, error = "queued", None
+            self._conn.execute(
+                "UPDATE units SET status = ?, error = ?, worker = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE run_id = ? AND unit_id = ?",
+                (status, error, _now(), row["run_id"], row["unit_id"])
+            )
+        return len(expired)
+
+    def _seen(self, worker, run_id, unit_id, now):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO workers (worker, run_id, unit_id, last_seen) VALUES (?, ?, ?, ?)",
+            (worker, run_id, unit_id, now)
+        )
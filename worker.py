@@ -0,0 +1,158 @@
+"""Worker process for distributed runs: leases area units from the work queue and scrapes them.
+
+    python worker.py                                   # drain every queued unit in work_queue.db, then exit
+    python worker.py --queue /mnt/share/work_queue.db --run-id <run_id>
+    python worker.py --wait                            # keep polling for new runs
+
+run_scraper(..., worker_processes=N) starts N of these itself; more can be
+started by hand on this or another machine that sees the same queue file.
+"""
+import time
+import logging
+import argparse
+import threading
+
+from cancellation import CancelToken
+from work_queue import WorkQueue, QUEUE_PATH, LEASE_SECONDS, worker_name
+
+log = logging.getLogger("worker")
+
+POLL_SECONDS = 2.0
+
+
+class UnitJournal:
+    """Journal stand-in for scrape_single_area that pushes each result to the work queue."""
+
+    def __init__(self, queue, unit, worker):
+        self.run_id = unit["run_id"]
+        self.queue = queue
+        self.unit = unit
+        self.worker = worker
+        self.completed = False
+
+    def record_company(self, area, card_index, company, place_id=None):
+        self.queue.push(self.unit, self.worker, card_index, company, place_id)
+
+    def record_card(self, area, card_index):
+        self.queue.push(self.unit, self.worker, card_index)
+
+    def complete_area(self, area):
+        self.completed = True
+
+    def record_metrics(self, exported):
+        self.queue.push_metrics(self.unit, self.worker, exported)
+
+
+def scrape_unit(unit, journal, progress_callback, cancel_token):
+    """Scrape one area unit; True if the area finished (False: stopped early, left for a resume)."""
+    # selenium & co. load with the first unit
+    import scraper
+    from geo_tiles import Tile
+    from claims import ClaimRegistry
+    from company_store import CompanyStore
+    import metrics as run_metrics
+
+    params = unit["params"]
+    config = params["config"]
+    scraper.CONFIG.update(config)
+    scraper.set_proxy(config.get("PROXY"))
+
+    # Companies from the journal of an interrupted run, then from earlier leases of this unit
+    earlier = params.get("resume") or {"companies": [], "done_cards": []}
+    companies = earlier["companies"] + unit["resume"]["companies"]
+    done_cards = set(earlier["done_cards"]) | unit["resume"]["done_cards"]
+    resume_state = {"companies": companies, "done_cards": done_cards} if companies or done_cards else None
+
+    store = CompanyStore()
+    claims = ClaimRegistry(run_id=unit["run_id"], path=params["claims_db"])
+    metrics = run_metrics.start_run(f"{unit['run_id']}:{unit['unit_id']}")
+    try:
+        scraper.scrape_single_area(
+            params["area"], params["target"], config, progress_callback, journal, resume_state,
+            store, None, cancel_token, metrics, claims, Tile(*params["tile"]) if params.get("tile") else None
+        )
+        log.info(f"⏱️ {unit['unit_id']} timings\n{metrics.format_summary()}")
+    finally:
+        # Merged into the coordinator's run metrics, also for a stopped or failed lease
+        journal.record_metrics(metrics.export())
+        store.close()
+        claims.close()
+    return journal.completed
+
+
+class Worker:
+    """Leases units until the queue is drained, keeping each lease alive from a heartbeat thread."""
+
+    def __init__(self, queue, run_id=None, runner=scrape_unit, name=None, poll=POLL_SECONDS):
+        # runner(unit, journal, progress_callback, cancel_token) -> True if the unit finished
+        self.queue = queue
+        self.run_id = run_id
+        self.runner = runner
+        self.name = name or worker_name()
+        self.poll = poll
+
+    def run(self, wait=False):
+        done = 0
+        while True:
+            unit = self.queue.lease(self.name, self.run_id)
+            if unit is None:
+                if not wait:
+                    return done
+                time.sleep(self.poll)
+                continue
+            self.process(unit)
+            done += 1
+
+    def process(self, unit):
+        log.info(f"📦 {self.name}: {unit['unit_id']} of run {unit['run_id']} (attempt {unit['attempt']})")
+        unit["resume"] = self.queue.pushed(unit)
+        token = CancelToken()
+        progress = {}
+        stop = threading.Event()
+
+        def progress_callback(update):
+            if "processed" in update:
+                progress["processed"] = update["processed"]
+            if "total" in update:
+                progress["total"] = update["total"]
+
+        def heartbeat():
+            while not stop.wait(self.queue.lease_seconds / 4):
+                if not self.queue.heartbeat(unit, self.name, progress.get("processed"), progress.get("total")):
+                    log.warning(f"🛑 {self.name}: lease on {unit['unit_id']} lost or run stopped")
+                    token.cancel("lease lost")
+                    return
+
+        threading.Thread(target=heartbeat, name="lease-heartbeat", daemon=True).start()
+        journal = UnitJournal(self.queue, unit, self.name)
+        try:
+            finished = self.runner(unit, journal, progress_callback, token)
+            self.queue.heartbeat(unit, self.name, progress.get("processed"), progress.get("total"))
+            self.queue.finish(unit, self.name, "done" if finished else "stopped")
+        except Exception as e:
+            log.exception(f"❌ {self.name}: {unit['unit_id']} failed")
+            self.queue.finish(unit, self.name, "failed", error=str(e)[:500])
+        finally:
+            stop.set()
+
+
+def main():
+    from scraper_logging import setup_logging
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--queue", default=QUEUE_PATH, help="Work queue SQLite file shared with the coordinator")
+    parser.add_argument("--run-id", help="Only take units of this run")
+    parser.add_argument("--lease-seconds", type=float, default=LEASE_SECONDS, help="Lease length; heartbeats renew it every quarter")
+    parser.add_argument("--wait", action="store_true", help="Keep polling when the queue is empty")
+    args = parser.parse_args()
+
+    setup_logging()
+    queue = WorkQueue(args.queue, lease_seconds=args.lease_seconds)
+    worker = Worker(queue, run_id=args.run_id)
+    log.info(f"👷 Worker {worker.name} on {args.queue}")
+    done = worker.run(wait=args.wait)
+    log.info(f"👷 Worker {worker.name} done: {done} unit(s)")
+    queue.close()
+
+
+if __name__ == "__main__":
+    main()